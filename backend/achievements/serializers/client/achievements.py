@@ -2,7 +2,7 @@ from rest_framework import serializers
 from achievements.models import Achievement, UserClaimedAchievement
 from gameinfo.models import UserGameInfos
 from streaks.utils import compute_current_streak
-from courses.models import UserTest, Test
+from courses.models import UserTestProgress, Test
 
 class ClientAchievementSerializer(serializers.ModelSerializer):
     # Per-user computed fields (read-only)
@@ -61,6 +61,16 @@ class ClientAchievementSerializer(serializers.ModelSerializer):
         self._cached_current_streak = int(streak or 0)
         return self._cached_current_streak
 
+    def _get_attempted_test_ids(self) -> set[int]:
+        if hasattr(self, "_cached_attempted_test_ids"):
+            return self._cached_attempted_test_ids
+        user = self._get_user()
+        ids: set[int] = set()
+        if user and user.is_authenticated:
+            ids = set(UserTestProgress.objects.filter(user=user).values_list("test_id", flat=True))
+        self._cached_attempted_test_ids = ids
+        return self._cached_attempted_test_ids
+
     def get_current_progress_xp(self, obj: Achievement) -> int:
         return self._get_user_xp()
 
@@ -79,11 +89,11 @@ class ClientAchievementSerializer(serializers.ModelSerializer):
         Targets semantics: AND over the provided (non-null) targets.
         - XP target: user's total xp >= target_xp_value
         - Streak target: user's current streak >= target_streak_value
-        - Completed test target: best-effort check using UserTest by test_id.
+        - Completed test target: best-effort check using UserTestProgress by test_id.
           Note: Achievement.target_completed_test_id is a placeholder pointing to a
           future 'completed test result' model. Until that exists, treat the value
-          as a courses.Test id and consider claimable if the user has any UserTest
-          row for that test.
+          as a courses.Test id and consider claimable if the user has a progress
+          row (i.e. at least one attempt) for that test.
         """
         user = self._get_user()
         if not (user and user.is_authenticated):
@@ -104,8 +114,7 @@ class ClientAchievementSerializer(serializers.ModelSerializer):
 
         if obj.target_completed_test_id is not None:
             # Best-effort: interpret as courses.Test id
-            has_completed = UserTest.objects.filter(user=user, test_id=obj.target_completed_test_id).exists()
-            if not has_completed:
+            if int(obj.target_completed_test_id) not in self._get_attempted_test_ids():
                 return False
 
         return True
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from achievements.models import Achievement
+from gameinfo.models import UserGameInfos
+
+URL = "/api/client/achievements/"
+
+
+class ClientAchievementListTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="u", email="u@example.com", password="p")
+        self.gameinfo = UserGameInfos.objects.create(user=self.user)
+        Achievement.objects.create(target_xp_value=500, reward_type=Achievement.RewardType.XP, reward_amount=10)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_revalidation_reflects_new_progress(self):
+        first = self.client.get(URL)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual((first.data[0]["current_progress_xp"], first.data[0]["claimable"]), (0, False))
+
+        self.gameinfo.add_xp(500)
+        # Per-user fields: even a client replaying an old validator must get the fresh body
+        again = self.client.get(URL, HTTP_IF_NONE_MATCH=first.get("ETag", '"stale"'))
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual((again.data[0]["current_progress_xp"], again.data[0]["claimable"]), (500, True))
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from achievements.models import UserClaimedAchievement
 from achievements.serializers.admin import AdminUserClaimedAchievementSerializer
 from users.permissions import IsAdminRole
@@ -12,6 +13,8 @@ class AdminListUserClaimedAchievementsView(generics.ListCreateAPIView):
     )
     serializer_class = AdminUserClaimedAchievementSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_claimed_achievement_id"
 
 
 class AdminManageUserClaimedAchievementView(generics.RetrieveDestroyAPIView):
@@ -2,7 +2,10 @@ from rest_framework import generics, permissions
 from achievements.models import Achievement
 from achievements.serializers.client.achievements import ClientAchievementSerializer
 
+
 class ClientListAchievementsView(generics.ListAPIView):
+    # No ConditionalGetMixin: progress, claimed and claimable are per user (XP, streak, claims, attempts),
+    # so a catalog-only ETag would answer 304 over stale progress
     queryset = Achievement.objects.all().order_by("-achievement_id")
     serializer_class = ClientAchievementSerializer
     permission_classes = [permissions.IsAuthenticated]
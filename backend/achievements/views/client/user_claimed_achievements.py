@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions, status
+from common.pagination import KeysetCursorPagination
 from rest_framework.response import Response
 from django.db import IntegrityError
 from achievements.models import UserClaimedAchievement
@@ -11,6 +12,8 @@ from achievements.serializers.client import ClientUserClaimedAchievementSerializ
 class ClientListUserClaimedAchievementsView(generics.ListAPIView):
     serializer_class = ClientUserClaimedAchievementSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_claimed_achievement_id"
 
     def get_queryset(self):
         return (
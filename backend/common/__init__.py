@@ -9,10 +9,13 @@ from .constants import (
 from .utils import (
 	user_has_active_premium,
 	get_user_active_subscription,
+	get_regen_interval_for_subscription,
 	get_regen_interval_for_user,
 	get_streak_saver_limit_for_user,
+	get_xp_boost_multiplier_for_subscription,
 	get_xp_boost_multiplier_for_user,
 )
+from .query_budget import QueryBudget
 
 __all__ = [
 	"ENERGY_REGEN_INTERVAL_FREE",
@@ -23,7 +26,10 @@ __all__ = [
 	"STREAK_SAVER_LIMIT_YEARLY",
 	"user_has_active_premium",
 	"get_user_active_subscription",
+	"get_regen_interval_for_subscription",
 	"get_regen_interval_for_user",
 	"get_streak_saver_limit_for_user",
+	"get_xp_boost_multiplier_for_subscription",
 	"get_xp_boost_multiplier_for_user",
+	"QueryBudget",
 ]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from django.http import Http404
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+SAFE_CONDITIONAL_METHODS = ("GET", "HEAD")
+
+
+class Validators(NamedTuple):
+    """What a version provider returns: an opaque version token and, if known, when it last changed."""
+
+    version: str
+    last_modified: Optional[datetime] = None
+
+
+class _NotModified(Exception):
+    pass
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Weak comparison (RFC 9110 If-None-Match): compressed responses carry a W/ prefixed tag."""
+    if if_none_match is None:
+        return False
+    etags = parse_etags(if_none_match)
+    return "*" in etags or _opaque_tag(etag) in {_opaque_tag(tag) for tag in etags}
+
+
+class ConditionalGetMixin:
+    """Strong ETag / Last-Modified for read-only DRF views, answered before any queryset work.
+
+    Views set ``version_provider`` to a callable taking the view and returning ``Validators``
+    (one cheap lookup such as a content version counter). The check runs in ``initial()``,
+    after authentication and permission checks, so a matching ``If-None-Match`` (or, without
+    one, ``If-Modified-Since``) gets an empty 304 without touching the queryset or serializer.
+
+    The ETag covers the path and query string (``?fields=``, filters, cursors), so every
+    distinct response gets its own tag. The validators are global, so detail views (those
+    called with their lookup URL kwarg) confirm the object exists in ``get_queryset()`` with one
+    EXISTS query before answering 304; a missing or hidden object is a 404 as without the
+    conditional headers.
+    """
+
+    version_provider = None
+
+    def get_validators(self) -> Validators | None:
+        if self.version_provider is None:
+            return None
+        # Stored as a plain function on the class; call it unbound
+        return type(self).version_provider(self)
+
+    def _etag_for(self, request, version: str) -> str:
+        digest = hashlib.sha1(request.get_full_path().encode()).hexdigest()[:16]
+        return f'"{version}-{digest}"'
+
+    def _conditional_headers(self) -> dict[str, str]:
+        validators = getattr(self, "_validators", None)
+        if validators is None:
+            return {}
+        headers = {
+            "ETag": self._etag_for(self.request, validators.version),
+            # Clients may store the response but must revalidate before reuse
+            "Cache-Control": "private, no-cache",
+        }
+        if validators.last_modified is not None:
+            headers["Last-Modified"] = http_date(validators.last_modified.timestamp())
+        return headers
+
+    def _is_not_modified(self, request) -> bool:
+        headers = self._conditional_headers()
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag_matches(headers["ETag"], if_none_match)
+        if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        last_modified = self._validators.last_modified
+        return (
+            if_modified_since is not None
+            and last_modified is not None
+            and int(last_modified.timestamp()) <= if_modified_since
+        )
+
+    def check_object_exists(self) -> None:
+        """Raise Http404 when a detail view's object is not in its queryset."""
+        lookup_url_kwarg = getattr(self, "lookup_url_kwarg", None) or getattr(self, "lookup_field", None)
+        if lookup_url_kwarg is None or lookup_url_kwarg not in self.kwargs:
+            return
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).exists():
+            raise Http404
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._validators = None
+        if request.method not in SAFE_CONDITIONAL_METHODS:
+            return
+        self._validators = self.get_validators()
+        if self._validators is not None and self._is_not_modified(request):
+            self.check_object_exists()
+            raise _NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=self._conditional_headers())
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in self._conditional_headers().items():
+                response.setdefault(header, value)
+        return response
+
+
+__all__ = ["ConditionalGetMixin", "Validators", "etag_matches"]
@@ -23,6 +23,13 @@ XP_AWARD_PER_PRACTICE = 5
 ENERGY_COST_PER_TEST = 5
 ENERGY_COST_PER_PRACTICE = 2
 
+# Offline batch submissions: max attempts per request and how old a client timestamp may be
+BATCH_SUBMISSION_MAX_ATTEMPTS = 50
+BATCH_SUBMISSION_MAX_AGE = timedelta(days=7)
+
+# Steady-state SQL statements allowed for one test submission (see submit_user_test)
+SUBMISSION_QUERY_BUDGET = 10
+
 __all__ = [
     "ENERGY_REGEN_INTERVAL_FREE",
     "MONTHLY_REGEN_BOOST",
@@ -36,4 +43,7 @@ __all__ = [
     "XP_AWARD_PER_PRACTICE",
     "ENERGY_COST_PER_TEST",
     "ENERGY_COST_PER_PRACTICE",
+    "BATCH_SUBMISSION_MAX_ATTEMPTS",
+    "BATCH_SUBMISSION_MAX_AGE",
+    "SUBMISSION_QUERY_BUDGET",
 ]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import re
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+_ACCEPT_ENCODING_TOKEN = re.compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?")
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/vnd.oai.openapi")
+
+
+def _accepted_encodings(header: str) -> dict[str, float]:
+    """``Accept-Encoding`` as ``{coding: q}``; codings with q=0 are refused."""
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        match = _ACCEPT_ENCODING_TOKEN.match(part)
+        if not match or not match.group(1):
+            continue
+        try:
+            q = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+        accepted[match.group(1).lower()] = q
+    return accepted
+
+
+def negotiate_encoding(header: str, supported) -> str | None:
+    """Pick the first of ``supported`` (server preference order) the client accepts."""
+    accepted = _accepted_encodings(header)
+    wildcard = accepted.get("*", 0.0)
+    for coding in supported:
+        if accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+def _compress(content: bytes, coding: str) -> bytes:
+    if coding == "br":
+        return brotli.compress(content, quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY)
+    # Django's helper adds random padding to the gzip header (BREACH mitigation, as GZipMiddleware does)
+    return compress_string(content, max_random_bytes=100)
+
+
+class CompressionMiddleware:
+    """gzip/brotli for non-streaming responses above RESPONSE_COMPRESSION_MIN_SIZE bytes.
+
+    Codings are offered in RESPONSE_COMPRESSION_ENCODINGS order; "br" is skipped when the brotli
+    package is not installed. Like Django's GZipMiddleware, strong ETags become weak because
+    the bytes differ per encoding (ConditionalGetMixin compares weakly).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @staticmethod
+    def supported_encodings() -> list[str]:
+        return [
+            coding
+            for coding in settings.RESPONSE_COMPRESSION_ENCODINGS
+            if coding == "gzip" or (coding == "br" and brotli is not None)
+        ]
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        content_type = response.get("Content-Type", "")
+        if not content_type.startswith(_COMPRESSIBLE_TYPES):
+            return response
+
+        # Vary even when this response stays uncompressed, so shared caches key on the header
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if len(response.content) < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+            return response
+
+        coding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""), self.supported_encodings())
+        if coding is None:
+            return response
+        compressed = _compress(response.content, coding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = coding
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
+
+
+__all__ = ["CompressionMiddleware", "negotiate_encoding"]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Opaque-cursor pagination that seeks on the view's ``cursor_ordering`` (a unique key).
+
+    Opt in per view with ``pagination_class = KeysetCursorPagination``. While
+    PAGINATION_LEGACY_UNPAGINATED is on, a request is only paginated when it sends ``cursor``
+    or ``page_size`` (or the view's ``requires_pagination()`` says so), and otherwise gets the
+    plain list existing clients expect.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = "-pk"
+
+    def is_requested(self, request, view) -> bool:
+        if not getattr(settings, "PAGINATION_LEGACY_UNPAGINATED", True):
+            return True
+        params = request.query_params
+        if self.cursor_query_param in params or self.page_size_query_param in params:
+            return True
+        requires = getattr(view, "requires_pagination", None)
+        return bool(requires and requires())
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request, view):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+
+
+__all__ = ["KeysetCursorPagination"]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import logging
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# Transaction bookkeeping emitted by atomic()/get_or_create(); not counted against a budget
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryBudget:
+    """Count the SQL statements run inside a block and log overruns.
+
+    Usage::
+
+        with QueryBudget(10, "submit_user_test") as budget:
+            ...
+            if created:
+                budget.extend(1)  # first-time insert path
+
+    Going over the limit only logs a warning with the statements that ran; it never raises,
+    so a miscounted path cannot roll back the caller's transaction. The exact counts are
+    pinned by tests (courses/tests/test_submission_queries.py).
+    """
+
+    def __init__(self, limit: int, label: str):
+        self.limit = limit
+        self.label = label
+        self.count = 0
+        self.statements: list[str] = []
+        self._wrapper_cm = None
+
+    def extend(self, extra: int) -> None:
+        """Allow ``extra`` more statements for a documented, conditional code path."""
+        self.limit += extra
+
+    def _wrapper(self, execute, sql, params, many, context):
+        if not str(sql).lstrip().upper().startswith(_IGNORED_PREFIXES):
+            self.count += 1
+            self.statements.append(str(sql))
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> "QueryBudget":
+        self._wrapper_cm = connection.execute_wrapper(self._wrapper)
+        self._wrapper_cm.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._wrapper_cm.__exit__(exc_type, exc, tb)
+        if exc_type is not None or self.count <= self.limit:
+            return False
+        logger.warning(
+            "%s ran %d queries (budget %d):\n%s", self.label, self.count, self.limit, "\n".join(self.statements)
+        )
+        return False
+
+
+__all__ = ["QueryBudget"]
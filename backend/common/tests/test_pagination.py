@@ -0,0 +1,75 @@
+from urllib.parse import parse_qs, urlparse
+
+from django.test import override_settings
+
+from courses.models import UserTest, UserTestAnswer
+from courses.tests.utils import CourseContentTestCase
+
+
+class KeysetCursorPaginationTests(CourseContentTestCase):
+    url = "/api/client/user-tests/"
+
+    def setUp(self):
+        super().setUp()
+        self.attempt_ids = [
+            UserTest.objects.create(user=self.user, test=self.test1, time_spent=index).user_test_id for index in range(5)
+        ]
+        UserTest.objects.create(user=self.admin, test=self.test1, time_spent=1)
+        self.newest_first = list(reversed(self.attempt_ids))
+
+    def cursor_of(self, link):
+        return parse_qs(urlparse(link).query)["cursor"][0] if link else None
+
+    def walk(self, **params):
+        """Follow ``next`` links from the first page; returns the ids seen per page."""
+        pages, cursor = [], None
+        while True:
+            response = self.client.get(self.url, {**params, **({"cursor": cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            pages.append([row["user_test_id"] for row in response.data["results"]])
+            cursor = self.cursor_of(response.data["next"])
+            if cursor is None:
+                return pages
+
+    def test_legacy_mode_serves_a_plain_list_unless_asked(self):
+        response = self.client.get(self.url)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual([row["user_test_id"] for row in response.data], self.newest_first)
+
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(set(response.data), {"next", "previous", "results"})
+        self.assertIsNone(response.data["previous"])
+
+    @override_settings(PAGINATION_LEGACY_UNPAGINATED=False)
+    def test_always_paginated_when_legacy_mode_is_off(self):
+        response = self.client.get(self.url)
+        self.assertEqual(set(response.data), {"next", "previous", "results"})
+        self.assertEqual([row["user_test_id"] for row in response.data["results"]], self.newest_first)
+        self.assertIsNone(response.data["next"])
+
+    def test_cursor_round_trip(self):
+        for legacy in (True, False):
+            with self.subTest(legacy=legacy), override_settings(PAGINATION_LEGACY_UNPAGINATED=legacy):
+                pages = self.walk(page_size=2)
+                self.assertEqual(pages, [self.newest_first[:2], self.newest_first[2:4], self.newest_first[4:]])
+
+        first = self.client.get(self.url, {"page_size": 2})
+        second = self.client.get(self.url, {"page_size": 2, "cursor": self.cursor_of(first.data["next"])})
+        back = self.client.get(self.url, {"page_size": 2, "cursor": self.cursor_of(second.data["previous"])})
+        self.assertEqual(back.data["results"], first.data["results"])
+
+        # Rows inserted ahead of the cursor do not shift the following pages
+        UserTest.objects.create(user=self.user, test=self.test2, time_spent=9)
+        again = self.client.get(self.url, {"page_size": 2, "cursor": self.cursor_of(first.data["next"])})
+        self.assertEqual(again.data["results"], second.data["results"])
+
+        self.assertEqual(self.client.get(self.url, {"cursor": "garbage"}).status_code, 404)
+
+    def test_view_can_require_pagination(self):
+        attempt = UserTest.objects.get(pk=self.attempt_ids[0])
+        UserTestAnswer.objects.create(
+            user_test=attempt, attempt_date=attempt.attempt_date, given_answer_text="x", is_correct=False
+        )
+        url = "/api/admin/user-test-answers/"
+        self.assertEqual(set(self.admin_client.get(url).data), {"next", "previous", "results"})
+        self.assertIsInstance(self.admin_client.get(url, {"user_test_id": attempt.user_test_id}).data, list)
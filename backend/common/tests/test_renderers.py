@@ -0,0 +1,36 @@
+import datetime
+import decimal
+from unittest import skipIf
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from common import renderers
+from common.renderers import FastJSONRenderer
+
+
+@skipIf(renderers.orjson is None, "orjson is not installed")
+@override_settings(JSON_RENDERER_BACKEND="orjson")
+class FastJSONRendererTests(SimpleTestCase):
+    def assert_matches_drf(self, data):
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_escapes_js_line_separators(self):
+        data = {"text": "line\u2028next\u2029para", "\u2028key": ["\u2029"]}
+        rendered = FastJSONRenderer().render(data)
+        self.assertNotIn("\u2028".encode(), rendered)
+        self.assertNotIn("\u2029".encode(), rendered)
+        self.assertIn(b"line\\u2028next\\u2029para", rendered)
+        self.assert_matches_drf(data)
+
+    def test_matches_drf_output(self):
+        self.assert_matches_drf(
+            {
+                "id": 1,
+                "title": "Café é \U0001f600 \"quoted\" \\ \n",
+                "score": decimal.Decimal("1.50"),
+                "when": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+                "day": datetime.date(2024, 5, 1),
+                "items": [None, True, 1.5],
+            }
+        )
@@ -28,13 +28,9 @@ def get_user_active_subscription(user) -> PremiumSubscription | None:
     )
 
 
-def get_regen_interval_for_user(user) -> timedelta:
-    """Return energy regen interval for the user considering premium plan boosts.
-
-    Lower interval == faster regen. Boost reduces the free interval accordingly.
-    """
+def get_regen_interval_for_subscription(sub: PremiumSubscription | None) -> timedelta:
+    """Energy regen interval for an (optional) active subscription."""
     base = ENERGY_REGEN_INTERVAL_FREE
-    sub = get_user_active_subscription(user)
     if not sub:
         return base
     if sub.type == PremiumSubscription.SubscriptionType.MONTH:
@@ -44,6 +40,14 @@ def get_regen_interval_for_user(user) -> timedelta:
     return base
 
 
+def get_regen_interval_for_user(user) -> timedelta:
+    """Return energy regen interval for the user considering premium plan boosts.
+
+    Lower interval == faster regen. Boost reduces the free interval accordingly.
+    """
+    return get_regen_interval_for_subscription(get_user_active_subscription(user))
+
+
 def get_streak_saver_limit_for_user(user) -> int:
     sub = get_user_active_subscription(user)
     if not sub:
@@ -55,12 +59,8 @@ def get_streak_saver_limit_for_user(user) -> int:
     return 0
 
 
-def get_xp_boost_multiplier_for_user(user) -> float:
-    """Return a multiplier >= 1.0 to apply to base XP earnings.
-
-    Monthly: +20% => 1.2x, Yearly: +25% => 1.25x, Non-premium: 1.0x.
-    """
-    sub = get_user_active_subscription(user)
+def get_xp_boost_multiplier_for_subscription(sub: PremiumSubscription | None) -> float:
+    """XP multiplier (>= 1.0) for an (optional) active subscription."""
     if not sub:
         return 1.0
     if sub.type == PremiumSubscription.SubscriptionType.MONTH:
@@ -70,10 +70,20 @@ def get_xp_boost_multiplier_for_user(user) -> float:
     return 1.0
 
 
+def get_xp_boost_multiplier_for_user(user) -> float:
+    """Return a multiplier >= 1.0 to apply to base XP earnings.
+
+    Monthly: +20% => 1.2x, Yearly: +25% => 1.25x, Non-premium: 1.0x.
+    """
+    return get_xp_boost_multiplier_for_subscription(get_user_active_subscription(user))
+
+
 __all__ = [
     "user_has_active_premium",
     "get_user_active_subscription",
+    "get_regen_interval_for_subscription",
     "get_regen_interval_for_user",
     "get_streak_saver_limit_for_user",
+    "get_xp_boost_multiplier_for_subscription",
     "get_xp_boost_multiplier_for_user",
 ]
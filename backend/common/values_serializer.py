@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.response import Response
+
+# Fields whose to_representation returns database values unchanged (ints, strs, bools, choice keys)
+_PASSTHROUGH_FIELDS = (
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.ReadOnlyField,
+)
+
+
+def values_serializers_enabled() -> bool:
+    return getattr(settings, "VALUES_SERIALIZERS_ENABLED", True)
+
+
+class ValuesSerializer:
+    """Build a DRF serializer's output dicts straight from ``.values()`` rows.
+
+    The field map is compiled once from ``serializer_class``: output name, row key and a
+    converter (None for fields that return database values as-is, otherwise the DRF field's
+    own ``to_representation``, e.g. for datetimes). Output matches the serializer for the
+    supported fields; nested serializers and method fields must be excluded and filled in by
+    the caller.
+
+    ``sources`` maps output names to row keys (e.g. ``{"username": "user__username"}``) and
+    ``computed`` lists names the caller adds to each row itself (not selected from the database).
+    """
+
+    def __init__(
+        self,
+        serializer_class: type[serializers.Serializer],
+        *,
+        exclude: Iterable[str] = (),
+        sources: Optional[dict[str, str]] = None,
+        computed: Iterable[str] = (),
+    ):
+        exclude, sources, computed = set(exclude), sources or {}, set(computed)
+        self.field_map: list[tuple[str, str, Optional[Callable]]] = []
+        for name, field in serializer_class().fields.items():
+            if name in exclude:
+                continue
+            if isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField)):
+                raise ImproperlyConfigured(f"{serializer_class.__name__}.{name} cannot be built from values(); exclude it")
+            key = sources.get(name, field.source)
+            if "." in key or key == "*":
+                raise ImproperlyConfigured(f"{serializer_class.__name__}.{name} reads {key!r}; map it with sources=")
+            converter = None if isinstance(field, _PASSTHROUGH_FIELDS) else field.to_representation
+            self.field_map.append((name, key, converter))
+        self.columns = [key for name, key, _ in self.field_map if name not in computed]
+
+    def field_names(self) -> list[str]:
+        return [name for name, _, _ in self.field_map]
+
+    def to_representation(self, row: dict, field_map=None) -> dict:
+        out = {}
+        for name, key, converter in self.field_map if field_map is None else field_map:
+            value = row[key]
+            out[name] = value if converter is None or value is None else converter(value)
+        return out
+
+    def serialize(self, rows: Iterable[dict], fields: Optional[Iterable[str]] = None) -> list[dict]:
+        """Dicts for ``rows``; ``fields`` keeps only those output names (in declaration order)."""
+        field_map = self.field_map
+        if fields is not None:
+            wanted = set(fields)
+            field_map = [entry for entry in field_map if entry[0] in wanted]
+        return [self.to_representation(row, field_map) for row in rows]
+
+
+class ValuesListMixin:
+    """Opt-in fast ``list()`` for ListAPIViews: rows come from ``.values()`` and go through
+    ``values_serializer`` instead of instantiating models and serializer fields.
+
+    Pagination and ``?fields=`` (SparseFieldsMixin serializers) keep working. Views fill in
+    excluded nested fields in ``attach_values(rows, data)``. VALUES_SERIALIZERS_ENABLED = False
+    sends every view back through its regular serializer.
+    """
+
+    values_serializer: Optional[ValuesSerializer] = None
+
+    def selected_value_fields(self) -> Optional[set[str]]:
+        selected = getattr(self.get_serializer_class(), "selected_field_names", None)
+        return selected(self.request) if selected else None
+
+    def attach_values(self, rows: list[dict], data: list[dict]) -> None:
+        """Hook for nested data the values serializer cannot build."""
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer is None or not values_serializers_enabled():
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        queryset = queryset.values(*self.values_serializer.columns)
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+        data = self.values_serializer.serialize(rows, self.selected_value_fields())
+        self.attach_values(rows, data)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+
+__all__ = ["ValuesListMixin", "ValuesSerializer", "values_serializers_enabled"]
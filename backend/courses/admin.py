@@ -8,6 +8,9 @@ from .models import (
     UserCourse,
     UserTest,
     UserTestAnswer,
+    UserTestProgress,
+    QuestionStats,
+    ReviewItem,
 )
 
 
@@ -143,9 +146,44 @@ class UserTestAnswerAdmin(admin.ModelAdmin):
     list_display = (
         "user_test_answer_id",
         "user_test",
+        "question",
+        "choice",
         "is_correct",
     )
     list_filter = ("is_correct", "user_test")
     search_fields = ("user_test_answer_id", "user_test__test__title")
-    autocomplete_fields = ("user_test",)
+    autocomplete_fields = ("user_test", "question", "choice")
     ordering = ("-user_test_answer_id",)
+
+
+@admin.register(UserTestProgress)
+class UserTestProgressAdmin(admin.ModelAdmin):
+    list_display = (
+        "progress_id",
+        "user",
+        "test",
+        "best_score",
+        "attempt_count",
+        "first_passed_at",
+        "last_attempt_at",
+    )
+    list_filter = ("test",)
+    search_fields = ("user__username", "test__title", "progress_id")
+    autocomplete_fields = ("user", "test")
+    ordering = ("-progress_id",)
+
+
+@admin.register(QuestionStats)
+class QuestionStatsAdmin(admin.ModelAdmin):
+    list_display = ("question", "attempts", "correct_count", "updated_at")
+    search_fields = ("question__question_id", "question__text", "question__test__title")
+    autocomplete_fields = ("question",)
+    ordering = ("question_id",)
+
+
+@admin.register(ReviewItem)
+class ReviewItemAdmin(admin.ModelAdmin):
+    list_display = ("review_item_id", "user", "question", "due_at", "interval_days", "repetitions", "lapses")
+    search_fields = ("user__username", "question__text")
+    autocomplete_fields = ("user", "question")
+    ordering = ("due_at",)
@@ -5,3 +5,11 @@ class CoursesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "courses"
     verbose_name = "Courses"
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        # Register content version signal handlers
+        from courses import signals
+
+        post_migrate.connect(signals.fill_user_test_progress, sender=self)
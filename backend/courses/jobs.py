@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import datetime
+from typing import Sequence
+
+from django.contrib.auth import get_user_model
+
+from common.utils import get_regen_interval_for_subscription, get_user_active_subscription
+from courses.services.review_queue import ReviewResult, record_review_results
+from gameinfo.models import UserGameInfos
+from jobs.queue import job
+from streaks.models import DailyStreak
+
+SUBMISSION_SIDE_EFFECTS_JOB = "courses.submission_side_effects"
+
+
+def submission_side_effects_payload(
+    *,
+    user_id: int,
+    streak_dates: list[datetime.date],
+    energy_cost: int,
+    xp_amount: int,
+    review_results: Sequence[ReviewResult] = (),
+) -> dict:
+    return {
+        "user_id": user_id,
+        "streak_dates": [day.isoformat() for day in streak_dates],
+        "energy_cost": energy_cost,
+        "xp_amount": xp_amount,
+        "reviews": [[qid, is_correct, answered_at.isoformat()] for qid, is_correct, answered_at in review_results],
+    }
+
+
+@job(SUBMISSION_SIDE_EFFECTS_JOB)
+def apply_submission_side_effects(payload: dict) -> None:
+    """Mark streak days, settle energy/XP and update the review queue for committed test attempts.
+
+    ``xp_amount`` is already boosted by the submitting request; the regen interval is
+    read from the subscription active when the job runs.
+    """
+    user = get_user_model().objects.filter(pk=payload["user_id"]).first()
+    if user is None:
+        # Account deleted before the job ran; nothing left to update
+        return
+
+    days = [datetime.date.fromisoformat(day) for day in payload.get("streak_dates", [])]
+    if days:
+        DailyStreak.objects.bulk_create(
+            [DailyStreak(user=user, daily_streak_date=day) for day in days],
+            ignore_conflicts=True,
+        )
+
+    gameinfo, _ = UserGameInfos.objects.select_for_update().get_or_create(user=user)
+    gameinfo.settle_attempts(
+        energy_cost=int(payload.get("energy_cost", 0)),
+        xp_amount=int(payload.get("xp_amount", 0)),
+        regen_interval=get_regen_interval_for_subscription(get_user_active_subscription(user)),
+    )
+
+    reviews = payload.get("reviews", [])
+    record_review_results(
+        user.pk,
+        [(qid, bool(is_correct), datetime.datetime.fromisoformat(at)) for qid, is_correct, at in reviews],
+    )
+
+
+__all__ = ["SUBMISSION_SIDE_EFFECTS_JOB", "apply_submission_side_effects", "submission_side_effects_payload"]
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.user_test_answer_backfill import backfill_answer_links
+
+
+class Command(BaseCommand):
+    help = "Link historical UserTestAnswer rows to their question (and MCQ choice), in chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Attempts per transaction")
+
+    def handle(self, *args, **options):
+        linked, skipped = backfill_answer_links(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Linked {linked} answers; skipped {skipped} attempts that could not be paired"))
@@ -0,0 +1,55 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from common.middleware import brotli
+from common.renderers import FastJSONRenderer, orjson
+from courses.views.client.tests_tree import ClientTestsTreeView
+from gameinfo.views.client.leaderboard import Top50LeaderboardView
+
+ENDPOINTS = (
+    ("tests tree", "/api/client/tests/tree/", ClientTestsTreeView),
+    ("leaderboard top50", "/api/client/leaderboard/top50/", Top50LeaderboardView),
+)
+
+
+class Command(BaseCommand):
+    help = "Compare render time and bytes on the wire (identity/gzip/br) for the tree and leaderboard payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="User id to render as (defaults to the first user)")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        user = User.objects.filter(pk=options["user"]).first() if options["user"] else User.objects.order_by("pk").first()
+        if user is None:
+            raise CommandError("No user to render as; create one or pass --user")
+        iterations = max(1, options["iterations"])
+        factory = APIRequestFactory()
+
+        self.stdout.write(
+            f"orjson: {'yes' if orjson is not None else 'no (stdlib fallback)'}, "
+            f"brotli: {'yes' if brotli is not None else 'no'}, iterations: {iterations}"
+        )
+        for label, path, view_class in ENDPOINTS:
+            request = factory.get(path)
+            force_authenticate(request, user=user)
+            data = view_class.as_view()(request).data
+
+            timings = {}
+            for renderer in (JSONRenderer(), FastJSONRenderer()):
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    body = renderer.render(data)
+                timings[type(renderer).__name__] = (time.perf_counter() - start) / iterations * 1000
+
+            sizes = [f"identity {len(body)} B", f"gzip {len(compress_string(body))} B"]
+            if brotli is not None:
+                sizes.append(f"br {len(brotli.compress(body, quality=5))} B")
+            render = ", ".join(f"{name} {ms:.3f} ms" for name, ms in timings.items())
+            self.stdout.write(f"{label}: {', '.join(sizes)}; render {render}")
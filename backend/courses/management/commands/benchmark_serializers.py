@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from courses.models import Question, QuestionChoice, UserTest
+from courses.serializers.client.question import ClientQuestionSerializer
+from courses.serializers.client.user_test import ClientUserTestSerializer
+from courses.views.client.question import ClientListQuestionsView
+from courses.views.client.user_test import ClientListUserTestsView
+from gameinfo.serializers.client.leaderboard import LeaderboardEntrySerializer
+from gameinfo.views.client.leaderboard import Top50LeaderboardView
+
+CHOICES_PER_QUESTION = 4
+REPEAT = 3
+
+
+def _timed(fn):
+    """Result and best-of-REPEAT wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def _user_tests(count: int):
+    now = timezone.now()
+    rows = [
+        {
+            "user_test_id": i,
+            "test_id": i % 50 + 1,
+            "attempt_date": now - timedelta(minutes=i),
+            "time_spent": 30 + i % 300,
+            "correct_answer_count": i % 10,
+            "score_count": i % 101,
+        }
+        for i in range(1, count + 1)
+    ]
+    return [UserTest(**row) for row in rows], rows
+
+
+def _questions(count: int):
+    instances, rows, choice_rows = [], [], []
+    for i in range(1, count + 1):
+        row = {"question_id": i, "test_id": i % 50 + 1, "text": f"Question {i}", "type": "mcq", "order_index": i}
+        choices = [
+            {"choice_id": i * 10 + c, "question_id": i, "text": f"Choice {c}", "order_index": c}
+            for c in range(1, CHOICES_PER_QUESTION + 1)
+        ]
+        question = Question(**row)
+        # Same shape as prefetch_related("choices") leaves on each instance
+        question._prefetched_objects_cache = {"choices": [QuestionChoice(**c) for c in choices]}
+        instances.append(question)
+        rows.append(row)
+        choice_rows.extend(choices)
+    return instances, rows, choice_rows
+
+
+def _leaderboard(count: int):
+    """Entries as the view used to build them, and the same data as values() rows."""
+    entries = [
+        {"rank": i, "user_id": i, "username": f"user{i}", "xp_value": 100_000 - i, "level": 40, "profile_icon": None}
+        for i in range(1, count + 1)
+    ]
+    rows = [
+        {**entry, "user__username": entry["username"], "user__profile_icon": entry["profile_icon"]}
+        for entry in entries
+    ]
+    return entries, rows
+
+
+class Command(BaseCommand):
+    help = "Compare DRF serializers with the values()-based serializers on in-memory rows (no database needed)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+
+    def _report(self, label, count, current, fast):
+        (current_data, current_ms), (fast_data, fast_ms) = current, fast
+        if current_data != fast_data:
+            raise CommandError(f"{label}: values serializer output differs from the DRF serializer")
+        self.stdout.write(
+            f"{label:<18} {count:>6} rows: serializer {current_ms:8.1f} ms, values {fast_ms:7.1f} ms "
+            f"({current_ms / max(fast_ms, 1e-6):.1f}x)"
+        )
+
+    def handle(self, *args, **options):
+        for count in options["rows"]:
+            instances, rows = _user_tests(count)
+            self._report(
+                "user tests",
+                count,
+                _timed(lambda: ClientUserTestSerializer(instances, many=True).data),
+                _timed(lambda: ClientListUserTestsView.values_serializer.serialize(rows)),
+            )
+
+            instances, rows, choice_rows = _questions(count)
+
+            def fast_questions():
+                data = ClientListQuestionsView.values_serializer.serialize(rows)
+                ClientListQuestionsView.attach_choice_values(rows, data, choice_rows)
+                return data
+
+            self._report(
+                "questions",
+                count,
+                _timed(lambda: ClientQuestionSerializer(instances, many=True).data),
+                _timed(fast_questions),
+            )
+
+            entries, rows = _leaderboard(count)
+
+            def current_leaderboard():
+                serializer = LeaderboardEntrySerializer(data=entries, many=True)
+                serializer.is_valid(raise_exception=True)
+                return serializer.data
+
+            self._report(
+                "leaderboard",
+                count,
+                _timed(current_leaderboard),
+                _timed(lambda: Top50LeaderboardView.values_serializer.serialize(rows)),
+            )
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+
+from courses.services.course_transfer import FORMATS, import_course, load_course_document
+
+
+class Command(BaseCommand):
+    help = "Import a whole course from a JSON or CSV document (same format as the admin import endpoint)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the .json or .csv document")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to the file extension")
+        parser.add_argument("--title", help="Course title (required for CSV)")
+        parser.add_argument("--description")
+        parser.add_argument("--status", help="Course status (defaults to draft)")
+        parser.add_argument("--user", help="Username recorded as the course author")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"No such file: {path}")
+        fmt = (options["format"] or path.suffix.lstrip(".")).lower()
+        course_fields = {k: options[k] for k in ("title", "description", "status") if options[k] is not None}
+
+        user = None
+        if options["user"]:
+            user = get_user_model().objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"Unknown user: {options['user']}")
+
+        try:
+            document = load_course_document(path.read_bytes(), fmt, course_fields=course_fields)
+        except serializers.ValidationError as exc:
+            raise CommandError(f"Invalid course document: {exc.detail}") from exc
+        course, counts = import_course(document, user=user)
+        summary = ", ".join(f"{n} {label}" for label, n in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Imported course {course.course_id} ({summary})"))
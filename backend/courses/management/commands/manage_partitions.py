@@ -0,0 +1,77 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.models import UserTest, UserTestAnswer
+from courses.services.partitions import (
+    PartitioningError,
+    convert_to_partitioned,
+    create_future_partitions,
+    detach_partitions,
+    ensure_postgresql,
+    is_partitioned,
+    list_partitions,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Manage monthly partitions of UserTest/UserTestAnswer on PostgreSQL: convert existing tables, "
+        "create partitions ahead of time, and detach (archive or drop) old months."
+    )
+
+    def add_arguments(self, parser):
+        sub = parser.add_subparsers(dest="action", required=True)
+
+        convert = sub.add_parser("convert", help="Convert the tables to monthly partitioning in place")
+        convert.add_argument("--months-ahead", type=int, default=3)
+        convert.add_argument("--chunk-size", type=int, default=10000, help="Rows per answer backfill update")
+
+        create = sub.add_parser("create", help="Create partitions up to N months ahead (run monthly)")
+        create.add_argument("--months-ahead", type=int, default=3)
+
+        detach = sub.add_parser("detach", help="Detach partitions that only hold rows older than --before")
+        detach.add_argument("--before", required=True, help="First month to keep, as YYYY-MM")
+        detach.add_argument("--drop", action="store_true", help="Drop detached partitions instead of archiving")
+
+        sub.add_parser("list", help="Show the partitions of each table")
+
+    def handle(self, *args, **options):
+        try:
+            ensure_postgresql()
+            getattr(self, f"handle_{options['action']}")(options)
+        except PartitioningError as exc:
+            raise CommandError(str(exc)) from exc
+
+    def handle_convert(self, options):
+        created = convert_to_partitioned(months_ahead=options["months_ahead"], chunk_size=options["chunk_size"])
+        if not created:
+            self.stdout.write("Tables are already partitioned")
+            return
+        self.stdout.write(self.style.SUCCESS(f"Converted; created {len(created)} partitions"))
+
+    def handle_create(self, options):
+        created = create_future_partitions(months_ahead=options["months_ahead"])
+        self.stdout.write(self.style.SUCCESS(f"Ensured {len(created)} partitions"))
+
+    def handle_detach(self, options):
+        try:
+            before = month_start(datetime.datetime.strptime(options["before"], "%Y-%m"))
+        except ValueError as exc:
+            raise CommandError("--before must look like YYYY-MM") from exc
+        detached = detach_partitions(before=before, drop=options["drop"])
+        verb = "Dropped" if options["drop"] else "Archived"
+        for name in detached:
+            self.stdout.write(f"{verb} {name}")
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(detached)} partitions"))
+
+    def handle_list(self, options):
+        for model in (UserTest, UserTestAnswer):
+            table = model._meta.db_table
+            if not is_partitioned(table):
+                self.stdout.write(f"{table}: not partitioned")
+                continue
+            self.stdout.write(f"{table}:")
+            for partition in list_partitions(table):
+                self.stdout.write(f"  {partition.name} (until {partition.upper_bound or 'open'})")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.question_stats import rebuild_question_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild QuestionStats from question-linked UserTestAnswer rows."
+
+    def handle(self, *args, **options):
+        written = rebuild_question_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} question stats rows"))
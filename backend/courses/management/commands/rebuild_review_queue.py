@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.review_queue import rebuild_review_queue
+
+
+class Command(BaseCommand):
+    help = "Rebuild every learner's spaced-repetition queue from question-linked UserTestAnswer history."
+
+    def handle(self, *args, **options):
+        written = rebuild_review_queue()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} review items"))
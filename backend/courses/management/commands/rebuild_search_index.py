@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents for all course content."
+
+    def handle(self, *args, **options):
+        written = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {written} documents"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.user_test_progress import rebuild_user_test_progress
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized UserTestProgress table from UserTest history."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per bulk insert")
+
+    def handle(self, *args, **options):
+        written = rebuild_user_test_progress(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} progress rows"))
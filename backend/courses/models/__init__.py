@@ -6,6 +6,11 @@ from .question_choice import QuestionChoice
 from .user_course import UserCourse
 from .user_test import UserTest
 from .user_test_answer import UserTestAnswer
+from .user_test_progress import UserTestProgress
+from .content_version import ContentVersion
+from .question_stats import QuestionStats
+from .search_document import SearchDocument
+from .review_item import ReviewItem
 
 __all__ = [
     "Course",
@@ -16,4 +21,9 @@ __all__ = [
     "UserCourse",
     "UserTest",
     "UserTestAnswer",
+    "UserTestProgress",
+    "ContentVersion",
+    "QuestionStats",
+    "SearchDocument",
+    "ReviewItem",
 ]
@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class ContentVersion(models.Model):
+    """Monotonic counter bumped whenever authored course content changes.
+
+    Readers use the version as a cache key so derived payloads (e.g. the tests tree)
+    can be reused until the next admin write.
+    """
+
+    key = models.CharField(max_length=50, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Content Version"
+        verbose_name_plural = "Content Versions"
+
+    def __str__(self):
+        return f"ContentVersion<{self.key}:{self.version}>"
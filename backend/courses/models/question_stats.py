@@ -0,0 +1,32 @@
+from django.db import models
+
+
+class QuestionStats(models.Model):
+    """Running answer counts per question.
+
+    Incremented in the submission transaction so difficulty reads never scan UserTestAnswer.
+    """
+
+    question = models.OneToOneField(
+        "courses.Question",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    correct_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Question Stats"
+        verbose_name_plural = "Question Stats"
+        ordering = ["question_id"]
+
+    @property
+    def correct_rate(self) -> float | None:
+        if not self.attempts:
+            return None
+        return self.correct_count / self.attempts
+
+    def __str__(self):
+        return f"QuestionStats<q={self.question_id} {self.correct_count}/{self.attempts}>"
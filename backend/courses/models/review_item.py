@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class ReviewItem(models.Model):
+    """A question in a learner's spaced-repetition queue (SM-2 scheduling state).
+
+    Created the first time the learner answers the question wrongly and rescheduled on every
+    later graded answer, so the queue is read with one (user, due_at) index range scan.
+    """
+
+    review_item_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="review_items")
+    question = models.ForeignKey("courses.Question", on_delete=models.CASCADE, related_name="review_items")
+    ease_factor = models.FloatField(default=2.5)
+    interval_days = models.PositiveIntegerField(default=0)
+    # Consecutive correct reviews since the last lapse
+    repetitions = models.PositiveIntegerField(default=0)
+    lapses = models.PositiveIntegerField(default=0)
+    due_at = models.DateTimeField(default=timezone.now)
+    last_reviewed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Review Item"
+        verbose_name_plural = "Review Items"
+        ordering = ["due_at", "review_item_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "question"], name="uniq_review_item_user_question"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "due_at"], name="idx_review_item_user_due"),
+        ]
+
+    def __str__(self):
+        return f"ReviewItem<user={self.user_id} q={self.question_id} due={self.due_at:%Y-%m-%d}>"
@@ -0,0 +1,41 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """Denormalized full-text entry for one piece of authored content.
+
+    Kept current by save/delete hooks (see courses.signals); ``search_vector`` is the stored
+    tsvector (title weighted A, body B) behind the GIN index.
+    """
+
+    class Kind(models.TextChoices):
+        COURSE = "course", "Course"
+        CHAPTER = "chapter", "Chapter"
+        TEST = "test", "Test"
+        QUESTION = "question", "Question"
+
+    document_id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    # Primary key of the indexed Course/Chapter/Test/Question
+    object_id = models.PositiveIntegerField()
+    # Owning course, so learner searches can be limited to active courses with one join
+    course = models.ForeignKey("courses.Course", on_delete=models.CASCADE, related_name="search_documents")
+    title = models.TextField()
+    body = models.TextField(blank=True, default="")
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-document_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="uniq_search_document_object"),
+        ]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="idx_search_document_vector"),
+            models.Index(fields=["course"], name="idx_search_document_course"),
+        ]
+
+    def __str__(self):
+        return f"SearchDocument<{self.kind}:{self.object_id}>"
@@ -1,12 +1,14 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class UserTest(models.Model):
     user_test_id = models.AutoField(primary_key=True)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="user_tests")
     test = models.ForeignKey("courses.Test", on_delete=models.CASCADE, related_name="user_tests")
-    attempt_date = models.DateTimeField(auto_now_add=True)
+    # Defaults to now; offline batch submissions store the client's attempt time instead
+    attempt_date = models.DateTimeField(default=timezone.now)
     time_spent = models.PositiveIntegerField(help_text="Time spent in seconds")
     # Number of correct answers given in this test submission
     correct_answer_count = models.PositiveIntegerField(default=0)
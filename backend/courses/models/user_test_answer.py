@@ -1,10 +1,37 @@
 from django.db import models
+from django.utils import timezone
 
 
 class UserTestAnswer(models.Model):
     user_test_answer_id = models.AutoField(primary_key=True)
-    user_test = models.ForeignKey("courses.UserTest", on_delete=models.CASCADE, related_name="answers")
-    given_answer_text = models.TextField()
+    # No database-level constraint: on PostgreSQL both tables are range-partitioned by attempt month,
+    # so user_test_id alone is not unique on courses_usertest (see the manage_partitions command)
+    user_test = models.ForeignKey(
+        "courses.UserTest",
+        on_delete=models.CASCADE,
+        related_name="answers",
+        db_constraint=False,
+    )
+    # Copy of user_test.attempt_date; the partition key for this table
+    attempt_date = models.DateTimeField(default=timezone.now, editable=False)
+    # Null only for historical rows the backfill could not pair with a question
+    question = models.ForeignKey(
+        "courses.Question",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="user_answers",
+    )
+    # The picked choice for MCQ answers; its text is not stored again
+    choice = models.ForeignKey(
+        "courses.QuestionChoice",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="user_answers",
+    )
+    # Free text for fill-in-blank answers (and MCQ input that matches no choice)
+    given_answer_text = models.TextField(null=True, blank=True)
     is_correct = models.BooleanField()
 
     class Meta:
@@ -12,7 +39,24 @@ class UserTestAnswer(models.Model):
         indexes = [
             models.Index(fields=["user_test"], name="idx_user_test_answer_test"),
             models.Index(fields=["is_correct"], name="idx_user_test_answer_correct"),
+            models.Index(fields=["question"], name="idx_user_test_answer_question"),
         ]
 
+    @property
+    def answer_text(self) -> str:
+        """What the learner answered, whichever way it is stored (select_related("choice") to avoid a query)."""
+        if self.choice_id is not None:
+            return self.choice.text
+        return self.given_answer_text or ""
+
+    def save(self, *args, **kwargs):
+        # Keep the answer in the same monthly partition as its attempt (bulk_create callers set it directly)
+        if self.user_test_id is not None:
+            self.attempt_date = self.user_test.attempt_date
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "attempt_date" not in update_fields:
+                kwargs["update_fields"] = [*update_fields, "attempt_date"]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"UserTestAnswer<{self.user_test_answer_id} test={self.user_test_id}>"
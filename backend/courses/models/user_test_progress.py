@@ -0,0 +1,31 @@
+from django.db import models
+from django.conf import settings
+
+
+class UserTestProgress(models.Model):
+    """Materialized summary of a user's attempts at a test.
+
+    Maintained on every submission so readers never aggregate UserTest history.
+    """
+
+    progress_id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="test_progress")
+    test = models.ForeignKey("courses.Test", on_delete=models.CASCADE, related_name="user_progress")
+    # Best percentage score (0-100) across all attempts
+    best_score = models.PositiveSmallIntegerField(default=0)
+    attempt_count = models.PositiveIntegerField(default=0)
+    # First attempt whose score was above the test's passing score
+    first_passed_at = models.DateTimeField(null=True, blank=True)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-progress_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "test"], name="uniq_user_test_progress"),
+        ]
+        indexes = [
+            models.Index(fields=["test"], name="idx_usertestprogress_test"),
+        ]
+
+    def __str__(self):
+        return f"UserTestProgress<user={self.user_id} test={self.test_id} best={self.best_score}>"
@@ -1 +0,0 @@
-# Package init for composed admin serializers
@@ -0,0 +1,75 @@
+from rest_framework import serializers
+from courses.models import Course, Question
+from courses.services.answer_key import normalize_answer
+
+
+def _fill_order(items: list, label: str) -> list:
+    """Default order_index to the 1-based position and reject duplicates within a parent."""
+    seen = set()
+    for position, item in enumerate(items, start=1):
+        if item.get("order_index") is None:
+            item["order_index"] = position
+        if item["order_index"] in seen:
+            raise serializers.ValidationError(f"Duplicate {label} order_index {item['order_index']}")
+        seen.add(item["order_index"])
+    return items
+
+
+class ImportChoiceSerializer(serializers.Serializer):
+    text = serializers.CharField(max_length=255)
+    order_index = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+
+
+class ImportQuestionSerializer(serializers.Serializer):
+    text = serializers.CharField()
+    type = serializers.ChoiceField(choices=Question.Type.choices)
+    correct_answer_text = serializers.CharField()
+    order_index = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    choices = ImportChoiceSerializer(many=True, required=False, default=list)
+
+    def validate_choices(self, value):
+        return _fill_order(value, "choice")
+
+    def validate(self, attrs):
+        if attrs["type"] == Question.Type.MCQ:
+            texts = {normalize_answer(c["text"]) for c in attrs["choices"]}
+            if normalize_answer(attrs["correct_answer_text"]) not in texts:
+                raise serializers.ValidationError({"correct_answer_text": "MCQ answer must match one of its choices."})
+        elif attrs["choices"]:
+            raise serializers.ValidationError({"choices": "Only MCQ questions have choices."})
+        return attrs
+
+
+class ImportTestSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=255)
+    passing_score = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    order_index = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    questions = ImportQuestionSerializer(many=True, required=False, default=list)
+
+    def validate_questions(self, value):
+        return _fill_order(value, "question")
+
+
+class ImportChapterSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    learning_resource_url = serializers.URLField(required=False, allow_blank=True, allow_null=True)
+    order_index = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    tests = ImportTestSerializer(many=True, required=False, default=list)
+
+    def validate_tests(self, value):
+        return _fill_order(value, "test")
+
+
+class AdminCourseImportSerializer(serializers.Serializer):
+    """A whole course document: course fields with nested chapters > tests > questions > choices.
+
+    Same shape as the export; ids are ignored and order_index defaults to list position.
+    """
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    status = serializers.ChoiceField(choices=Course.Status.choices, default=Course.Status.DRAFT)
+    chapters = ImportChapterSerializer(many=True, required=False, default=list)
+
+    def validate_chapters(self, value):
+        return _fill_order(value, "chapter")
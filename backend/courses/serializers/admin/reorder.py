@@ -0,0 +1,6 @@
+from rest_framework import serializers
+
+
+class AdminReorderSerializer(serializers.Serializer):
+    # Every child id of the parent, in the desired order
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
@@ -2,12 +2,24 @@ from rest_framework import serializers
 from courses.models import UserTestAnswer
 
 class AdminUserTestAnswerSerializer(serializers.ModelSerializer):
+    answer_text = serializers.CharField(read_only=True)
+
     class Meta:
         model = UserTestAnswer
         fields = [
             "user_test_answer_id",
             "user_test",
+            "question",
+            "choice",
             "given_answer_text",
+            "answer_text",
             "is_correct",
         ]
         read_only_fields = ["user_test_answer_id"]
+
+    def validate(self, attrs):
+        question = attrs.get("question", getattr(self.instance, "question", None))
+        choice = attrs.get("choice", getattr(self.instance, "choice", None))
+        if choice is not None and (question is None or choice.question_id != question.question_id):
+            raise serializers.ValidationError({"choice": "Choice must belong to the answer's question."})
+        return attrs
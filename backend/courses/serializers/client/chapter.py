@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from courses.models import Chapter
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
 
-class ClientChapterSerializer(serializers.ModelSerializer):
+class ClientChapterSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Chapter
         fields = [
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+from courses.serializers.client.question import ClientQuestionSerializer
+from courses.serializers.client.test import ClientTestSerializer
+
+
+class ClientTestBundleSerializer(serializers.Serializer):
+    """Everything needed to start a test: the test itself plus its questions and choices."""
+
+    test = ClientTestSerializer()
+    questions = ClientQuestionSerializer(many=True)
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from courses.models import Course
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
 
-class ClientCourseSerializer(serializers.ModelSerializer):
+class ClientCourseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Course
         fields = ["course_id", "title", "description", "status"]
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from courses.models import Question
 from .question_choice import ClientQuestionChoiceSerializer
+from .sparse_fields import SparseFieldsMixin
 
-class ClientQuestionSerializer(serializers.ModelSerializer):
+class ClientQuestionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     choices = ClientQuestionChoiceSerializer(many=True, read_only=True)
 
     class Meta:
@@ -16,3 +17,4 @@ class ClientQuestionSerializer(serializers.ModelSerializer):
             "choices",
         ]
         read_only_fields = fields
+        expandable_fields = ["choices"]
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from courses.models import QuestionChoice
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
 
-class ClientQuestionChoiceSerializer(serializers.ModelSerializer):
+class ClientQuestionChoiceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = QuestionChoice
         fields = [
@@ -0,0 +1,20 @@
+from rest_framework import serializers
+from courses.models import ReviewItem
+from courses.serializers.client.question import ClientQuestionSerializer
+
+
+class ClientReviewItemSerializer(serializers.ModelSerializer):
+    question = ClientQuestionSerializer(read_only=True)
+
+    class Meta:
+        model = ReviewItem
+        fields = [
+            "review_item_id",
+            "question",
+            "due_at",
+            "interval_days",
+            "repetitions",
+            "lapses",
+            "last_reviewed_at",
+        ]
+        read_only_fields = fields
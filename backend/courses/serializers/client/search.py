@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from courses.models import SearchDocument
+from courses.services.search import SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    # Comma-separated subset of course,chapter,test,question
+    kind = serializers.CharField(required=False, allow_blank=True)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    limit = serializers.IntegerField(min_value=1, max_value=SEARCH_MAX_LIMIT, default=SEARCH_DEFAULT_LIMIT)
+
+    def validate_kind(self, value):
+        kinds = [k.strip() for k in value.split(",") if k.strip()]
+        unknown = set(kinds) - set(SearchDocument.Kind.values)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown kind: {', '.join(sorted(unknown))}")
+        return kinds
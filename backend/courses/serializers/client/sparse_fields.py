@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+
+def _param_set(request, name: str) -> set[str] | None:
+    """Comma-separated query parameter as a set; None when the parameter is absent."""
+    if request is None or name not in request.query_params:
+        return None
+    return {part.strip() for part in request.query_params.get(name, "").split(",") if part.strip()}
+
+
+class SparseFieldsMixin:
+    """``?fields=`` / ``?expand=`` support for top-level client serializers.
+
+    Meta options:
+
+    - ``expandable_fields``: nested/related fields. Without query parameters every field is
+      returned as before; once ``?fields=`` or ``?expand=`` is sent, these are only returned
+      when named in ``?expand=``.
+    - ``field_relations``: ``{field: (select_related path, ...)}`` for fields that read related
+      rows, so views can skip joins nobody asked for (see ``with_related``).
+
+    ``?fields=`` limits plain fields to the listed names (unknown names are ignored). Views build
+    their queryset with ``with_related(queryset, request)`` instead of a fixed select_related.
+    Only the outermost serializer reacts; serializers nested in it always render in full.
+    """
+
+    @classmethod
+    def selected_field_names(cls, request) -> set[str]:
+        meta = cls.Meta
+        names = set(meta.fields)
+        fields = _param_set(request, FIELDS_PARAM)
+        expand = _param_set(request, EXPAND_PARAM)
+        if fields is None and expand is None:
+            return names
+        expandable = set(getattr(meta, "expandable_fields", ()))
+        plain = names - expandable
+        if fields:
+            plain &= fields
+        return plain | (expandable & (expand or set()))
+
+    @classmethod
+    def with_related(cls, queryset, request):
+        """``queryset`` joined to just the related rows the selected fields read."""
+        relations = getattr(cls.Meta, "field_relations", {})
+        paths: list[str] = []
+        for name in sorted(cls.selected_field_names(request)):
+            for path in relations.get(name, ()):
+                if path not in paths:
+                    paths.append(path)
+        # select_related() without arguments would follow every foreign key
+        return queryset.select_related(*paths) if paths else queryset
+
+    def _is_outermost(self) -> bool:
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_outermost():
+            return fields
+        selected = self.selected_field_names(self.context.get("request"))
+        return {name: field for name, field in fields.items() if name in selected}
+
+
+__all__ = ["SparseFieldsMixin", "FIELDS_PARAM", "EXPAND_PARAM"]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from rest_framework import serializers
- 
+
+from common.constants import BATCH_SUBMISSION_MAX_ATTEMPTS
 
 
 class SubmissionAnswerInputSerializer(serializers.Serializer):
@@ -32,3 +33,21 @@ class SubmitUserTestSerializer(serializers.Serializer):
 
     def update(self, instance, validated_data):
         raise NotImplementedError()
+
+
+class SubmitUserTestAttemptSerializer(serializers.Serializer):
+    test_id = serializers.IntegerField()
+    duration = serializers.IntegerField(min_value=0)
+    answers = SubmissionAnswerInputSerializer(many=True)
+    # When the learner took the test (client clock); defaults to the server time
+    attempted_at = serializers.DateTimeField(required=False, allow_null=True)
+
+
+class SubmitUserTestBatchSerializer(serializers.Serializer):
+    attempts = SubmitUserTestAttemptSerializer(many=True, allow_empty=False, max_length=BATCH_SUBMISSION_MAX_ATTEMPTS)
+
+    def create(self, validated_data):
+        raise NotImplementedError("Use view to handle creation via service")
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
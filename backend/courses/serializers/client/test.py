@@ -2,8 +2,9 @@ from rest_framework import serializers
 from courses.models import Test
 from courses.serializers.client.chapter import ClientChapterSerializer
 from courses.serializers.client.course import ClientCourseSerializer
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
 
-class ClientTestSerializer(serializers.ModelSerializer):
+class ClientTestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     chapter = ClientChapterSerializer(read_only=True)
     course = ClientCourseSerializer(source="chapter.course", read_only=True)
 
@@ -19,3 +20,5 @@ class ClientTestSerializer(serializers.ModelSerializer):
             "course",
         ]
         read_only_fields = fields
+        expandable_fields = ["chapter", "course"]
+        field_relations = {"chapter": ("chapter",), "course": ("chapter__course",)}
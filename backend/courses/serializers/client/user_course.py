@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from courses.models import UserCourse
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
 
-class ClientUserCourseSerializer(serializers.ModelSerializer):
+class ClientUserCourseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     course_title = serializers.SerializerMethodField()
     course_description = serializers.SerializerMethodField()
 
@@ -24,3 +25,4 @@ class ClientUserCourseSerializer(serializers.ModelSerializer):
             "is_dropped",
         ]
         read_only_fields = fields
+        field_relations = {"course_title": ("course",), "course_description": ("course",)}
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from courses.models import UserTest
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
 
-class ClientUserTestSerializer(serializers.ModelSerializer):
+class ClientUserTestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = UserTest
         fields = [
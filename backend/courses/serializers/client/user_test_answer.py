@@ -1,13 +1,20 @@
 from rest_framework import serializers
 from courses.models import UserTestAnswer
+from courses.serializers.client.sparse_fields import SparseFieldsMixin
+
+class ClientUserTestAnswerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    # MCQ answers are stored as a choice reference; expose the text either way
+    given_answer_text = serializers.CharField(source="answer_text", read_only=True)
 
-class ClientUserTestAnswerSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserTestAnswer
         fields = [
             "user_test_answer_id",
             "user_test_id",
+            "question_id",
+            "choice_id",
             "given_answer_text",
             "is_correct",
         ]
         read_only_fields = fields
+        field_relations = {"given_answer_text": ("choice",)}
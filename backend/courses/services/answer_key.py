@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+
+from django.conf import settings
+
+from courses.models import Question
+from courses.services.content_version import get_content_version
+
+
+def normalize_answer(text: str | None) -> str:
+    if text is None:
+        return ""
+    return str(text).strip().casefold()
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    test_id: int
+    # Content version the key was loaded at; stale entries are reloaded
+    version: int
+    # question_id -> normalized correct answer
+    answers: dict[int, str]
+    # MCQ question_id -> normalized choice text -> choice_id (first choice wins on duplicate texts)
+    choices: dict[int, dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.answers)
+
+    def is_correct(self, question_id: int, given: str | None) -> bool:
+        return normalize_answer(given) == self.answers[question_id]
+
+    def encode(self, question_id: int, given: str | None) -> tuple[int | None, str | None]:
+        """Return ``(choice_id, text)`` to store: MCQ answers become a choice reference when possible."""
+        choice_id = self.choices.get(question_id, {}).get(normalize_answer(given))
+        if choice_id is not None:
+            return choice_id, None
+        return None, "" if given is None else str(given)
+
+
+class AnswerKeyCache:
+    """Thread-safe, size-bounded LRU of answer keys for this process."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max(1, int(max_size))
+        self._entries: OrderedDict[int, AnswerKey] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, test_id: int, version: int) -> AnswerKey | None:
+        with self._lock:
+            key = self._entries.get(test_id)
+            if key is None:
+                return None
+            if key.version != version:
+                # Content changed (possibly in another process): drop the stale key
+                del self._entries[test_id]
+                return None
+            self._entries.move_to_end(test_id)
+            return key
+
+    def put(self, key: AnswerKey) -> None:
+        with self._lock:
+            self._entries[key.test_id] = key
+            self._entries.move_to_end(key.test_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, test_id: int) -> None:
+        with self._lock:
+            self._entries.pop(test_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+answer_key_cache = AnswerKeyCache(settings.ANSWER_KEY_CACHE_SIZE)
+
+
+def load_answer_key(test_id: int, version: int) -> AnswerKey:
+    # One query: questions LEFT JOIN their choices (MCQ rows repeat once per choice)
+    rows = (
+        Question.objects.filter(test_id=test_id)
+        .order_by("question_id", "choices__order_index", "choices__choice_id")
+        .values_list("question_id", "type", "correct_answer_text", "choices__choice_id", "choices__text")
+    )
+    answers: dict[int, str] = {}
+    choices: dict[int, dict[str, int]] = {}
+    for qid, qtype, answer, choice_id, choice_text in rows:
+        answers[qid] = normalize_answer(answer)
+        if qtype == Question.Type.MCQ and choice_id is not None:
+            choices.setdefault(qid, {}).setdefault(normalize_answer(choice_text), choice_id)
+    return AnswerKey(test_id=test_id, version=version, answers=answers, choices=choices)
+
+
+def get_answer_key(test_id: int, version: int | None = None) -> AnswerKey:
+    """Return the pre-normalized answer key for a test; no question query when warm."""
+    if version is None:
+        version = get_content_version()
+    key = answer_key_cache.get(test_id, version)
+    if key is None:
+        key = load_answer_key(test_id, version)
+        answer_key_cache.put(key)
+    return key
+
+
+__all__ = [
+    "AnswerKey",
+    "AnswerKeyCache",
+    "answer_key_cache",
+    "get_answer_key",
+    "load_answer_key",
+    "normalize_answer",
+]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from django.db.models import F
+from django.utils import timezone
+
+from common.conditional import Validators
+from courses.models import ContentVersion
+
+# Single counter shared by every piece of authored course content
+COURSE_CONTENT_KEY = "courses"
+
+
+def get_content_version(key: str = COURSE_CONTENT_KEY) -> int:
+    """Return the current content version (0 when nothing has been bumped yet)."""
+    version = ContentVersion.objects.filter(key=key).values_list("version", flat=True).first()
+    return int(version or 0)
+
+
+def bump_content_version(key: str = COURSE_CONTENT_KEY) -> None:
+    """Increment the content version so cached payloads keyed by it are dropped.
+
+    Uses an F() update so concurrent admin writes never lose an increment.
+    """
+    # update() skips auto_now, so stamp updated_at explicitly (it backs Last-Modified)
+    changes = {"version": F("version") + 1, "updated_at": timezone.now()}
+    updated = ContentVersion.objects.filter(key=key).update(**changes)
+    if not updated:
+        _, created = ContentVersion.objects.get_or_create(key=key, defaults={"version": 1})
+        if not created:
+            ContentVersion.objects.filter(key=key).update(**changes)
+
+
+def content_version_validators(view=None, key: str = COURSE_CONTENT_KEY) -> Validators:
+    """Version provider for ConditionalGetMixin views serving authored course content."""
+    row = ContentVersion.objects.filter(key=key).values_list("version", "updated_at").first()
+    version, updated_at = row or (0, None)
+    return Validators(f"{key}-v{version}", updated_at)
@@ -0,0 +1,316 @@
+"""Whole-course import (bulk inserts) and streaming export.
+
+The document shape is shared by the JSON import/export and ``manage.py import_course``::
+
+    {"title": ..., "description": ..., "status": ...,
+     "chapters": [{"title": ..., "description": ..., "learning_resource_url": ..., "order_index": ...,
+                   "tests": [{"title": ..., "passing_score": ..., "order_index": ...,
+                              "questions": [{"text": ..., "type": ..., "correct_answer_text": ...,
+                                             "order_index": ...,
+                                             "choices": [{"text": ..., "order_index": ...}]}]}]}]}
+
+CSV carries one question per row (see CSV_COLUMNS); course fields come from the caller.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+from django.db import transaction
+from rest_framework import serializers
+
+from courses.models import Chapter, Course, Question, QuestionChoice, Test
+from courses.serializers.admin.course_import import AdminCourseImportSerializer
+from courses.services.content_version import bump_content_version
+from courses.services.search import index_course
+
+JSON_FORMAT = "json"
+CSV_FORMAT = "csv"
+FORMATS = (JSON_FORMAT, CSV_FORMAT)
+
+CSV_COLUMNS = (
+    "chapter_title",
+    "chapter_description",
+    "chapter_learning_resource_url",
+    "test_title",
+    "test_passing_score",
+    "question_text",
+    "question_type",
+    "correct_answer_text",
+    "choices",
+)
+# Separates choice texts inside the CSV "choices" cell
+CSV_CHOICE_SEPARATOR = "|"
+
+EXPORT_CHUNK_SIZE = 500
+
+
+def parse_course_csv(text: str, *, course_fields: dict) -> dict:
+    """Build a course document from CSV rows; consecutive rows with the same chapter/test title are grouped."""
+    reader = csv.DictReader(io.StringIO(text))
+    missing = {"chapter_title", "test_title", "question_text", "question_type", "correct_answer_text"} - set(
+        reader.fieldnames or ()
+    )
+    if missing:
+        raise serializers.ValidationError({"file": f"Missing CSV columns: {', '.join(sorted(missing))}"})
+
+    chapters: list[dict] = []
+    for row in reader:
+        if not chapters or chapters[-1]["title"] != row["chapter_title"]:
+            chapters.append({
+                "title": row["chapter_title"],
+                "description": row.get("chapter_description") or None,
+                "learning_resource_url": row.get("chapter_learning_resource_url") or None,
+                "tests": [],
+            })
+        tests = chapters[-1]["tests"]
+        if not tests or tests[-1]["title"] != row["test_title"]:
+            tests.append({
+                "title": row["test_title"],
+                "passing_score": row.get("test_passing_score") or None,
+                "questions": [],
+            })
+        choices = [c for c in (row.get("choices") or "").split(CSV_CHOICE_SEPARATOR) if c.strip()]
+        tests[-1]["questions"].append({
+            "text": row["question_text"],
+            "type": row["question_type"],
+            "correct_answer_text": row["correct_answer_text"],
+            "choices": [{"text": c.strip()} for c in choices],
+        })
+    return {**course_fields, "chapters": chapters}
+
+
+def load_course_document(raw: bytes | str, fmt: str, *, course_fields: dict | None = None) -> dict:
+    """Parse an uploaded JSON/CSV document and validate it; returns the validated document."""
+    try:
+        text = raw.decode("utf-8-sig") if isinstance(raw, bytes) else raw
+    except UnicodeDecodeError as exc:
+        raise serializers.ValidationError({"file": f"File is not valid UTF-8: {exc}"}) from exc
+    if fmt == CSV_FORMAT:
+        document = parse_course_csv(text, course_fields=course_fields or {})
+    elif fmt == JSON_FORMAT:
+        try:
+            document = json.loads(text)
+        except ValueError as exc:
+            raise serializers.ValidationError({"file": f"Invalid JSON: {exc}"}) from exc
+        if not isinstance(document, dict):
+            raise serializers.ValidationError({"file": "Expected a JSON object describing one course"})
+        document = {**document, **(course_fields or {})}
+    else:
+        raise serializers.ValidationError({"format": f"Unsupported format {fmt!r}; use one of {', '.join(FORMATS)}"})
+    return validate_course_document(document)
+
+
+def validate_course_document(document: dict) -> dict:
+    serializer = AdminCourseImportSerializer(data=document)
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+@transaction.atomic
+def import_course(document: dict, *, user=None) -> tuple[Course, dict[str, int]]:
+    """Create a course and all of its content from a validated document.
+
+    One INSERT per level (course, chapters, tests, questions, choices); bulk_create returns
+    primary keys on PostgreSQL so children are linked without re-reading parents.
+    """
+    course = Course.objects.create(
+        title=document["title"],
+        description=document.get("description"),
+        status=document["status"],
+        created_by=user,
+        updated_by=user,
+    )
+
+    chapter_docs = document["chapters"]
+    chapters = Chapter.objects.bulk_create([
+        Chapter(
+            course=course,
+            title=c["title"],
+            description=c.get("description"),
+            learning_resource_url=c.get("learning_resource_url") or None,
+            order_index=c["order_index"],
+        )
+        for c in chapter_docs
+    ])
+
+    test_docs = [(chapter, t) for chapter, c in zip(chapters, chapter_docs) for t in c["tests"]]
+    tests = Test.objects.bulk_create([
+        Test(chapter=chapter, title=t["title"], passing_score=t.get("passing_score"), order_index=t["order_index"])
+        for chapter, t in test_docs
+    ])
+
+    question_docs = [(test, q) for test, (_chapter, t) in zip(tests, test_docs) for q in t["questions"]]
+    questions = Question.objects.bulk_create([
+        Question(
+            test=test,
+            text=q["text"],
+            type=q["type"],
+            correct_answer_text=q["correct_answer_text"],
+            order_index=q["order_index"],
+        )
+        for test, q in question_docs
+    ])
+
+    choices = QuestionChoice.objects.bulk_create([
+        QuestionChoice(question=question, text=c["text"], order_index=c["order_index"])
+        for question, (_test, q) in zip(questions, question_docs)
+        for c in q["choices"]
+    ])
+
+    # bulk_create sends no post_save signals, so invalidate cached content and index explicitly
+    bump_content_version()
+    index_course(course.course_id)
+    return course, {
+        "chapters": len(chapters),
+        "tests": len(tests),
+        "questions": len(questions),
+        "choices": len(choices),
+    }
+
+
+def _stream_questions(course_id: int, chunk_size: int) -> Iterator[tuple[dict, list[dict]]]:
+    """Yield ``(question_row, choices)`` in export order, reading both tables in chunks.
+
+    Questions and choices are read as two ordered cursors and merged, so memory stays bounded
+    by one question's choices regardless of course size.
+    """
+    questions = (
+        Question.objects.filter(test__chapter__course_id=course_id)
+        .order_by("test__chapter__order_index", "test__chapter_id", "test__order_index", "test_id", "order_index", "question_id")
+        .values("question_id", "test_id", "text", "type", "correct_answer_text", "order_index")
+        .iterator(chunk_size=chunk_size)
+    )
+    choices = (
+        QuestionChoice.objects.filter(question__test__chapter__course_id=course_id)
+        .order_by(
+            "question__test__chapter__order_index",
+            "question__test__chapter_id",
+            "question__test__order_index",
+            "question__test_id",
+            "question__order_index",
+            "question_id",
+            "order_index",
+            "choice_id",
+        )
+        .values("question_id", "text", "order_index")
+        .iterator(chunk_size=chunk_size)
+    )
+    pending = next(choices, None)
+    for question in questions:
+        own: list[dict] = []
+        while pending is not None and pending["question_id"] == question["question_id"]:
+            own.append({"text": pending["text"], "order_index": pending["order_index"]})
+            pending = next(choices, None)
+        yield question, own
+
+
+def _content_rows(course_id: int, chunk_size: int):
+    """Chapters and tests (small) in memory, questions streamed; yields ``(chapter, test, question, choices)``.
+
+    ``test``/``question`` are None for chapters without tests and tests without questions.
+    """
+    chapters = list(
+        Chapter.objects.filter(course_id=course_id)
+        .order_by("order_index", "chapter_id")
+        .values("chapter_id", "title", "description", "learning_resource_url", "order_index")
+    )
+    tests_by_chapter: dict[int, list[dict]] = {}
+    for test in (
+        Test.objects.filter(chapter__course_id=course_id)
+        .order_by("order_index", "test_id")
+        .values("test_id", "chapter_id", "title", "passing_score", "order_index")
+    ):
+        tests_by_chapter.setdefault(test["chapter_id"], []).append(test)
+
+    stream = _stream_questions(course_id, chunk_size)
+    pending = next(stream, None)
+    for chapter in chapters:
+        tests = tests_by_chapter.get(chapter["chapter_id"], [])
+        if not tests:
+            yield chapter, None, None, None
+        for test in tests:
+            emitted = False
+            while pending is not None and pending[0]["test_id"] == test["test_id"]:
+                yield chapter, test, pending[0], pending[1]
+                emitted = True
+                pending = next(stream, None)
+            if not emitted:
+                yield chapter, test, None, None
+
+
+def _dump(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def stream_course_json(course: Course, *, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterable[str]:
+    """Serialize a course as the import document, yielding pieces as rows are read."""
+    yield (
+        "{" f'"title": {_dump(course.title)}, "description": {_dump(course.description)}, '
+        f'"status": {_dump(course.status)}, "chapters": ['
+    )
+    chapter_id = test_id = None
+    first_question = True
+    for chapter, test, question, choices in _content_rows(course.course_id, chunk_size):
+        if chapter["chapter_id"] != chapter_id:
+            if chapter_id is not None:
+                yield "]}" + ("]}" if test_id is not None else "") + ", "
+            chapter_id, test_id = chapter["chapter_id"], None
+            fields = {k: chapter[k] for k in ("title", "description", "learning_resource_url", "order_index")}
+            yield _dump(fields)[:-1] + ', "tests": ['
+        if test is not None and test["test_id"] != test_id:
+            if test_id is not None:
+                yield "]}, "
+            test_id = test["test_id"]
+            first_question = True
+            fields = {k: test[k] for k in ("title", "passing_score", "order_index")}
+            yield _dump(fields)[:-1] + ', "questions": ['
+        if question is not None:
+            fields = {k: question[k] for k in ("text", "type", "correct_answer_text", "order_index")}
+            fields["choices"] = choices
+            yield ("" if first_question else ", ") + _dump(fields)
+            first_question = False
+    if chapter_id is not None:
+        yield ("]}" if test_id is not None else "") + "]}"
+    yield "]}"
+
+
+class _Echo:
+    """File-like object whose write() returns the line, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def stream_course_csv(course: Course, *, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterable[str]:
+    """One row per question (chapters/tests without questions are omitted), as accepted by the import."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for chapter, test, question, choices in _content_rows(course.course_id, chunk_size):
+        if question is None:
+            continue
+        yield writer.writerow([
+            chapter["title"],
+            chapter["description"] or "",
+            chapter["learning_resource_url"] or "",
+            test["title"],
+            "" if test["passing_score"] is None else test["passing_score"],
+            question["text"],
+            question["type"],
+            question["correct_answer_text"],
+            CSV_CHOICE_SEPARATOR.join(c["text"] for c in choices),
+        ])
+
+
+__all__ = [
+    "CSV_COLUMNS",
+    "FORMATS",
+    "import_course",
+    "load_course_document",
+    "parse_course_csv",
+    "stream_course_csv",
+    "stream_course_json",
+    "validate_course_document",
+]
@@ -0,0 +1,311 @@
+"""Monthly range partitioning of attempt history on PostgreSQL.
+
+``courses_usertest`` and ``courses_usertestanswer`` are partitioned by ``attempt_date``
+(one partition per UTC month). Existing tables are converted in place: the old table is
+kept as a single "legacy" partition covering everything before the first monthly
+partition, so no rows are copied. Primary keys become ``(id, attempt_date)`` on the
+database side; Django keeps addressing rows by id.
+
+Old partitions are removed with ``DETACH PARTITION ... CONCURRENTLY``, which only takes
+a brief lock on the parent, so there is deliberately no DEFAULT partition (it would
+rule out concurrent detaches). Run ``manage.py manage_partitions create`` regularly
+(e.g. monthly from cron) so inserts always have a partition to land in.
+"""
+from __future__ import annotations
+
+import datetime
+import re
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+from django.db.models import Max, OuterRef, Subquery
+from django.utils.dateparse import parse_datetime
+
+from courses.models import UserTest, UserTestAnswer
+
+PARTITION_KEY = "attempt_date"
+ARCHIVE_SCHEMA = "archive"
+
+_UPPER_BOUND_RE = re.compile(r"TO \('([^']+)'\)")
+
+
+class PartitioningError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class PartitionInfo:
+    name: str
+    upper_bound: datetime.datetime | None
+
+
+def month_start(value: datetime.date | datetime.datetime) -> datetime.datetime:
+    return datetime.datetime(value.year, value.month, 1, tzinfo=datetime.timezone.utc)
+
+
+def add_months(start: datetime.datetime, months: int) -> datetime.datetime:
+    index = start.year * 12 + (start.month - 1) + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, start: datetime.datetime) -> str:
+    return f"{table}_p{start:%Y%m}"
+
+
+def _bound(value: datetime.datetime) -> str:
+    return f"'{value:%Y-%m-%d %H:%M:%S}+00'"
+
+
+def _q(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def _tables() -> list[tuple[str, str]]:
+    """``(table, pk column)`` pairs; answers first so they are always handled before their attempts."""
+    return [
+        (model._meta.db_table, model._meta.pk.column)
+        for model in (UserTestAnswer, UserTest)
+    ]
+
+
+def ensure_postgresql() -> None:
+    if connection.vendor != "postgresql":
+        raise PartitioningError("Table partitioning requires PostgreSQL")
+
+
+def is_partitioned(table: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [table],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(table: str) -> list[PartitionInfo]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s AND pg_table_is_visible(p.oid) "
+            "ORDER BY c.relname",
+            [table],
+        )
+        rows = cursor.fetchall()
+    partitions = []
+    for name, bound in rows:
+        match = _UPPER_BOUND_RE.search(bound or "")
+        partitions.append(PartitionInfo(name=name, upper_bound=parse_datetime(match.group(1)) if match else None))
+    return partitions
+
+
+def align_answer_attempt_dates(*, user_test_ids=None, chunk_size: int = 10000) -> int:
+    """Copy UserTest.attempt_date onto its answers, in primary-key chunks. Returns rows updated.
+
+    Needed before converting existing data, and after editing an attempt's date outside the API.
+    """
+    attempt_date = Subquery(UserTest.objects.filter(pk=OuterRef("user_test_id")).values("attempt_date")[:1])
+    if user_test_ids is not None:
+        answers = UserTestAnswer.objects.filter(user_test_id__in=user_test_ids)
+        return answers.exclude(attempt_date=attempt_date).update(attempt_date=attempt_date)
+
+    upper = UserTestAnswer.objects.aggregate(top=Max("pk"))["top"] or 0
+    updated = 0
+    for lower in range(0, upper + 1, chunk_size):
+        chunk = UserTestAnswer.objects.filter(pk__gte=lower, pk__lt=lower + chunk_size)
+        # Each chunk commits on its own so long backfills never hold row locks for long
+        with transaction.atomic():
+            updated += chunk.exclude(attempt_date=attempt_date).update(attempt_date=attempt_date)
+    return updated
+
+
+def _create_month_partitions(table: str, first: datetime.datetime, last: datetime.datetime) -> list[str]:
+    created = []
+    start = first
+    with connection.cursor() as cursor:
+        while start <= last:
+            name = partition_name(table, start)
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {_q(name)} PARTITION OF {_q(table)} "
+                f"FOR VALUES FROM ({_bound(start)}) TO ({_bound(add_months(start, 1))})"
+            )
+            created.append(name)
+            start = add_months(start, 1)
+    return created
+
+
+def create_future_partitions(*, months_ahead: int = 3, today: datetime.date | None = None) -> list[str]:
+    """Make sure every month from the current one to ``months_ahead`` later has a partition."""
+    ensure_postgresql()
+    current = month_start(today or datetime.datetime.now(datetime.timezone.utc))
+    created = []
+    for table, _pk in _tables():
+        if not is_partitioned(table):
+            raise PartitioningError(f"{table} is not partitioned yet; run `manage_partitions convert` first")
+        covered = [p.upper_bound for p in list_partitions(table) if p.upper_bound is not None]
+        # Continue right after the last covered month (also filling any months a missed run skipped)
+        first = max(covered) if covered else current
+        created += _create_month_partitions(table, first, add_months(current, months_ahead))
+    return created
+
+
+def _prepare_legacy(table: str, pk: str, boundary: datetime.datetime) -> None:
+    """Online steps before the swap: build the composite unique index and prove the partition bound."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {_q(table + '_part_pk')} "
+            f"ON {_q(table)} ({_q(pk)}, {_q(PARTITION_KEY)})"
+        )
+        check = _q(table + "_legacy_bound")
+        cursor.execute(f"ALTER TABLE {_q(table)} DROP CONSTRAINT IF EXISTS {check}")
+        cursor.execute(
+            f"ALTER TABLE {_q(table)} ADD CONSTRAINT {check} "
+            f"CHECK ({_q(PARTITION_KEY)} IS NOT NULL AND {_q(PARTITION_KEY)} < {_bound(boundary)}) NOT VALID"
+        )
+        # VALIDATE only takes a SHARE UPDATE EXCLUSIVE lock, so writes continue while it scans
+        cursor.execute(f"ALTER TABLE {_q(table)} VALIDATE CONSTRAINT {check}")
+
+
+def _swap_to_partitioned(table: str, pk: str, boundary: datetime.datetime) -> None:
+    """Replace ``table`` by a partitioned table with the old one attached as its legacy partition."""
+    legacy = f"{table}_legacy"
+    sequence = f"{table}_{pk}_seq"
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+
+        cursor.execute(f"SELECT COALESCE(MAX({_q(pk)}), 0) FROM {_q(table)}")
+        next_id = cursor.fetchone()[0] + 1
+
+        cursor.execute(f"ALTER TABLE {_q(table)} RENAME TO {_q(legacy)}")
+        # Ids now come from a sequence owned by the parent; partitions must not carry their own identity
+        cursor.execute(f"ALTER TABLE {_q(legacy)} ALTER COLUMN {_q(pk)} DROP IDENTITY IF EXISTS")
+        cursor.execute(f"ALTER TABLE {_q(legacy)} ALTER COLUMN {_q(pk)} DROP DEFAULT")
+        for name, info in constraints.items():
+            if info["primary_key"]:
+                # The parent's (pk, attempt_date) key can only adopt an index that backs a constraint:
+                # swap the old key for one on the prepared unique index (no rebuild, no scan)
+                cursor.execute(f"ALTER TABLE {_q(legacy)} DROP CONSTRAINT {_q(name)}")
+                cursor.execute(
+                    f"ALTER TABLE {_q(legacy)} ADD CONSTRAINT {_q(table + '_part_pk')} "
+                    f"PRIMARY KEY USING INDEX {_q(table + '_part_pk')}"
+                )
+            elif info["index"] and not info["unique"]:
+                cursor.execute(f"ALTER INDEX {_q(name)} RENAME TO {_q((name + '_legacy')[:63])}")
+
+        cursor.execute(
+            f"CREATE TABLE {_q(table)} (LIKE {_q(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({_q(PARTITION_KEY)})"
+        )
+        cursor.execute(f"ALTER TABLE {_q(table)} DROP CONSTRAINT {_q(table + '_legacy_bound')}")
+        cursor.execute(f"DROP SEQUENCE IF EXISTS {_q(sequence)}")
+        cursor.execute(f"CREATE SEQUENCE {_q(sequence)} START WITH {int(next_id)} OWNED BY {_q(table)}.{_q(pk)}")
+        cursor.execute(f"ALTER TABLE {_q(table)} ALTER COLUMN {_q(pk)} SET DEFAULT nextval('{sequence}')")
+        cursor.execute(
+            f"ALTER TABLE {_q(table)} ADD CONSTRAINT {_q(table + '_pkey')} "
+            f"PRIMARY KEY ({_q(pk)}, {_q(PARTITION_KEY)})"
+        )
+
+        # The validated CHECK lets PostgreSQL skip the scan; the legacy (pk, attempt_date) key is adopted
+        # as the partition's part of the parent's primary key
+        cursor.execute(
+            f"ALTER TABLE {_q(table)} ATTACH PARTITION {_q(legacy)} "
+            f"FOR VALUES FROM (MINVALUE) TO ({_bound(boundary)})"
+        )
+        cursor.execute(f"ALTER TABLE {_q(legacy)} DROP CONSTRAINT {_q(table + '_legacy_bound')}")
+
+        # Recreate indexes and outgoing foreign keys on the parent; PostgreSQL adopts the matching
+        # ones that already exist on the legacy partition instead of rebuilding them
+        for name, info in constraints.items():
+            columns = ", ".join(_q(c) for c in info["columns"])
+            if info["index"] and not info["unique"] and not info["primary_key"] and info.get("type") == "btree":
+                cursor.execute(f"CREATE INDEX {_q(name)} ON {_q(table)} ({columns})")
+            elif info["foreign_key"]:
+                ref_table, ref_column = info["foreign_key"]
+                cursor.execute(
+                    f"ALTER TABLE {_q(table)} ADD CONSTRAINT {_q(name)} FOREIGN KEY ({columns}) "
+                    f"REFERENCES {_q(ref_table)} ({_q(ref_column)}) DEFERRABLE INITIALLY DEFERRED"
+                )
+
+
+def _drop_incoming_foreign_keys(table: str, pk: str) -> None:
+    """Drop constraints referencing ``table.pk``, which stops being unique once partitioned."""
+    with connection.cursor() as cursor:
+        for other, _other_pk in _tables():
+            if other == table:
+                continue
+            for name, info in connection.introspection.get_constraints(cursor, other).items():
+                if info["foreign_key"] == (table, pk):
+                    cursor.execute(f"ALTER TABLE {_q(other)} DROP CONSTRAINT {_q(name)}")
+
+
+def convert_to_partitioned(*, months_ahead: int = 3, chunk_size: int = 10000) -> list[str]:
+    """Convert the attempt tables to monthly partitioning in place. Returns the partitions created.
+
+    Existing rows stay in a legacy partition bounded by the start of next month; the only
+    exclusive lock is held for the catalog-only swap at the end.
+    """
+    ensure_postgresql()
+    pending = [(table, pk) for table, pk in _tables() if not is_partitioned(table)]
+    if not pending:
+        return []
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    latest = UserTest.objects.aggregate(latest=Max("attempt_date"))["latest"] or now
+    boundary = add_months(month_start(max(now, latest)), 1)
+
+    align_answer_attempt_dates(chunk_size=chunk_size)
+    for table, pk in pending:
+        _prepare_legacy(table, pk, boundary)
+
+    with transaction.atomic():
+        for table, pk in pending:
+            _drop_incoming_foreign_keys(table, pk)
+        for table, pk in pending:
+            _swap_to_partitioned(table, pk, boundary)
+        created = []
+        for table, _pk in pending:
+            created += _create_month_partitions(table, boundary, add_months(month_start(now), months_ahead))
+    return created
+
+
+def detach_partitions(*, before: datetime.datetime, drop: bool = False) -> list[str]:
+    """Detach every partition whose rows all predate ``before`` (a month start).
+
+    Detached tables are moved to the ``archive`` schema, or dropped with ``drop=True``.
+    Uses DETACH ... CONCURRENTLY, so this must not run inside a transaction.
+    """
+    ensure_postgresql()
+    detached = []
+    with connection.cursor() as cursor:
+        if not drop:
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {_q(ARCHIVE_SCHEMA)}")
+        for table, _pk in _tables():
+            for partition in list_partitions(table):
+                if partition.upper_bound is None or partition.upper_bound > before:
+                    continue
+                cursor.execute(f"ALTER TABLE {_q(table)} DETACH PARTITION {_q(partition.name)} CONCURRENTLY")
+                if drop:
+                    cursor.execute(f"DROP TABLE {_q(partition.name)}")
+                else:
+                    cursor.execute(f"ALTER TABLE {_q(partition.name)} SET SCHEMA {_q(ARCHIVE_SCHEMA)}")
+                detached.append(partition.name)
+    return detached
+
+
+__all__ = [
+    "PartitioningError",
+    "PartitionInfo",
+    "add_months",
+    "align_answer_attempt_dates",
+    "convert_to_partitioned",
+    "create_future_partitions",
+    "detach_partitions",
+    "ensure_postgresql",
+    "is_partitioned",
+    "list_partitions",
+    "month_start",
+    "partition_name",
+]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from courses.models import Question, QuestionStats, UserTestAnswer
+
+
+def _increment(counts: dict[int, tuple[int, int]]) -> int:
+    if not counts:
+        return 0
+
+    def delta(position: int) -> Case:
+        return Case(
+            *[When(question_id=qid, then=Value(c[position])) for qid, c in counts.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+
+    return QuestionStats.objects.filter(question_id__in=list(counts)).update(
+        attempts=F("attempts") + delta(0),
+        correct_count=F("correct_count") + delta(1),
+        updated_at=timezone.now(),
+    )
+
+
+def record_question_answers(counts: dict[int, tuple[int, int]], budget=None) -> None:
+    """Add ``{question_id: (attempts, correct)}`` to the running stats with one UPDATE.
+
+    Call inside the submission transaction. Rows are created lazily the first time a question
+    is answered, which costs three extra statements (reported to ``budget`` when given).
+    """
+    updated = _increment(counts)
+    if updated == len(counts):
+        return
+    if budget is not None:
+        budget.extend(3)
+    existing = set(QuestionStats.objects.filter(question_id__in=list(counts)).values_list("question_id", flat=True))
+    missing = [qid for qid in counts if qid not in existing]
+    # Zero rows first, then the same F() increment, so a concurrent creator cannot be double counted
+    QuestionStats.objects.bulk_create([QuestionStats(question_id=qid) for qid in missing], ignore_conflicts=True)
+    _increment({qid: counts[qid] for qid in missing})
+
+
+def get_test_difficulty(test_id: int) -> list[dict]:
+    """Per-question stats for a test in question order, read from QuestionStats (one query)."""
+    rows = (
+        Question.objects.filter(test_id=test_id)
+        .order_by("order_index", "question_id")
+        .values("question_id", "order_index", "text", "type", "stats__attempts", "stats__correct_count", "stats__updated_at")
+    )
+    result = []
+    for row in rows:
+        attempts = row["stats__attempts"] or 0
+        correct = row["stats__correct_count"] or 0
+        rate = correct / attempts if attempts else None
+        result.append({
+            "question_id": row["question_id"],
+            "order_index": row["order_index"],
+            "text": row["text"],
+            "type": row["type"],
+            "attempts": attempts,
+            "correct_count": correct,
+            "correct_rate": rate,
+            # Share of answers that were wrong; None until the question has been answered
+            "difficulty": None if rate is None else 1 - rate,
+            "updated_at": row["stats__updated_at"],
+        })
+    return result
+
+
+@transaction.atomic
+def rebuild_question_stats() -> int:
+    """Recompute every row from question-linked answers. Returns the number of rows written."""
+    QuestionStats.objects.all().delete()
+    rows = (
+        UserTestAnswer.objects.filter(question__isnull=False)
+        .values("question_id")
+        .annotate(attempts=Count("user_test_answer_id"), correct=Count("user_test_answer_id", filter=Q(is_correct=True)))
+        .order_by()
+    )
+    stats = [
+        QuestionStats(question_id=row["question_id"], attempts=row["attempts"], correct_count=row["correct"])
+        for row in rows
+    ]
+    QuestionStats.objects.bulk_create(stats, batch_size=1000)
+    return len(stats)
+
+
+__all__ = ["get_test_difficulty", "rebuild_question_stats", "record_question_answers"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from django.db import models, transaction
+from django.db.models import F
+
+from courses.services.content_version import bump_content_version
+
+
+class ReorderError(ValueError):
+    pass
+
+
+@transaction.atomic
+def reorder_children(
+    model: type[models.Model],
+    *,
+    parent_field: str,
+    parent_id: int,
+    ordered_ids: Sequence[int],
+) -> list[tuple[int, int]]:
+    """Apply a full ordering to the children of one parent with a constant number of statements.
+
+    ``ordered_ids`` must list every child exactly once. The children keep their current set of
+    order_index values, reassigned in the new order. Returns ``(id, order_index)`` pairs.
+
+    Statements: lock the children, shift them all above the current maximum (one UPDATE, so the
+    ``(parent, order_index)`` unique constraint never sees a collision), then write the final
+    positions (one bulk UPDATE).
+    """
+    pk_name = model._meta.pk.name
+    siblings = model.objects.select_for_update().filter(**{parent_field: parent_id})
+    current = dict(siblings.values_list(pk_name, "order_index"))
+
+    ids = [int(i) for i in ordered_ids]
+    if len(set(ids)) != len(ids):
+        raise ReorderError("Duplicate ids in ordering")
+    if set(ids) != set(current):
+        missing = sorted(set(current) - set(ids))
+        unknown = sorted(set(ids) - set(current))
+        raise ReorderError(f"Ordering must list every item exactly once (missing: {missing}, unknown: {unknown})")
+    if not ids:
+        return []
+
+    positions = sorted(current.values())
+    target = dict(zip(ids, positions))
+    if target == current:
+        return list(target.items())
+
+    # Phase 1: move everything past the highest index; phase 2: write the final positions
+    shift = max(positions) + 1
+    model.objects.filter(**{parent_field: parent_id}).update(order_index=F("order_index") + shift)
+    model.objects.bulk_update(
+        [model(**{pk_name: pk, "order_index": index}) for pk, index in target.items()],
+        ["order_index"],
+    )
+
+    # bulk_update sends no post_save signals, so invalidate cached content explicitly
+    bump_content_version()
+    return list(target.items())
+
+
+__all__ = ["ReorderError", "reorder_children"]
@@ -0,0 +1,134 @@
+"""Per-learner spaced-repetition queue (SM-2) fed by graded answers.
+
+A wrong answer puts the question in the learner's queue; every later graded answer to it
+reschedules the item. Answers are binary, so they map to fixed SM-2 qualities.
+"""
+from __future__ import annotations
+
+import datetime
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from courses.models import Course, Question, ReviewItem, UserTestAnswer
+
+CORRECT_QUALITY = 4
+WRONG_QUALITY = 1
+MIN_EASE_FACTOR = 1.3
+# SM-2 fixed intervals (days) for the first two successful repetitions
+FIRST_INTERVAL_DAYS = 1
+SECOND_INTERVAL_DAYS = 6
+
+REVIEW_DEFAULT_LIMIT = 20
+REVIEW_MAX_LIMIT = 100
+
+ReviewResult = tuple[int, bool, datetime.datetime]  # (question_id, is_correct, answered_at)
+
+_SCHEDULE_FIELDS = ["ease_factor", "interval_days", "repetitions", "lapses", "due_at", "last_reviewed_at"]
+
+
+def schedule_review(item: ReviewItem, *, is_correct: bool, reviewed_at: datetime.datetime) -> None:
+    """Apply one SM-2 step to ``item`` in place."""
+    quality = CORRECT_QUALITY if is_correct else WRONG_QUALITY
+    if quality < 3:
+        item.repetitions = 0
+        item.lapses += 1
+        item.interval_days = FIRST_INTERVAL_DAYS
+    else:
+        if item.repetitions == 0:
+            item.interval_days = FIRST_INTERVAL_DAYS
+        elif item.repetitions == 1:
+            item.interval_days = SECOND_INTERVAL_DAYS
+        else:
+            item.interval_days = max(1, round(item.interval_days * item.ease_factor))
+        item.repetitions += 1
+    penalty = 5 - quality
+    item.ease_factor = max(MIN_EASE_FACTOR, item.ease_factor + 0.1 - penalty * (0.08 + penalty * 0.02))
+    item.due_at = reviewed_at + datetime.timedelta(days=item.interval_days)
+    item.last_reviewed_at = reviewed_at
+
+
+def record_review_results(user_id: int, results: Iterable[ReviewResult]) -> int:
+    """Update the user's queue from graded answers (oldest first); returns the number of items written.
+
+    One read of the affected items and one upsert; correct answers to questions that are not
+    queued are ignored.
+    """
+    results = sorted(results, key=lambda r: r[2])
+    if not results:
+        return 0
+    question_ids = {qid for qid, _correct, _at in results}
+    items = {
+        item.question_id: item
+        for item in ReviewItem.objects.filter(user_id=user_id, question_id__in=question_ids)
+    }
+    wrong_new = {qid for qid, correct, _at in results if not correct and qid not in items}
+    if wrong_new:
+        # Questions deleted since the attempt was graded cannot be queued
+        wrong_new = set(Question.objects.filter(question_id__in=wrong_new).values_list("question_id", flat=True))
+
+    touched: dict[int, ReviewItem] = {}
+    for qid, is_correct, answered_at in results:
+        item = items.get(qid)
+        if item is None:
+            if qid not in wrong_new:
+                continue
+            item = items[qid] = ReviewItem(user_id=user_id, question_id=qid)
+        schedule_review(item, is_correct=is_correct, reviewed_at=answered_at)
+        touched[qid] = item
+
+    if touched:
+        ReviewItem.objects.bulk_create(
+            list(touched.values()),
+            update_conflicts=True,
+            unique_fields=["user", "question"],
+            update_fields=_SCHEDULE_FIELDS,
+        )
+    return len(touched)
+
+
+def get_due_reviews(user, *, limit: int = REVIEW_DEFAULT_LIMIT, now: datetime.datetime | None = None):
+    """Items due by ``now`` (earliest first) for questions in active courses, with question and choices."""
+    limit = max(1, min(int(limit), REVIEW_MAX_LIMIT))
+    return (
+        ReviewItem.objects.filter(
+            user=user,
+            due_at__lte=now or timezone.now(),
+            question__test__chapter__course__status=Course.Status.ACTIVE,
+        )
+        .select_related("question")
+        .prefetch_related("question__choices")
+        .order_by("due_at", "review_item_id")[:limit]
+    )
+
+
+def rebuild_review_queue() -> int:
+    """Replay every learner's question-linked answer history into a fresh queue. Returns items written."""
+    written = 0
+    user_ids = (
+        UserTestAnswer.objects.filter(question__isnull=False)
+        .values_list("user_test__user_id", flat=True)
+        .distinct()
+        .order_by()
+    )
+    for user_id in list(user_ids):
+        history = (
+            UserTestAnswer.objects.filter(user_test__user_id=user_id, question__isnull=False)
+            .values_list("question_id", "is_correct", "attempt_date")
+        )
+        with transaction.atomic():
+            ReviewItem.objects.filter(user_id=user_id).delete()
+            written += record_review_results(user_id, history)
+    return written
+
+
+__all__ = [
+    "REVIEW_DEFAULT_LIMIT",
+    "REVIEW_MAX_LIMIT",
+    "ReviewResult",
+    "get_due_reviews",
+    "rebuild_review_queue",
+    "record_review_results",
+    "schedule_review",
+]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection, transaction
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Cast
+
+from courses.models import Chapter, Course, Question, SearchDocument, Test
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 50
+
+
+class InvalidSearchCursor(ValueError):
+    pass
+
+
+def _vectors_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def _refresh_vectors(documents) -> None:
+    """Recompute the stored tsvector for ``documents`` in one UPDATE (PostgreSQL only)."""
+    if not _vectors_supported():
+        return
+    config = settings.SEARCH_TEXT_CONFIG
+    documents.update(
+        search_vector=SearchVector("title", weight="A", config=config)
+        + SearchVector("body", weight="B", config=config)
+    )
+
+
+def _document_for(instance) -> SearchDocument | None:
+    """Unsaved SearchDocument describing ``instance``; None when its course cannot be resolved."""
+    if isinstance(instance, Course):
+        return SearchDocument(
+            kind=SearchDocument.Kind.COURSE,
+            object_id=instance.course_id,
+            course_id=instance.course_id,
+            title=instance.title,
+            body=instance.description or "",
+        )
+    if isinstance(instance, Chapter):
+        return SearchDocument(
+            kind=SearchDocument.Kind.CHAPTER,
+            object_id=instance.chapter_id,
+            course_id=instance.course_id,
+            title=instance.title,
+        )
+    if isinstance(instance, Test):
+        course_id = Chapter.objects.filter(pk=instance.chapter_id).values_list("course_id", flat=True).first()
+        kind, object_id, title = SearchDocument.Kind.TEST, instance.test_id, instance.title
+    elif isinstance(instance, Question):
+        course_id = Test.objects.filter(pk=instance.test_id).values_list("chapter__course_id", flat=True).first()
+        kind, object_id, title = SearchDocument.Kind.QUESTION, instance.question_id, instance.text
+    else:
+        raise TypeError(f"Not searchable: {type(instance).__name__}")
+    if course_id is None:
+        return None
+    return SearchDocument(kind=kind, object_id=object_id, course_id=course_id, title=title)
+
+
+def index_object(instance) -> None:
+    """Insert or refresh the search entry for a saved Course/Chapter/Test/Question."""
+    document = _document_for(instance)
+    if document is None:
+        return
+    SearchDocument.objects.update_or_create(
+        kind=document.kind,
+        object_id=document.object_id,
+        defaults={"course_id": document.course_id, "title": document.title, "body": document.body},
+    )
+    _refresh_vectors(SearchDocument.objects.filter(kind=document.kind, object_id=document.object_id))
+
+    # A chapter or test moved to another course takes its descendants' entries along
+    if isinstance(instance, Chapter):
+        test_ids = Test.objects.filter(chapter_id=instance.pk).values("pk")
+        question_ids = Question.objects.filter(test__chapter_id=instance.pk).values("pk")
+        descendants = Q(kind=SearchDocument.Kind.TEST, object_id__in=test_ids) | Q(
+            kind=SearchDocument.Kind.QUESTION, object_id__in=question_ids
+        )
+    elif isinstance(instance, Test):
+        question_ids = Question.objects.filter(test_id=instance.pk).values("pk")
+        descendants = Q(kind=SearchDocument.Kind.QUESTION, object_id__in=question_ids)
+    else:
+        return
+    SearchDocument.objects.filter(descendants).exclude(course_id=document.course_id).update(course_id=document.course_id)
+
+
+def remove_object(kind: str, object_id: int) -> None:
+    SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def _build_documents(course_ids=None) -> list[SearchDocument]:
+    """Documents for every piece of content (optionally limited to some courses), from values() rows."""
+    courses = Course.objects.all()
+    chapters = Chapter.objects.all()
+    tests = Test.objects.all()
+    questions = Question.objects.all()
+    if course_ids is not None:
+        courses = courses.filter(course_id__in=course_ids)
+        chapters = chapters.filter(course_id__in=course_ids)
+        tests = tests.filter(chapter__course_id__in=course_ids)
+        questions = questions.filter(test__chapter__course_id__in=course_ids)
+
+    documents = [
+        SearchDocument(kind=SearchDocument.Kind.COURSE, object_id=pk, course_id=pk, title=title, body=description or "")
+        for pk, title, description in courses.values_list("course_id", "title", "description")
+    ]
+    documents += [
+        SearchDocument(kind=SearchDocument.Kind.CHAPTER, object_id=pk, course_id=course_id, title=title)
+        for pk, course_id, title in chapters.values_list("chapter_id", "course_id", "title")
+    ]
+    documents += [
+        SearchDocument(kind=SearchDocument.Kind.TEST, object_id=pk, course_id=course_id, title=title)
+        for pk, course_id, title in tests.values_list("test_id", "chapter__course_id", "title")
+    ]
+    documents += [
+        SearchDocument(kind=SearchDocument.Kind.QUESTION, object_id=pk, course_id=course_id, title=text)
+        for pk, course_id, text in questions.values_list("question_id", "test__chapter__course_id", "text")
+    ]
+    return documents
+
+
+@transaction.atomic
+def index_course(course_id: int) -> int:
+    """Re-index one course and its content (used after bulk writes that skip save hooks)."""
+    SearchDocument.objects.filter(course_id=course_id).delete()
+    documents = SearchDocument.objects.bulk_create(_build_documents([course_id]), batch_size=1000)
+    _refresh_vectors(SearchDocument.objects.filter(course_id=course_id))
+    return len(documents)
+
+
+@transaction.atomic
+def rebuild_search_index() -> int:
+    """Rebuild every search entry from the content tables. Returns the number of documents."""
+    SearchDocument.objects.all().delete()
+    documents = SearchDocument.objects.bulk_create(_build_documents(), batch_size=1000)
+    _refresh_vectors(SearchDocument.objects.all())
+    return len(documents)
+
+
+def _encode_cursor(rank: float, document_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([rank, document_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        rank, document_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(rank), int(document_id)
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise InvalidSearchCursor("Invalid cursor") from exc
+
+
+def search_content(
+    text: str,
+    *,
+    active_only: bool,
+    kinds: list[str] | None = None,
+    cursor: str | None = None,
+    limit: int = SEARCH_DEFAULT_LIMIT,
+) -> tuple[list[dict], str | None]:
+    """Ranked matches for ``text``, best first; returns ``(results, next_cursor)``.
+
+    Pages are keyset-based on ``(rank, document_id)`` descending, so deep pages cost the same
+    as the first one. ``active_only`` hides content of non-active courses (learner search).
+    """
+    limit = max(1, min(int(limit), SEARCH_MAX_LIMIT))
+    documents = SearchDocument.objects.all()
+    if active_only:
+        documents = documents.filter(course__status=Course.Status.ACTIVE)
+    if kinds:
+        documents = documents.filter(kind__in=kinds)
+
+    if _vectors_supported():
+        query = SearchQuery(text, search_type="websearch", config=settings.SEARCH_TEXT_CONFIG)
+        # Cast to double precision so the cursor value compares exactly on the next page
+        documents = documents.filter(search_vector=query).annotate(
+            rank=Cast(SearchRank(F("search_vector"), query), FloatField())
+        )
+    else:
+        # Plain substring match for non-PostgreSQL development databases (no ranking)
+        documents = documents.filter(Q(title__icontains=text) | Q(body__icontains=text)).annotate(
+            rank=Value(0.0, output_field=FloatField())
+        )
+
+    if cursor:
+        rank, document_id = _decode_cursor(cursor)
+        documents = documents.filter(Q(rank__lt=rank) | Q(rank=rank, document_id__lt=document_id))
+
+    rows = list(
+        documents.order_by("-rank", "-document_id").values(
+            "document_id", "kind", "object_id", "course_id", "title", "body", "rank"
+        )[: limit + 1]
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["rank"], rows[-1]["document_id"])
+
+    results = [
+        {
+            "kind": row["kind"],
+            "id": row["object_id"],
+            "course_id": row["course_id"],
+            "title": row["title"],
+            "snippet": row["body"][:200],
+            "rank": row["rank"],
+        }
+        for row in rows
+    ]
+    return results, next_cursor
+
+
+__all__ = [
+    "InvalidSearchCursor",
+    "SEARCH_DEFAULT_LIMIT",
+    "SEARCH_MAX_LIMIT",
+    "index_course",
+    "index_object",
+    "rebuild_search_index",
+    "remove_object",
+    "search_content",
+]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+
+from courses.models import Question, Test
+from courses.serializers.client.composed.test_bundle import ClientTestBundleSerializer
+
+
+def _cache_key(test_id: int, version: int) -> str:
+    return f"courses:test_bundle:{test_id}:v{version}"
+
+
+def bundle_etag(test_id: int, version: int) -> str:
+    """Strong ETag for a bundle; changes whenever course content is edited."""
+    return f'"test-bundle-{test_id}-v{version}"'
+
+
+def _available_tests():
+    return Test.objects.filter(chapter__course__status="active")
+
+
+def _build_test_bundle(test_id: int) -> dict | None:
+    """Serialize a test with its questions and choices in three queries."""
+    test = _available_tests().select_related("chapter", "chapter__course").filter(test_id=test_id).first()
+    if test is None:
+        return None
+    questions = (
+        Question.objects.filter(test_id=test_id)
+        .prefetch_related("choices")
+        .order_by("order_index", "question_id")
+    )
+    ser = ClientTestBundleSerializer({"test": test, "questions": questions})
+    return ser.data
+
+
+def test_bundle_available(test_id: int, version: int) -> bool:
+    """Whether get_test_bundle() would return a bundle, without building it.
+
+    A bundle cached for ``version`` answers from the cache; otherwise one indexed EXISTS query
+    checks that the test exists and its course is active.
+    """
+    if cache.get(_cache_key(test_id, version)) is not None:
+        return True
+    return _available_tests().filter(test_id=test_id).exists()
+
+
+def get_test_bundle(test_id: int, version: int) -> dict | None:
+    """Return the serialized bundle for the given content version, or None if the test is not available."""
+    key = _cache_key(test_id, version)
+    bundle = cache.get(key)
+    if bundle is None:
+        bundle = _build_test_bundle(test_id)
+        if bundle is None:
+            return None
+        cache.set(key, bundle, settings.TEST_BUNDLE_CACHE_TIMEOUT)
+    return bundle
+
+
+__all__ = ["bundle_etag", "get_test_bundle", "test_bundle_available"]
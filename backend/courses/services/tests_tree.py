@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import serializers
+
+from courses.models import Chapter, Course, Test, UserTestProgress
+from courses.services.content_version import get_content_version
+
+CLIENT_SCOPE = "client"
+ADMIN_SCOPE = "admin"
+
+
+def _cache_key(scope: str, version: int) -> str:
+    return f"courses:tests_tree:{scope}:v{version}"
+
+
+# DRF-compatible datetime rendering for values() rows
+_datetime_field = serializers.DateTimeField()
+
+CLIENT_COURSE_FIELDS = ("course_id", "title", "description", "status")
+ADMIN_COURSE_FIELDS = (
+    "course_id",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "updated_by",
+    "created_by__username",
+    "updated_by__username",
+)
+CHAPTER_FIELDS = ("chapter_id", "course_id", "title", "description", "learning_resource_url", "order_index")
+TEST_FIELDS = ("test_id", "chapter_id", "passing_score", "order_index", "title")
+
+
+def assemble_flat_tree(course_rows, chapter_rows, test_rows) -> list[dict]:
+    """Stitch ordered course/chapter/test rows into the flat tree in a single pass.
+
+    Each argument is an iterable of ``(parent_id, own_id, payload)`` tuples (``parent_id`` is
+    ignored for courses) already sorted in display order. Courses without chapters and
+    chapters without tests are kept as items with ``None`` children.
+    """
+    tests_by_chapter: dict[int, list[dict]] = defaultdict(list)
+    for chapter_id, _test_id, test in test_rows:
+        tests_by_chapter[chapter_id].append(test)
+
+    chapters_by_course: dict[int, list[tuple[int, dict]]] = defaultdict(list)
+    for course_id, chapter_id, chapter in chapter_rows:
+        chapters_by_course[course_id].append((chapter_id, chapter))
+
+    flat_items = []
+    for _parent, course_id, course in course_rows:
+        chapters = chapters_by_course.get(course_id)
+        if not chapters:
+            flat_items.append({"course": course, "chapter": None, "test": None})
+            continue
+        for chapter_id, chapter in chapters:
+            tests = tests_by_chapter.get(chapter_id)
+            if not tests:
+                flat_items.append({"course": course, "chapter": chapter, "test": None})
+                continue
+            for test in tests:
+                flat_items.append({"course": course, "chapter": chapter, "test": test})
+    return flat_items
+
+
+def _fetch_tree_rows(course_filter: dict, course_fields: tuple[str, ...]):
+    """Run the three ordered values() queries backing a tree (no model instances are built)."""
+    courses = (
+        Course.objects.filter(**course_filter)
+        .order_by("course_id")
+        .values(*course_fields)
+    )
+    chapters = (
+        Chapter.objects.filter(**{f"course__{k}": v for k, v in course_filter.items()})
+        .order_by("course_id", "order_index", "chapter_id")
+        .values(*CHAPTER_FIELDS)
+    )
+    tests = (
+        Test.objects.filter(**{f"chapter__course__{k}": v for k, v in course_filter.items()})
+        .order_by("chapter_id", "order_index", "test_id")
+        .values(*TEST_FIELDS)
+    )
+    return courses, chapters, tests
+
+
+def _test_payload(row: dict) -> dict:
+    return {
+        "test_id": row["test_id"],
+        "passing_score": row["passing_score"],
+        "order_index": row["order_index"],
+        "title": row["title"],
+    }
+
+
+def _build_client_tree() -> list[dict]:
+    courses, chapters, tests = _fetch_tree_rows({"status": Course.Status.ACTIVE}, CLIENT_COURSE_FIELDS)
+    return assemble_flat_tree(
+        ((None, row["course_id"], row) for row in courses),
+        ((row["course_id"], row["chapter_id"], row) for row in chapters),
+        ((row["chapter_id"], row["test_id"], _test_payload(row)) for row in tests),
+    )
+
+
+def _admin_course_payload(row: dict) -> dict:
+    payload = {
+        "course_id": row["course_id"],
+        "title": row["title"],
+        "description": row["description"],
+        "status": row["status"],
+        "created_at": _datetime_field.to_representation(row["created_at"]),
+        "updated_at": _datetime_field.to_representation(row["updated_at"]),
+        "created_by": row["created_by"],
+        "updated_by": row["updated_by"],
+    }
+    # Matches AdminCourseSerializer, which omits the usernames when the user is unset
+    if row["created_by__username"] is not None:
+        payload["created_by_username"] = row["created_by__username"]
+    if row["updated_by__username"] is not None:
+        payload["updated_by_username"] = row["updated_by__username"]
+    return payload
+
+
+def _admin_chapter_payload(row: dict) -> dict:
+    return {
+        "chapter_id": row["chapter_id"],
+        "course": row["course_id"],
+        "title": row["title"],
+        "description": row["description"],
+        "learning_resource_url": row["learning_resource_url"],
+        "order_index": row["order_index"],
+    }
+
+
+def _build_admin_tree() -> list[dict]:
+    courses, chapters, tests = _fetch_tree_rows({}, ADMIN_COURSE_FIELDS)
+    return assemble_flat_tree(
+        ((None, row["course_id"], _admin_course_payload(row)) for row in courses),
+        ((row["course_id"], row["chapter_id"], _admin_chapter_payload(row)) for row in chapters),
+        ((row["chapter_id"], row["test_id"], _test_payload(row)) for row in tests),
+    )
+
+
+def _get_cached_tree(scope: str, builder) -> list[dict]:
+    """Return the serialized tree for the current content version, building it on a miss."""
+    key = _cache_key(scope, get_content_version())
+    items = cache.get(key)
+    if items is None:
+        items = builder()
+        cache.set(key, items, settings.TESTS_TREE_CACHE_TIMEOUT)
+    return items
+
+
+def _apply_statuses(items: Iterable[dict], best_scores: dict[int, int]) -> List[dict]:
+    """Layer per-user status on top of the shared tree, with at most one global active test."""
+    result = []
+    active_assigned = False
+    for item in items:
+        test = item.get("test")
+        if test is None:
+            status = None
+        else:
+            max_score = best_scores.get(test["test_id"], 0)
+            passing = test["passing_score"] if test["passing_score"] is not None else 0
+            if max_score > passing:
+                status = "passed"
+            elif not active_assigned:
+                status = "active"
+                active_assigned = True
+            else:
+                status = "locked"
+        # Copy so the cached tree is never mutated with per-user data
+        result.append({**item, "status": status})
+    return result
+
+
+def get_client_tests_tree(user) -> List[dict]:
+    """Flat tree of active content with the user's status for each test."""
+    items = _get_cached_tree(CLIENT_SCOPE, _build_client_tree)
+
+    # Best scores come from the materialized progress rows (one indexed lookup per user)
+    best_scores = dict(
+        UserTestProgress.objects.filter(user=user).values_list("test_id", "best_score")
+    )
+
+    return _apply_statuses(items, best_scores)
+
+
+def get_admin_tests_tree() -> List[dict]:
+    """Flat tree of all content (any course status)."""
+    return _get_cached_tree(ADMIN_SCOPE, _build_admin_tree)
+
+
+__all__ = ["assemble_flat_tree", "get_client_tests_tree", "get_admin_tests_tree"]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from django.db import transaction
+
+from courses.models import Question, UserTest, UserTestAnswer
+from courses.services.answer_key import AnswerKey, load_answer_key, normalize_answer
+from courses.services.content_version import get_content_version
+
+
+def _candidates(answer: UserTestAnswer, question_ids: list[int], key: AnswerKey) -> set[int]:
+    """Questions ``answer`` could have been given for: it re-grades to the stored correctness and,
+    for MCQ questions, its text is one of the question's choices."""
+    normalized = normalize_answer(answer.given_answer_text)
+    return {
+        qid
+        for qid in question_ids
+        if key.is_correct(qid, answer.given_answer_text) == answer.is_correct
+        and (qid not in key.choices or normalized in key.choices[qid])
+    }
+
+
+def _pair_with_questions(answers: list[UserTestAnswer], question_ids: list[int], key: AnswerKey) -> bool:
+    """Link an attempt's answers to its test's questions; False (nothing changed) unless the pairing is unambiguous.
+
+    Historical answers carry no question reference, and their insertion order is the order the
+    client sent them, which need not be question order. So order is ignored: each answer gets the
+    questions it is consistent with, answers with a single candidate claim it, and claimed
+    questions are removed from the others until every answer is settled. Attempts where two
+    pairings remain possible (e.g. several wrong fill-in answers) are skipped. Attempts with fewer
+    answers than questions (the client left some out) go through the same process; the questions
+    no answer settles on simply stay unanswered.
+
+    Only question and choice are set. The stored text is kept even when a choice matches: the
+    pairing is inferred, not recorded, and the text is what lets it be checked or redone.
+    """
+    if len(answers) > len(question_ids):
+        return False
+    candidates = {index: _candidates(answer, question_ids, key) for index, answer in enumerate(answers)}
+    assigned: dict[int, int] = {}
+    while candidates:
+        settled = {index: next(iter(qids)) for index, qids in candidates.items() if len(qids) == 1}
+        if not settled or len(set(settled.values())) != len(settled):
+            # No forced answer left, or two answers forced onto one question
+            return False
+        assigned.update(settled)
+        for index in settled:
+            del candidates[index]
+        taken = set(settled.values())
+        for qids in candidates.values():
+            qids -= taken
+    for index, qid in assigned.items():
+        answer = answers[index]
+        answer.question_id = qid
+        answer.choice_id, _ = key.encode(qid, answer.given_answer_text)
+    return True
+
+
+def backfill_answer_links(*, chunk_size: int = 500) -> tuple[int, int]:
+    """Set question/choice on answers stored before they were recorded, one chunk of attempts at a time.
+
+    MCQ answers that match a choice also get it; the original text is never rewritten. Returns
+    ``(answers_linked, attempts_skipped)``; skipped attempts are left unchanged.
+    """
+    version = get_content_version()
+    questions_by_test: dict[int, list[int]] = {}
+    keys_by_test: dict[int, AnswerKey] = {}
+    linked = skipped = 0
+    last_user_test_id = 0
+
+    while True:
+        user_test_ids = list(
+            UserTestAnswer.objects.filter(question__isnull=True, user_test_id__gt=last_user_test_id)
+            .order_by("user_test_id")
+            .values_list("user_test_id", flat=True)
+            .distinct()[:chunk_size]
+        )
+        if not user_test_ids:
+            break
+        last_user_test_id = user_test_ids[-1]
+
+        test_of = dict(UserTest.objects.filter(pk__in=user_test_ids).values_list("user_test_id", "test_id"))
+        for test_id in set(test_of.values()) - set(questions_by_test):
+            questions_by_test[test_id] = list(
+                Question.objects.filter(test_id=test_id)
+                .order_by("order_index", "question_id")
+                .values_list("question_id", flat=True)
+            )
+            keys_by_test[test_id] = load_answer_key(test_id, version)
+
+        answers_by_attempt: dict[int, list[UserTestAnswer]] = {}
+        for answer in UserTestAnswer.objects.filter(
+            user_test_id__in=user_test_ids, question__isnull=True
+        ).order_by("user_test_id", "user_test_answer_id"):
+            answers_by_attempt.setdefault(answer.user_test_id, []).append(answer)
+
+        updated: list[UserTestAnswer] = []
+        for user_test_id, answers in answers_by_attempt.items():
+            test_id = test_of.get(user_test_id)
+            if test_id is not None and _pair_with_questions(
+                answers, questions_by_test[test_id], keys_by_test[test_id]
+            ):
+                updated.extend(answers)
+            else:
+                skipped += 1
+
+        # One short transaction per chunk so the backfill can run next to live traffic
+        with transaction.atomic():
+            UserTestAnswer.objects.bulk_update(updated, ["question", "choice"])
+        linked += len(updated)
+
+    return linked, skipped
+
+
+__all__ = ["backfill_answer_links"]
@@ -0,0 +1,176 @@
+"""Materialized per-user test progress (UserTestProgress), folded in as attempts are graded.
+
+Every reader (tests tree statuses, first-attempt vs practice on submit, achievements) reads
+these rows only, so they must cover all UserTest history. backfill_user_test_progress() fills
+in the pairs that have history but no row; it runs after every ``manage.py migrate``
+(post_migrate, see courses.apps), which is how existing history is materialized on deploy.
+"""
+from __future__ import annotations
+
+import datetime
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, Max, Min, OuterRef, Q, Value
+from django.db.models.functions import Coalesce
+
+from courses.models import Test, UserTest, UserTestProgress
+
+
+_PROGRESS_FIELDS = ("best_score", "attempt_count", "first_passed_at", "last_attempt_at")
+
+
+def _has_passed(score: int, test: Test) -> bool:
+    # Same rule as the tests tree: strictly above the passing score (unset counts as 0)
+    passing = test.passing_score if test.passing_score is not None else 0
+    return score > passing
+
+
+def get_locked_progress(*, user, test_id: int) -> UserTestProgress | None:
+    """Return the user's progress row for the test, locked for the current transaction."""
+    return UserTestProgress.objects.select_for_update().filter(user=user, test_id=test_id).first()
+
+
+def _fold_attempt(progress: UserTestProgress, *, score: int, passed: bool, attempted_at: datetime.datetime) -> None:
+    progress.best_score = max(progress.best_score, score)
+    progress.attempt_count += 1
+    if passed and (progress.first_passed_at is None or attempted_at < progress.first_passed_at):
+        progress.first_passed_at = attempted_at
+    if progress.last_attempt_at is None or attempted_at > progress.last_attempt_at:
+        progress.last_attempt_at = attempted_at
+
+
+def _fold_attempts(progress: UserTestProgress, test: Test, attempts) -> None:
+    for score, attempted_at in attempts:
+        _fold_attempt(progress, score=score, passed=_has_passed(score, test), attempted_at=attempted_at)
+
+
+def record_attempts(
+    *,
+    user,
+    test: Test,
+    attempts: list[tuple[int, datetime.datetime]],
+    progress: UserTestProgress | None = None,
+) -> UserTestProgress:
+    """Fold graded ``(score, attempted_at)`` attempts into the user's progress row with one write.
+
+    Pass the row returned by get_locked_progress() to avoid re-reading it; the row is
+    created on the user's first attempt.
+    """
+    if progress is None:
+        fresh = UserTestProgress(user=user, test=test)
+        _fold_attempts(fresh, test, attempts)
+        progress, created = UserTestProgress.objects.get_or_create(
+            user=user,
+            test=test,
+            defaults={field: getattr(fresh, field) for field in _PROGRESS_FIELDS},
+        )
+        if created:
+            return progress
+        # Lost a race with a concurrent first attempt: fold onto the row that won
+        progress = get_locked_progress(user=user, test_id=test.test_id)
+    _fold_attempts(progress, test, attempts)
+    progress.save(update_fields=list(_PROGRESS_FIELDS))
+    return progress
+
+
+def record_attempt(
+    *,
+    user,
+    test: Test,
+    score: int,
+    attempted_at: datetime.datetime,
+    progress: UserTestProgress | None = None,
+) -> UserTestProgress:
+    """Fold a single graded attempt into the user's progress row."""
+    return record_attempts(user=user, test=test, attempts=[(score, attempted_at)], progress=progress)
+
+
+def _aggregate_history(qs):
+    """Group UserTest rows per (user, test) into the fields stored on UserTestProgress."""
+    return (
+        qs.values("user_id", "test_id")
+        .annotate(
+            best_score=Max("score_count"),
+            attempt_count=Count("user_test_id"),
+            first_passed_at=Min(
+                "attempt_date",
+                filter=Q(score_count__gt=Coalesce(F("test__passing_score"), Value(0))),
+            ),
+            last_attempt_at=Max("attempt_date"),
+        )
+        .order_by()
+    )
+
+
+@transaction.atomic
+def refresh_user_test_progress(*, user_id: int, test_id: int) -> None:
+    """Recompute one progress row from UserTest history (used after admin edits)."""
+    rows = list(_aggregate_history(UserTest.objects.filter(user_id=user_id, test_id=test_id)))
+    if not rows:
+        UserTestProgress.objects.filter(user_id=user_id, test_id=test_id).delete()
+        return
+    row = rows[0]
+    UserTestProgress.objects.update_or_create(
+        user_id=user_id,
+        test_id=test_id,
+        defaults={
+            "best_score": row["best_score"] or 0,
+            "attempt_count": row["attempt_count"],
+            "first_passed_at": row["first_passed_at"],
+            "last_attempt_at": row["last_attempt_at"],
+        },
+    )
+
+
+def _write_history(history, batch_size: int, **bulk_options) -> int:
+    batch: list[UserTestProgress] = []
+    written = 0
+    for row in history.iterator(chunk_size=batch_size):
+        batch.append(
+            UserTestProgress(
+                user_id=row["user_id"],
+                test_id=row["test_id"],
+                best_score=row["best_score"] or 0,
+                attempt_count=row["attempt_count"],
+                first_passed_at=row["first_passed_at"],
+                last_attempt_at=row["last_attempt_at"],
+            )
+        )
+        if len(batch) >= batch_size:
+            UserTestProgress.objects.bulk_create(batch, **bulk_options)
+            written += len(batch)
+            batch = []
+    if batch:
+        UserTestProgress.objects.bulk_create(batch, **bulk_options)
+        written += len(batch)
+    return written
+
+
+@transaction.atomic
+def rebuild_user_test_progress(batch_size: int = 1000) -> int:
+    """Rebuild every progress row from UserTest history. Returns the number of rows written."""
+    UserTestProgress.objects.all().delete()
+    return _write_history(_aggregate_history(UserTest.objects.all()), batch_size)
+
+
+@transaction.atomic
+def backfill_user_test_progress(batch_size: int = 1000) -> int:
+    """Create the progress rows missing for (user, test) pairs with UserTest history.
+
+    Existing rows are left alone, so this is cheap to repeat once the table is complete.
+    Returns the number of rows created.
+    """
+    materialized = UserTestProgress.objects.filter(user_id=OuterRef("user_id"), test_id=OuterRef("test_id"))
+    missing = UserTest.objects.filter(~Exists(materialized))
+    # A submission racing the backfill may create the same row first; keep that one
+    return _write_history(_aggregate_history(missing), batch_size, ignore_conflicts=True)
+
+
+__all__ = [
+    "backfill_user_test_progress",
+    "get_locked_progress",
+    "record_attempt",
+    "record_attempts",
+    "refresh_user_test_progress",
+    "rebuild_user_test_progress",
+]
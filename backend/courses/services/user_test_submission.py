@@ -1,20 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 import datetime
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from django.db import transaction
 from django.utils import timezone
 
-from courses.models import Test, Question, UserTest, UserTestAnswer
+from courses.jobs import SUBMISSION_SIDE_EFFECTS_JOB, submission_side_effects_payload
+from courses.models import Test, UserTest, UserTestAnswer, UserTestProgress
+from courses.services.answer_key import AnswerKey, answer_key_cache, get_answer_key
+from courses.services.content_version import get_content_version
+from courses.services.question_stats import record_question_answers
+from courses.services.user_test_progress import get_locked_progress, record_attempt, record_attempts
 from common.constants import (
     XP_AWARD_PER_TEST,
     XP_AWARD_PER_PRACTICE,
     ENERGY_COST_PER_TEST,
     ENERGY_COST_PER_PRACTICE,
+    BATCH_SUBMISSION_MAX_AGE,
+    SUBMISSION_QUERY_BUDGET,
 )
-from gameinfo.models import UserGameInfos
+from common.query_budget import QueryBudget
+from common.utils import get_user_active_subscription, get_xp_boost_multiplier_for_subscription
+from jobs.queue import enqueue
 from streaks.models import DailyStreak
 
 
@@ -36,120 +46,181 @@ class SubmissionResult:
     streak_created: bool
 
 
-def _normalize_answer(text: str) -> str:
-    if text is None:
-        return ""
-    return str(text).strip().casefold()
+@dataclass
+class SubmissionAttempt:
+    test_id: int
+    duration: int
+    answers: List[SubmissionAnswer]
+    # Client-side time of the attempt (offline replays); defaults to the server time
+    attempted_at: datetime.datetime | None = None
 
 
-@transaction.atomic
-def submit_user_test(
-    *,
-    user,
-    test_id: int,
-    duration: int,
-    answers: Iterable[SubmissionAnswer],
-) -> SubmissionResult:
-    """Create a UserTest with answers, update daily streak, energy and XP.
+@dataclass
+class BatchAttemptResult:
+    index: int
+    user_test: UserTest | None = None
+    total_questions: int = 0
+    answered_count: int = 0
+    correct_count: int = 0
+    xp_awarded: int = 0
+    energy_spent: int = 0
+    error: str | None = None
 
-    Assumptions:
-    - Energy cost per submission = 1.
-    - XP = 10 per correct answer (before premium multiplier); multiplier applied in add_xp().
-    - Only accepts questions that belong to the given test; unknown question_ids are ignored with error.
-    """
 
-    # Validate and fetch test (must be in an active course)
-    test = (
-        Test.objects.select_related("chapter", "chapter__course")
-        .filter(test_id=test_id, chapter__course__status="active")
-        .first()
-    )
-    if not test:
-        raise ValueError("Invalid test_id or test not active")
+@dataclass
+class BatchSubmissionResult:
+    attempts: List[BatchAttemptResult]
+    xp_awarded: int = 0
+    energy_spent: int = 0
+    streak_dates_created: List[datetime.date] = field(default_factory=list)
 
-    # First attempt vs practice (redo): if user already has any submission for this test, treat as practice
-    is_practice = UserTest.objects.filter(user=user, test_id=test_id).exists()
 
-    # Fetch questions for the test
-    questions = (
-        Question.objects.filter(test_id=test_id)
-        .only("question_id", "correct_answer_text")
-        .order_by("order_index", "question_id")
-    )
-    question_map = {q.question_id: q for q in questions}
-    total_questions = questions.count()
+# (question_id, choice_id, given_text, is_correct)
+PreparedAnswer = Tuple[int, Optional[int], Optional[str], bool]
+
+
+def _grade_answers(answer_key: AnswerKey, answers: Iterable[SubmissionAnswer]) -> tuple[list[PreparedAnswer], int]:
+    """Validate answers against the key; returns ``(prepared, correct_count)``.
 
-    # Validate incoming answers
+    ``prepared`` holds ``(question_id, choice_id, given_text, is_correct)`` tuples, encoded as
+    they are stored (a choice reference for MCQ, free text otherwise). Raises ValueError for
+    unknown or duplicate question ids.
+    """
     seen: set[int] = set()
-    prepared: list[tuple[int, str, bool]] = []  # (question_id, given_text, is_correct)
+    prepared: list[PreparedAnswer] = []
     correct_count = 0
-
     for a in answers:
         qid = int(getattr(a, "question_id", None))
         given = str(getattr(a, "answer_text", "") or "")
-        if not qid or qid not in question_map:
+        if not qid or qid not in answer_key.answers:
             raise ValueError(f"Invalid question_id: {qid}")
         if qid in seen:
             raise ValueError(f"Duplicate answer for question_id: {qid}")
         seen.add(qid)
-        q = question_map[qid]
-        is_correct = _normalize_answer(given) == _normalize_answer(q.correct_answer_text)
+        is_correct = answer_key.is_correct(qid, given)
         if is_correct:
             correct_count += 1
-        prepared.append((qid, given, is_correct))
-
-    # Create the user test first (we'll update with scoring fields below)
-    user_test = UserTest.objects.create(user=user, test=test, time_spent=max(0, int(duration or 0)))
-
-    # Persist answers (model doesn't store question reference; store text + correctness only)
-    uta_list: list[UserTestAnswer] = []
-    for _qid, given_text, is_correct in prepared:
-        uta_list.append(UserTestAnswer(user_test=user_test, given_answer_text=given_text, is_correct=is_correct))
-    if uta_list:
-        UserTestAnswer.objects.bulk_create(uta_list)
-        # Reload with IDs
-        uta_list = list(UserTestAnswer.objects.filter(user_test=user_test).order_by("user_test_answer_id"))
-
-    # Daily streak: ensure today is marked
-    today = datetime.date.today()
-    print(today)
-    _, streak_created = DailyStreak.objects.get_or_create(user=user, daily_streak_date=today)
-
-    # Energy and XP updates
-    gameinfo, _ = UserGameInfos.objects.select_for_update().get_or_create(user=user)
-    # Apply passive regen before spending
-    try:
-        gameinfo.apply_passive_energy_regen()
-    except Exception:
-        pass
-    # Spend energy according to attempt type
-    energy_spent = ENERGY_COST_PER_PRACTICE if is_practice else ENERGY_COST_PER_TEST
-    try:
-        gameinfo.decrement_energy(energy_spent)
-    except Exception:
-        pass
-
-    # Award XP according to attempt type
-    xp_awarded = XP_AWARD_PER_PRACTICE if is_practice else XP_AWARD_PER_TEST
-    if xp_awarded:
-        try:
-            xp_awarded = gameinfo.add_xp(xp_awarded)
-        except Exception:
-            pass
+        choice_id, text = answer_key.encode(qid, given)
+        prepared.append((qid, choice_id, text, is_correct))
+    return prepared, correct_count
+
 
-    # Update scoring fields on the created user_test
+def _score_percentage(correct_count: int, total_questions: int) -> int:
     # Use total number of questions in the test for percentage; avoid division by zero
-    percentage = 0
-    if total_questions > 0:
-        percentage = int(round((correct_count / total_questions) * 100))
-    # Persist computed fields
-    UserTest.objects.filter(pk=user_test.pk).update(
-        correct_answer_count=correct_count,
-        score_count=percentage,
-    )
-    # Refresh instance values
-    user_test.correct_answer_count = correct_count
-    user_test.score_count = percentage
+    if total_questions <= 0:
+        return 0
+    return int(round((correct_count / total_questions) * 100))
+
+
+@transaction.atomic
+def submit_user_test(
+    *,
+    user,
+    test_id: int,
+    duration: int,
+    answers: Iterable[SubmissionAnswer],
+) -> SubmissionResult:
+    """Grade and store a UserTest with its answers; streak, energy and XP are queued.
+
+    - First attempt at a test awards XP_AWARD_PER_TEST and costs ENERGY_COST_PER_TEST;
+      later attempts are practice (XP_AWARD_PER_PRACTICE / ENERGY_COST_PER_PRACTICE).
+    - Premium XP multiplier comes from a single subscription lookup.
+    - Only accepts questions that belong to the given test; unknown question_ids raise ValueError.
+    - Marking today's streak, settling energy/XP and rescheduling the learner's review queue
+      run in a background job that commits with the attempt, so the gameinfo row is never
+      locked by the request. The returned xp_awarded/energy_spent/streak_created describe
+      what that job applies.
+
+    Query budget (SUBMISSION_QUERY_BUDGET):
+      1. test lookup                       6. UPDATE question stats
+      2. content version                   7. today's streak lookup
+      3. lock progress row                 8. active subscription
+      4. INSERT user test (scores set)     9. UPDATE progress
+      5. bulk INSERT answers (RETURNING)  10. INSERT side-effects job
+    A cold answer key (question query) and a first attempt at the test (progress insert)
+    each add one statement; questions answered for the first time ever add three.
+    """
+    with QueryBudget(SUBMISSION_QUERY_BUDGET, "submit_user_test") as budget:
+        # Validate and fetch test (must be in an active course)
+        test = (
+            Test.objects.select_related("chapter", "chapter__course")
+            .filter(test_id=test_id, chapter__course__status="active")
+            .first()
+        )
+        if not test:
+            raise ValueError("Invalid test_id or test not active")
+
+        # Pre-normalized answer key (served from the in-process cache when warm)
+        version = get_content_version()
+        answer_key = answer_key_cache.get(test_id, version)
+        if answer_key is None:
+            budget.extend(1)
+            answer_key = get_answer_key(test_id, version)
+        total_questions = answer_key.total_questions
+
+        # First attempt vs practice (redo): if user already has any submission for this test, treat as practice.
+        # The progress row is locked so concurrent submissions for the same test are serialized.
+        progress = get_locked_progress(user=user, test_id=test_id)
+        is_practice = progress is not None and progress.attempt_count > 0
+
+        # Grade before inserting so the attempt is written once with its final scores
+        prepared, correct_count = _grade_answers(answer_key, answers)
+        percentage = _score_percentage(correct_count, total_questions)
+        user_test = UserTest.objects.create(
+            user=user,
+            test=test,
+            time_spent=max(0, int(duration or 0)),
+            correct_answer_count=correct_count,
+            score_count=percentage,
+        )
+
+        # Persist answers; bulk_create returns primary keys on PostgreSQL so no reload is needed
+        uta_list = [
+            UserTestAnswer(
+                user_test=user_test,
+                attempt_date=user_test.attempt_date,
+                question_id=qid,
+                choice_id=choice_id,
+                given_answer_text=given_text,
+                is_correct=is_correct,
+            )
+            for qid, choice_id, given_text, is_correct in prepared
+        ]
+        if uta_list:
+            UserTestAnswer.objects.bulk_create(uta_list)
+            record_question_answers({qid: (1, int(is_correct)) for qid, _c, _t, is_correct in prepared}, budget)
+
+        # Daily streak: today (in the active time zone, like batch attempt days) is marked by the
+        # side-effects job unless it already is
+        today = timezone.localdate(user_test.attempt_date)
+        streak_created = not DailyStreak.objects.filter(user=user, daily_streak_date=today).exists()
+
+        subscription = get_user_active_subscription(user)
+        energy_spent = ENERGY_COST_PER_PRACTICE if is_practice else ENERGY_COST_PER_TEST
+        base_xp = XP_AWARD_PER_PRACTICE if is_practice else XP_AWARD_PER_TEST
+        xp_awarded = int(round(base_xp * get_xp_boost_multiplier_for_subscription(subscription)))
+
+        # Keep the materialized per-user progress in step with the new attempt
+        if progress is None:
+            budget.extend(1)
+        record_attempt(
+            user=user,
+            test=test,
+            score=percentage,
+            attempted_at=user_test.attempt_date,
+            progress=progress,
+        )
+
+        enqueue(
+            SUBMISSION_SIDE_EFFECTS_JOB,
+            submission_side_effects_payload(
+                user_id=user.pk,
+                streak_dates=[today] if streak_created else [],
+                energy_cost=energy_spent,
+                xp_amount=xp_awarded,
+                review_results=[(qid, is_correct, user_test.attempt_date) for qid, _c, _t, is_correct in prepared],
+            ),
+        )
 
     return SubmissionResult(
         user_test=user_test,
@@ -161,3 +232,142 @@ def submit_user_test(
         energy_spent=energy_spent,
         streak_created=streak_created,
     )
+
+
+@transaction.atomic
+def submit_user_test_batch(*, user, attempts: Sequence[SubmissionAttempt]) -> BatchSubmissionResult:
+    """Grade several queued (offline) attempts in one transaction.
+
+    - Attempts are applied in client time order, so the first attempt at a never-tried test
+      is the graded one and later attempts at it count as practice.
+    - Invalid attempts are reported individually and do not block the rest of the batch.
+    - UserTest/UserTestAnswer rows are bulk-inserted; question stats are incremented with
+      one UPDATE and progress is written once per test;
+      streak days, energy and XP are queued as one side-effects job for the whole batch.
+    - Client timestamps in the future are clamped to now; older than BATCH_SUBMISSION_MAX_AGE is rejected.
+    """
+    now = timezone.now()
+    oldest_allowed = now - BATCH_SUBMISSION_MAX_AGE
+    results = [BatchAttemptResult(index=i) for i in range(len(attempts))]
+
+    test_ids = {int(a.test_id) for a in attempts}
+    tests = {
+        t.test_id: t
+        for t in Test.objects.select_related("chapter", "chapter__course").filter(
+            test_id__in=test_ids, chapter__course__status="active"
+        )
+    }
+    # Lock every progress row the batch touches so concurrent submissions are serialized
+    progress_by_test = {
+        p.test_id: p
+        for p in UserTestProgress.objects.select_for_update().filter(user=user, test_id__in=list(tests))
+    }
+    version = get_content_version()
+    subscription = get_user_active_subscription(user)
+    multiplier = get_xp_boost_multiplier_for_subscription(subscription)
+
+    def attempted_at_of(a: SubmissionAttempt) -> datetime.datetime:
+        return min(a.attempted_at or now, now)
+
+    order = sorted(range(len(attempts)), key=lambda i: attempted_at_of(attempts[i]))
+    attempted_tests = {tid for tid, p in progress_by_test.items() if p.attempt_count > 0}
+    graded: list[tuple[int, UserTest, list[PreparedAnswer]]] = []
+    scores_by_test: dict[int, list[tuple[int, datetime.datetime]]] = defaultdict(list)
+
+    for i in order:
+        attempt, result = attempts[i], results[i]
+        test = tests.get(int(attempt.test_id))
+        attempted_at = attempted_at_of(attempt)
+        if test is None:
+            result.error = "Invalid test_id or test not active"
+            continue
+        if attempted_at < oldest_allowed:
+            result.error = "Attempt is too old to be submitted"
+            continue
+        answer_key = get_answer_key(test.test_id, version)
+        try:
+            prepared, correct_count = _grade_answers(answer_key, attempt.answers)
+        except ValueError as exc:
+            result.error = str(exc)
+            continue
+
+        is_practice = test.test_id in attempted_tests
+        attempted_tests.add(test.test_id)
+        percentage = _score_percentage(correct_count, answer_key.total_questions)
+        user_test = UserTest(
+            user=user,
+            test=test,
+            attempt_date=attempted_at,
+            time_spent=max(0, int(attempt.duration or 0)),
+            correct_answer_count=correct_count,
+            score_count=percentage,
+        )
+        graded.append((i, user_test, prepared))
+        scores_by_test[test.test_id].append((percentage, attempted_at))
+
+        base_xp = XP_AWARD_PER_PRACTICE if is_practice else XP_AWARD_PER_TEST
+        result.user_test = user_test
+        result.total_questions = answer_key.total_questions
+        result.answered_count = len(prepared)
+        result.correct_count = correct_count
+        result.xp_awarded = int(round(base_xp * multiplier))
+        result.energy_spent = ENERGY_COST_PER_PRACTICE if is_practice else ENERGY_COST_PER_TEST
+
+    batch = BatchSubmissionResult(attempts=results)
+    if not graded:
+        return batch
+
+    # Bulk insert attempts (primary keys are returned by the database) and then their answers
+    UserTest.objects.bulk_create([user_test for _i, user_test, _prepared in graded])
+    UserTestAnswer.objects.bulk_create(
+        [
+            UserTestAnswer(
+                user_test=user_test,
+                attempt_date=user_test.attempt_date,
+                question_id=qid,
+                choice_id=choice_id,
+                given_answer_text=given_text,
+                is_correct=is_correct,
+            )
+            for _i, user_test, prepared in graded
+            for qid, choice_id, given_text, is_correct in prepared
+        ]
+    )
+
+    question_counts: dict[int, tuple[int, int]] = {}
+    for _i, _user_test, prepared in graded:
+        for qid, _choice_id, _text, is_correct in prepared:
+            attempts_so_far, correct_so_far = question_counts.get(qid, (0, 0))
+            question_counts[qid] = (attempts_so_far + 1, correct_so_far + int(is_correct))
+    record_question_answers(question_counts)
+
+    for test_id, scores in scores_by_test.items():
+        record_attempts(user=user, test=tests[test_id], attempts=scores, progress=progress_by_test.get(test_id))
+
+    # Daily streaks for every distinct attempt day
+    attempt_days = {timezone.localdate(user_test.attempt_date) for _i, user_test, _prepared in graded}
+    existing_days = set(
+        DailyStreak.objects.filter(user=user, daily_streak_date__in=attempt_days).values_list(
+            "daily_streak_date", flat=True
+        )
+    )
+    batch.streak_dates_created = sorted(attempt_days - existing_days)
+
+    # Streak days, energy and XP once for the whole batch (per-attempt XP is already boosted)
+    batch.energy_spent = sum(r.energy_spent for r in results if r.error is None)
+    batch.xp_awarded = sum(r.xp_awarded for r in results if r.error is None)
+    enqueue(
+        SUBMISSION_SIDE_EFFECTS_JOB,
+        submission_side_effects_payload(
+            user_id=user.pk,
+            streak_dates=batch.streak_dates_created,
+            energy_cost=batch.energy_spent,
+            xp_amount=batch.xp_awarded,
+            review_results=[
+                (qid, is_correct, user_test.attempt_date)
+                for _i, user_test, prepared in graded
+                for qid, _choice_id, _text, is_correct in prepared
+            ],
+        ),
+    )
+    return batch
@@ -0,0 +1,62 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from courses.models import Chapter, Course, Question, QuestionChoice, SearchDocument, Test
+from courses.services.answer_key import answer_key_cache
+from courses.services.content_version import bump_content_version
+from courses.services.search import index_object, remove_object
+from courses.services.user_test_progress import backfill_user_test_progress
+
+_SEARCH_KINDS = {
+    Course: SearchDocument.Kind.COURSE,
+    Chapter: SearchDocument.Kind.CHAPTER,
+    Test: SearchDocument.Kind.TEST,
+    Question: SearchDocument.Kind.QUESTION,
+}
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=Chapter)
+@receiver(post_delete, sender=Chapter)
+@receiver(post_save, sender=Test)
+@receiver(post_delete, sender=Test)
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+@receiver(post_save, sender=QuestionChoice)
+@receiver(post_delete, sender=QuestionChoice)
+def bump_content_version_on_change(sender, **kwargs):
+    # Any write to authored content invalidates cached trees and test bundles
+    bump_content_version()
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_answer_key(sender, instance, **kwargs):
+    # Drop this process's cached key right away; other processes notice the version bump
+    answer_key_cache.invalidate(instance.test_id)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Chapter)
+@receiver(post_save, sender=Test)
+@receiver(post_save, sender=Question)
+def index_search_document(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_object(instance)
+
+
+def fill_user_test_progress(sender, using="default", verbosity=1, **kwargs):
+    """post_migrate (connected in CoursesConfig.ready): materialize progress for history that has none."""
+    created = backfill_user_test_progress()
+    if created and verbosity:
+        print(f"Backfilled {created} user test progress rows")
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Chapter)
+@receiver(post_delete, sender=Test)
+@receiver(post_delete, sender=Question)
+def remove_search_document(sender, instance, **kwargs):
+    remove_object(_SEARCH_KINDS[sender], instance.pk)
@@ -0,0 +1,76 @@
+from courses.models import Question, UserTest, UserTestAnswer
+from courses.services.user_test_answer_backfill import backfill_answer_links
+from courses.tests.utils import CourseContentTestCase
+
+
+class BackfillAnswerLinksTests(CourseContentTestCase):
+    def legacy_attempt(self, test, answers):
+        """Answers stored the old way: text and correctness only, in the order the client sent them."""
+        attempt = UserTest.objects.create(user=self.user, test=test, time_spent=1)
+        UserTestAnswer.objects.bulk_create(
+            [
+                UserTestAnswer(user_test=attempt, attempt_date=attempt.attempt_date, given_answer_text=text, is_correct=ok)
+                for text, ok in answers
+            ]
+        )
+        return attempt
+
+    def linked(self, attempt):
+        return {
+            answer.given_answer_text: (answer.question.type, answer.choice.text if answer.choice_id else None)
+            for answer in UserTestAnswer.objects.filter(user_test=attempt).select_related("question", "choice")
+            if answer.question_id is not None
+        }
+
+    def test_links_answers_sent_out_of_question_order(self):
+        attempt = self.legacy_attempt(self.test1, [("Hello", True), ("a", True)])
+        self.assertEqual(backfill_answer_links(), (2, 0))
+        self.assertEqual(
+            self.linked(attempt),
+            {"Hello": (Question.Type.FILL_IN, None), "a": (Question.Type.MCQ, "A")},
+        )
+
+    def test_links_all_wrong_attempt_when_only_one_pairing_fits(self):
+        # "x" is no choice, so it must be the fill-in answer; "b" is then the MCQ answer
+        attempt = self.legacy_attempt(self.test1, [("x", False), ("b", False)])
+        self.assertEqual(backfill_answer_links(), (2, 0))
+        self.assertEqual(
+            self.linked(attempt),
+            {"x": (Question.Type.FILL_IN, None), "b": (Question.Type.MCQ, "B")},
+        )
+
+    def test_keeps_the_typed_text_next_to_the_matched_choice(self):
+        attempt = self.legacy_attempt(self.test1, [(" a ", True), ("hello", True)])
+        self.assertEqual(backfill_answer_links(), (2, 0))
+        mcq = UserTestAnswer.objects.get(user_test=attempt, question__type=Question.Type.MCQ)
+        self.assertEqual((mcq.choice.text, mcq.given_answer_text, mcq.answer_text), ("A", " a ", "A"))
+
+    def test_links_attempts_with_unanswered_questions(self):
+        attempt = self.legacy_attempt(self.test1, [("Hello", True)])
+        self.assertEqual(backfill_answer_links(), (1, 0))
+        self.assertEqual(self.linked(attempt), {"Hello": (Question.Type.FILL_IN, None)})
+
+    def test_skips_ambiguous_attempts_and_keeps_their_text(self):
+        blank = self.legacy_attempt(self.test1, [("", False), ("", False)])
+        Question.objects.create(
+            test=self.test2, text="Say bye", type=Question.Type.FILL_IN, correct_answer_text="Bye", order_index=3
+        )
+        # Two wrong fill-in answers fit either fill-in question
+        swapped = self.legacy_attempt(self.test2, [("a", True), ("nope", False), ("nah", False)])
+
+        # A lone wrong fill-in answer fits either one as well
+        partial = self.legacy_attempt(self.test2, [("nope", False)])
+        # More answers than questions cannot be paired at all
+        extra = self.legacy_attempt(self.test1, [("a", True), ("Hello", True), ("b", False)])
+
+        self.assertEqual(backfill_answer_links(), (0, 4))
+        for attempt, texts in (
+            (blank, ["", ""]),
+            (swapped, ["a", "nope", "nah"]),
+            (partial, ["nope"]),
+            (extra, ["a", "Hello", "b"]),
+        ):
+            rows = UserTestAnswer.objects.filter(user_test=attempt).order_by("user_test_answer_id")
+            self.assertEqual([row.given_answer_text for row in rows], texts)
+            self.assertFalse(rows.filter(question__isnull=False).exists())
+            self.assertFalse(rows.filter(choice__isnull=False).exists())
@@ -0,0 +1,112 @@
+import datetime
+
+from django.test import override_settings
+from django.utils import timezone
+
+from common.constants import (
+    BATCH_SUBMISSION_MAX_AGE,
+    ENERGY_COST_PER_PRACTICE,
+    ENERGY_COST_PER_TEST,
+    XP_AWARD_PER_PRACTICE,
+    XP_AWARD_PER_TEST,
+)
+from courses.jobs import SUBMISSION_SIDE_EFFECTS_JOB
+from courses.models import UserTest
+from courses.tests.utils import CourseContentTestCase
+from gameinfo.models import UserGameInfos
+from jobs.models import Job
+
+
+class BatchSubmissionTests(CourseContentTestCase):
+    def attempt(self, test, answers, attempted_at=None):
+        questions = list(test.questions.order_by("order_index"))
+        payload = {
+            "test_id": test.test_id,
+            "duration": 10,
+            "answers": [{"question_id": q.question_id, "answer_text": a} for q, a in zip(questions, answers)],
+        }
+        if attempted_at is not None:
+            payload["attempted_at"] = attempted_at.isoformat()
+        return payload
+
+    def submit_batch(self, attempts):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post("/api/client/user-tests/submit/batch/", {"attempts": attempts}, format="json")
+
+    def test_attempts_are_graded_in_client_time_order(self):
+        now = timezone.now()
+        response = self.submit_batch(
+            [
+                self.attempt(self.test1, ["A", "Hello"], now - datetime.timedelta(hours=1)),
+                self.attempt(self.test1, ["B", "nope"], now - datetime.timedelta(hours=2)),
+            ]
+        )
+        self.assertEqual(response.status_code, 201)
+        # Results stay in input order, but the earlier (failed) attempt is the first attempt
+        later, earlier = response.data["attempts"]
+        self.assertEqual([later["index"], earlier["index"]], [0, 1])
+        self.assertEqual((earlier["energy_spent"], earlier["xp_awarded"]), (ENERGY_COST_PER_TEST, XP_AWARD_PER_TEST))
+        self.assertEqual(
+            (later["energy_spent"], later["xp_awarded"]), (ENERGY_COST_PER_PRACTICE, XP_AWARD_PER_PRACTICE)
+        )
+        self.assertEqual(
+            list(UserTest.objects.order_by("attempt_date").values_list("score_count", flat=True)), [0, 100]
+        )
+
+    def test_future_timestamps_are_clamped_to_now(self):
+        before = timezone.now()
+        response = self.submit_batch([self.attempt(self.test1, ["A", "Hello"], before + datetime.timedelta(days=2))])
+        self.assertEqual(response.status_code, 201)
+        attempt_date = UserTest.objects.get().attempt_date
+        self.assertGreaterEqual(attempt_date, before)
+        self.assertLessEqual(attempt_date, timezone.now())
+
+    def test_too_old_attempts_are_rejected_alone(self):
+        too_old = timezone.now() - BATCH_SUBMISSION_MAX_AGE - datetime.timedelta(minutes=1)
+        response = self.submit_batch(
+            [self.attempt(self.test1, ["A", "Hello"], too_old), self.attempt(self.test2, ["A", "Hello"])]
+        )
+        self.assertEqual(response.status_code, 201)
+        rejected, created = response.data["attempts"]
+        self.assertEqual(rejected, {"index": 0, "status": "rejected", "detail": "Attempt is too old to be submitted"})
+        self.assertEqual(created["status"], "created")
+        self.assertEqual(list(UserTest.objects.values_list("test_id", flat=True)), [self.test2.test_id])
+
+    @override_settings(JOBS_RUN_INLINE=True)
+    def test_batch_totals_are_applied_once(self):
+        self.submit(self.test2, ["A", "Hello"])
+        gameinfo = UserGameInfos.objects.get(user=self.user)
+        xp_before, energy_before = gameinfo.xp_value, gameinfo.energy_value
+        Job.objects.all().delete()
+
+        response = self.submit_batch(
+            [
+                self.attempt(self.test1, ["A", "Hello"]),
+                self.attempt(self.test1, ["A", "Hello"]),
+                self.attempt(self.test2, ["A", "Hello"]),
+                self.attempt(self.test2, ["B"], timezone.now() - 2 * BATCH_SUBMISSION_MAX_AGE),
+            ]
+        )
+        self.assertEqual(response.status_code, 201)
+        # One first attempt and two practice rounds; the rejected attempt costs nothing
+        xp = XP_AWARD_PER_TEST + 2 * XP_AWARD_PER_PRACTICE
+        energy = ENERGY_COST_PER_TEST + 2 * ENERGY_COST_PER_PRACTICE
+        self.assertEqual((response.data["xp_awarded"], response.data["energy_spent"]), (xp, energy))
+
+        job = Job.objects.get(name=SUBMISSION_SIDE_EFFECTS_JOB)
+        self.assertEqual((job.payload["xp_amount"], job.payload["energy_cost"]), (xp, energy))
+        gameinfo.refresh_from_db()
+        self.assertEqual(gameinfo.xp_value, xp_before + xp)
+        self.assertEqual(gameinfo.energy_value, energy_before - energy)
+
+
+class SubmitStreakDayTests(CourseContentTestCase):
+    def test_single_submit_marks_the_local_day(self):
+        # A zone whose date differs from the UTC date right now, whatever the hour
+        zone = "Pacific/Kiritimati" if timezone.now().hour >= 10 else "Pacific/Pago_Pago"
+        with timezone.override(zone):
+            self.submit(self.test1, ["A", "Hello"])
+            local_today = timezone.localdate()
+        self.assertNotEqual(local_today, timezone.now().date())
+        job = Job.objects.get(name=SUBMISSION_SIDE_EFFECTS_JOB)
+        self.assertEqual(job.payload["streak_dates"], [local_today.isoformat()])
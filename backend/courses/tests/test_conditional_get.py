@@ -0,0 +1,74 @@
+from django.utils.http import http_date
+
+from courses.models import Chapter, Course, Question
+from courses.tests.utils import CourseContentTestCase, make_test
+
+FAR_FUTURE = http_date(4102444800)  # 2100-01-01
+
+
+class ConditionalGetTests(CourseContentTestCase):
+    def setUp(self):
+        super().setUp()
+        draft_chapter = Chapter.objects.create(course=Course.objects.get(title="Draft"), title="Hidden", order_index=1)
+        draft_test = make_test(draft_chapter, "Hidden", 1)
+        draft_question = draft_test.questions.get(type=Question.Type.MCQ)
+        question = self.test1.questions.get(type=Question.Type.MCQ)
+        # (visible object url, hidden object url) per retrieve view
+        self.detail_urls = {
+            "course": (f"/api/client/courses/{self.course.course_id}", f"/api/client/courses/{draft_chapter.course_id}"),
+            "chapter": (f"/api/client/chapters/{self.test1.chapter_id}", f"/api/client/chapters/{draft_chapter.chapter_id}"),
+            "test": (f"/api/client/tests/{self.test1.test_id}", f"/api/client/tests/{draft_test.test_id}"),
+            "question": (f"/api/client/questions/{question.question_id}", f"/api/client/questions/{draft_question.question_id}"),
+            "choice": (
+                f"/api/client/question-choices/{question.choices.first().choice_id}",
+                f"/api/client/question-choices/{draft_question.choices.first().choice_id}",
+            ),
+        }
+
+    def test_detail_views_revalidate(self):
+        for kind, (url, _hidden) in self.detail_urls.items():
+            with self.subTest(kind=kind):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                etag = response["ETag"]
+                # Content version, then an EXISTS check on the object
+                with self.assertNumQueries(2):
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+                self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 304)
+
+    def test_missing_or_hidden_objects_are_not_found(self):
+        missing = {kind: url.rsplit("/", 1)[0] + "/999999" for kind, (url, _hidden) in self.detail_urls.items()}
+        for kind, (_url, hidden) in self.detail_urls.items():
+            for url in (hidden, missing[kind]):
+                for headers in ({"HTTP_IF_NONE_MATCH": "*"}, {"HTTP_IF_MODIFIED_SINCE": FAR_FUTURE}, {}):
+                    with self.subTest(url=url, headers=headers):
+                        self.assertEqual(self.client.get(url, **headers).status_code, 404)
+
+    def test_list_views_revalidate(self):
+        for url in ("/api/client/courses/", "/api/client/chapters/", "/api/client/tests/", "/api/client/questions/"):
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+                with self.assertNumQueries(1):
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                # Another query string is another representation
+                self.assertEqual(self.client.get(url, {"fields": "title"}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_content_change_invalidates(self):
+        url, _hidden = self.detail_urls["chapter"]
+        etag = self.client.get(url)["ETag"]
+        self.course.title = "Renamed"
+        self.course.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_anonymous_requests_are_rejected_before_revalidation(self):
+        url, _hidden = self.detail_urls["course"]
+        etag = self.client.get(url)["ETag"]
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 401)
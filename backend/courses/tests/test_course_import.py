@@ -0,0 +1,40 @@
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from courses.models import Course
+from courses.tests.utils import CourseContentTestCase
+
+IMPORT_URL = "/api/admin/courses/import/"
+
+
+class CourseImportUploadTests(CourseContentTestCase):
+    def upload(self, name, content):
+        return self.admin_client.post(IMPORT_URL, {"file": SimpleUploadedFile(name, content)}, format="multipart")
+
+    def test_rejects_malformed_uploads(self):
+        courses = Course.objects.count()
+        for name, content in (
+            ("course.json", b"[]"),
+            ("course.json", b'[{"title": "Course"}]'),
+            ("course.json", b'"a course"'),
+            ("course.json", b"42"),
+            ("course.json", b"{not json"),
+            ("course.json", "{\"title\": \"Café\"}".encode("latin-1")),
+            ("course.csv", b"chapter_title,test_title\n\xff\xfe,x\n"),
+        ):
+            with self.subTest(name=name, content=content):
+                response = self.upload(name, content)
+                self.assertEqual(response.status_code, 400, response.content)
+                self.assertIn("file", response.json())
+        self.assertEqual(Course.objects.count(), courses)
+
+    def test_imports_json_upload(self):
+        document = {
+            "title": "Imported",
+            "status": "draft",
+            "chapters": [{"title": "Chapter", "order_index": 1, "tests": []}],
+        }
+        response = self.upload("course.json", json.dumps(document).encode())
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()["imported"]["chapters"], 1)
@@ -0,0 +1,81 @@
+import datetime
+import unittest
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from courses.models import Chapter, Course, Question, Test, UserTest, UserTestAnswer
+from courses.services import partitions
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "Table partitioning requires PostgreSQL")
+class ConvertToPartitionedTests(TransactionTestCase):
+    """Runs the real conversion, then puts the plain attempt tables back for the tests that follow."""
+
+    def tearDown(self):
+        # Partitions, the parent-owned sequences and the legacy tables all go with the parents
+        with connection.cursor() as cursor:
+            for table, _pk in partitions._tables():
+                cursor.execute(f"DROP TABLE IF EXISTS {connection.ops.quote_name(table)} CASCADE")
+        with connection.schema_editor() as editor:
+            editor.create_model(UserTest)
+            editor.create_model(UserTestAnswer)
+        super().tearDown()
+
+    def _index_filenode(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relfilenode FROM pg_class WHERE relname = %s", [name])
+            row = cursor.fetchone()
+        return row and row[0]
+
+    def _constraints(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", [table]
+            )
+            return [name for (name,) in cursor.fetchall()]
+
+    def test_convert_keeps_rows_and_adopts_prepared_primary_key(self):
+        user = get_user_model().objects.create(username="p", email="p@example.com")
+        course = Course.objects.create(title="C", status=Course.Status.ACTIVE)
+        chapter = Chapter.objects.create(course=course, title="Ch", order_index=1)
+        test = Test.objects.create(chapter=chapter, title="T", order_index=1)
+        question = Question.objects.create(test=test, text="q", type="fill_in_blank", correct_answer_text="a", order_index=1)
+        for months_ago in range(3):
+            attempt = UserTest.objects.create(
+                user=user, test=test, time_spent=1, attempt_date=timezone.now() - datetime.timedelta(days=31 * months_ago)
+            )
+            UserTestAnswer.objects.create(
+                user_test=attempt, question=question, given_answer_text="a", is_correct=True, attempt_date=attempt.attempt_date
+            )
+
+        tables = [table for table, _pk in partitions._tables()]
+        prepared = {}
+        swap = partitions._swap_to_partitioned
+
+        def record_prepared_index(table, pk, boundary):
+            prepared[table] = self._index_filenode(f"{table}_part_pk")
+            swap(table, pk, boundary)
+
+        with mock.patch.object(partitions, "_swap_to_partitioned", side_effect=record_prepared_index):
+            created = partitions.convert_to_partitioned(months_ahead=2)
+
+        self.assertTrue(created)
+        for table in tables:
+            self.assertTrue(partitions.is_partitioned(table))
+            self.assertEqual(self._constraints(f"{table}_legacy"), [f"{table}_part_pk"])
+            # Same storage as the index built CONCURRENTLY beforehand: attached, not rebuilt
+            self.assertEqual(self._index_filenode(f"{table}_part_pk"), prepared[table])
+        self.assertEqual(UserTest.objects.count(), 3)
+        self.assertEqual(UserTestAnswer.objects.count(), 3)
+
+        attempt = UserTest.objects.create(user=user, test=test, time_spent=1)
+        self.assertGreater(attempt.pk, max(UserTest.objects.exclude(pk=attempt.pk).values_list("pk", flat=True)))
+
+    def test_attempt_tables_start_unpartitioned(self):
+        # Whichever order the tests run in, tearDown must have undone the conversion
+        for table, _pk in partitions._tables():
+            self.assertFalse(partitions.is_partitioned(table))
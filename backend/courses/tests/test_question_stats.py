@@ -0,0 +1,57 @@
+from courses.models import QuestionStats
+from courses.services.question_stats import rebuild_question_stats, record_question_answers
+from courses.tests.utils import CourseContentTestCase
+
+
+class QuestionStatsTests(CourseContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mcq, self.fill_in = self.test1.questions.order_by("order_index")
+
+    def counts(self):
+        rows = QuestionStats.objects.values_list("question_id", "attempts", "correct_count")
+        return {qid: (attempts, correct) for qid, attempts, correct in rows}
+
+    def test_first_answer_creates_the_row_then_increments(self):
+        # Lazy creation: bulk insert of zero rows, then the same increment as an existing row gets
+        with self.assertNumQueries(4):
+            record_question_answers({self.mcq.question_id: (1, 1), self.fill_in.question_id: (1, 0)})
+        self.assertEqual(self.counts(), {self.mcq.question_id: (1, 1), self.fill_in.question_id: (1, 0)})
+
+        with self.assertNumQueries(1):
+            record_question_answers({self.mcq.question_id: (2, 1), self.fill_in.question_id: (1, 1)})
+        self.assertEqual(self.counts(), {self.mcq.question_id: (3, 2), self.fill_in.question_id: (2, 1)})
+
+    def test_submissions_update_stats(self):
+        self.submit(self.test1, ["A", "nope"])
+        self.submit(self.test1, ["B", "Hello"])
+        self.submit(self.test1, ["A", "Hello"], client=self.admin_client)
+        expected = {self.mcq.question_id: (3, 2), self.fill_in.question_id: (3, 2)}
+        self.assertEqual(self.counts(), expected)
+        # The stored counters agree with a rebuild from the answers
+        self.assertEqual(rebuild_question_stats(), 2)
+        self.assertEqual(self.counts(), expected)
+
+    def test_admin_difficulty_endpoint(self):
+        self.submit(self.test1, ["A", "nope"])
+        self.submit(self.test1, ["B", "nope"])
+        self.submit(self.test1, ["A", "nope"], client=self.admin_client)
+        self.submit(self.test1, ["A", "Hello"], client=self.admin_client)
+
+        response = self.admin_client.get(f"/api/admin/tests/{self.test1.test_id}/question-stats/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["test_id"], response.data["title"]), (self.test1.test_id, "Test 1"))
+        self.assertEqual(
+            [
+                (q["question_id"], q["attempts"], q["correct_count"], q["correct_rate"], q["difficulty"])
+                for q in response.data["questions"]
+            ],
+            [(self.mcq.question_id, 4, 3, 0.75, 0.25), (self.fill_in.question_id, 4, 1, 0.25, 0.75)],
+        )
+
+        # Questions nobody answered yet have no difficulty
+        untouched = self.admin_client.get(f"/api/admin/tests/{self.test2.test_id}/question-stats/").data["questions"]
+        self.assertEqual([(q["attempts"], q["correct_rate"], q["difficulty"]) for q in untouched], [(0, None, None)] * 2)
+
+        self.assertEqual(self.admin_client.get("/api/admin/tests/0/question-stats/").status_code, 404)
+        self.assertEqual(self.client.get(f"/api/admin/tests/{self.test1.test_id}/question-stats/").status_code, 403)
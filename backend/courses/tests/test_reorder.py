@@ -0,0 +1,85 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from courses.models import Chapter, Test
+from courses.services.content_version import get_content_version
+from courses.services.reorder import ReorderError, reorder_children
+from courses.tests.utils import CourseContentTestCase, make_test
+
+# Savepoints depend on how deeply the caller nests atomic(), not on the code under test
+_TRANSACTION_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class ReorderTests(CourseContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.chapter = self.test1.chapter
+        self.test3 = make_test(self.chapter, "Test 3", 3)
+        self.test4 = make_test(self.chapter, "Test 4", 4)
+        self.url = f"/api/admin/chapters/{self.chapter.chapter_id}/reorder/"
+
+    def order(self):
+        return list(Test.objects.filter(chapter=self.chapter).order_by("order_index").values_list("title", flat=True))
+
+    def order_ids(self):
+        return list(Test.objects.filter(chapter=self.chapter).order_by("order_index").values_list("test_id", flat=True))
+
+    def test_applies_a_permutation(self):
+        version = get_content_version()
+        ids = [self.test3.test_id, self.test1.test_id, self.test4.test_id, self.test2.test_id]
+        response = self.admin_client.post(self.url, {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [{"test_id": pk, "order_index": index} for pk, index in zip(ids, [1, 2, 3, 4])])
+        self.assertEqual(self.order(), ["Test 3", "Test 1", "Test 4", "Test 2"])
+        # bulk_update sends no signals, so the cached trees are invalidated explicitly
+        self.assertGreater(get_content_version(), version)
+
+    def test_rejects_incomplete_or_foreign_orderings_without_changes(self):
+        other_chapter = Chapter.objects.get(course=self.course, order_index=2)
+        foreign = make_test(other_chapter, "Elsewhere", 1)
+        everything = [self.test1.test_id, self.test2.test_id, self.test3.test_id, self.test4.test_id]
+        for ids in (
+            everything[:3],
+            everything + [foreign.test_id],
+            everything[:3] + [foreign.test_id],
+            everything[:3] + [everything[0]],
+            everything + [0],
+        ):
+            with self.subTest(ids=ids):
+                response = self.admin_client.post(self.url, {"ids": list(reversed(ids))}, format="json")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("ids", response.data)
+                self.assertEqual(self.order(), ["Test 1", "Test 2", "Test 3", "Test 4"])
+        self.assertEqual(Test.objects.get(pk=foreign.pk).chapter_id, other_chapter.chapter_id)
+
+    def test_statement_count_does_not_depend_on_the_number_of_children(self):
+        def statements(ordered_ids):
+            with CaptureQueriesContext(connection) as ctx:
+                reorder_children(Test, parent_field="chapter_id", parent_id=self.chapter.chapter_id, ordered_ids=ordered_ids)
+            return [q["sql"] for q in ctx.captured_queries if not q["sql"].upper().startswith(_TRANSACTION_PREFIXES)]
+
+        # Lock, shift past the maximum, bulk UPDATE of the final positions, content version bump
+        ids = [self.test4.test_id, self.test3.test_id, self.test2.test_id, self.test1.test_id]
+        self.assertEqual(len(statements(ids)), 4)
+        for order in range(5, 15):
+            make_test(self.chapter, f"Test {order}", order)
+        self.assertEqual(len(statements(list(reversed(self.order_ids())))), 4)
+        # An unchanged ordering only takes the lock
+        self.assertEqual(len(statements(self.order_ids())), 1)
+
+    def test_keeps_the_existing_order_index_values(self):
+        Test.objects.filter(pk=self.test2.pk).update(order_index=10)
+        positions = reorder_children(
+            Test,
+            parent_field="chapter_id",
+            parent_id=self.chapter.chapter_id,
+            ordered_ids=[self.test2.test_id, self.test4.test_id, self.test3.test_id, self.test1.test_id],
+        )
+        self.assertEqual([index for _pk, index in positions], [1, 3, 4, 10])
+        with self.assertRaises(ReorderError):
+            reorder_children(Test, parent_field="chapter_id", parent_id=self.chapter.chapter_id, ordered_ids=[])
+
+    def test_requires_an_admin_and_an_existing_parent(self):
+        self.assertEqual(self.client.post(self.url, {"ids": []}, format="json").status_code, 403)
+        response = self.admin_client.post("/api/admin/chapters/0/reorder/", {"ids": [1]}, format="json")
+        self.assertEqual(response.status_code, 404)
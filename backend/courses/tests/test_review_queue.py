@@ -0,0 +1,85 @@
+import datetime
+
+from django.test import override_settings
+from django.utils import timezone
+
+from courses.models import Chapter, Course, ReviewItem
+from courses.services.review_queue import record_review_results
+from courses.tests.utils import CourseContentTestCase, make_test
+
+
+class ReviewScheduleTests(CourseContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mcq, self.fill_in = self.test1.questions.order_by("order_index")
+        self.start = timezone.now() - datetime.timedelta(days=60)
+
+    def schedule(self, item):
+        return (item.repetitions, item.lapses, item.interval_days, round(item.ease_factor, 2))
+
+    def test_sm2_intervals_after_right_and_wrong_answers(self):
+        qid = self.mcq.question_id
+        # Correct answers to questions that are not queued are ignored
+        self.assertEqual(record_review_results(self.user.pk, [(qid, True, self.start)]), 0)
+        self.assertFalse(ReviewItem.objects.exists())
+
+        steps = [
+            (False, (0, 1, 1, 1.96)),
+            (True, (1, 1, 1, 1.96)),
+            (True, (2, 1, 6, 1.96)),
+            (True, (3, 1, 12, 1.96)),
+            (False, (0, 2, 1, 1.42)),
+            (False, (0, 3, 1, 1.3)),
+            (True, (1, 3, 1, 1.3)),
+        ]
+        for day, (is_correct, expected) in enumerate(steps):
+            answered_at = self.start + datetime.timedelta(days=day)
+            record_review_results(self.user.pk, [(qid, is_correct, answered_at)])
+            item = ReviewItem.objects.get(user=self.user, question_id=qid)
+            with self.subTest(step=day):
+                self.assertEqual(self.schedule(item), expected)
+                self.assertEqual(item.due_at, answered_at + datetime.timedelta(days=expected[2]))
+                self.assertEqual(item.last_reviewed_at, answered_at)
+
+    def test_results_are_applied_oldest_first(self):
+        qid = self.mcq.question_id
+        later = self.start + datetime.timedelta(days=1)
+        self.assertEqual(record_review_results(self.user.pk, [(qid, True, later), (qid, False, self.start)]), 1)
+        self.assertEqual(self.schedule(ReviewItem.objects.get()), (1, 1, 1, 1.96))
+
+    @override_settings(JOBS_RUN_INLINE=True)
+    def test_submissions_queue_wrong_answers(self):
+        self.submit(self.test1, ["B", "Hello"])
+        item = ReviewItem.objects.get(user=self.user)
+        self.assertEqual((item.question_id, self.schedule(item)), (self.mcq.question_id, (0, 1, 1, 1.96)))
+        self.submit(self.test1, ["A", "Hello"])
+        self.assertEqual(self.schedule(ReviewItem.objects.get(user=self.user)), (1, 1, 1, 1.96))
+
+
+class NextReviewsViewTests(CourseContentTestCase):
+    def queue(self, question, user=None, **offset):
+        return ReviewItem.objects.create(
+            user=user or self.user, question=question, due_at=timezone.now() + datetime.timedelta(**offset)
+        )
+
+    def test_returns_due_items_earliest_first(self):
+        mcq, fill_in = self.test1.questions.order_by("order_index")
+        other_mcq, other_fill_in = self.test2.questions.order_by("order_index")
+        draft = Course.objects.get(title="Draft")
+        draft_test = make_test(Chapter.objects.create(course=draft, title="Draft chapter", order_index=1), "Draft", 1)
+
+        recent = self.queue(fill_in, hours=-1)
+        oldest = self.queue(other_mcq, days=-3)
+        self.queue(mcq, days=2)
+        self.queue(draft_test.questions.first(), days=-5)
+        self.queue(other_fill_in, user=self.admin, days=-5)
+
+        response = self.client.get("/api/client/review/next/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["review_item_id"] for item in response.data], [oldest.pk, recent.pk])
+        self.assertEqual(response.data[0]["question"]["question_id"], other_mcq.question_id)
+        self.assertEqual([c["text"] for c in response.data[0]["question"]["choices"]], ["A", "B"])
+
+        limited = self.client.get("/api/client/review/next/", {"limit": 1}).data
+        self.assertEqual([item["review_item_id"] for item in limited], [oldest.pk])
+        self.assertEqual(self.client.get("/api/client/review/next/", {"limit": 0}).status_code, 400)
@@ -0,0 +1,80 @@
+import unittest
+
+from django.db import connection
+
+from courses.models import Chapter, Course, SearchDocument
+from courses.services.search import search_content
+from courses.tests.utils import CourseContentTestCase, make_test
+
+
+class SearchTests(CourseContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.chapter = self.test1.chapter
+
+    def search(self, q, client=None, **params):
+        return (client or self.client).get("/api/client/search/", {"q": q, **params})
+
+    @unittest.skipIf(connection.vendor == "postgresql", "PostgreSQL uses full-text search instead")
+    def test_substring_fallback(self):
+        results = self.search("ELL").data["results"]
+        # "Say hello" from both tests
+        self.assertEqual({(r["kind"], r["title"]) for r in results}, {("question", "Say hello")})
+        self.assertEqual(len(results), 2)
+        self.assertEqual({r["rank"] for r in results}, {0.0})
+
+    def test_keyset_pages_cover_every_match_once(self):
+        for order in range(3, 10):
+            make_test(self.chapter, f"Grammar drill {order}", order)
+        seen, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = self.search("grammar", **params)
+            self.assertEqual(response.status_code, 200)
+            seen += [(r["rank"], r["id"]) for r in response.data["results"]]
+            cursor, pages = response.data["next_cursor"], pages + 1
+            if cursor is None:
+                break
+        self.assertEqual(pages, 3)
+        drills = dict(
+            SearchDocument.objects.filter(kind="test", title__startswith="Grammar").values_list("object_id", "document_id")
+        )
+        self.assertEqual(sorted(pk for _rank, pk in seen), sorted(drills))
+        # Best first, ties broken by the newest document, with no repeats across pages
+        keys = [(rank, drills[pk]) for rank, pk in seen]
+        self.assertEqual(keys, sorted(set(keys), reverse=True))
+
+    def test_index_follows_content_changes(self):
+        test = make_test(self.chapter, "Irregular verbs", 3)
+        self.assertEqual([r["id"] for r in self.search("irregular", kind="test").data["results"]], [test.test_id])
+
+        test.title = "Phrasal verbs"
+        test.save()
+        self.assertEqual(self.search("irregular", kind="test").data["results"], [])
+        self.assertEqual([r["id"] for r in self.search("phrasal", kind="test").data["results"]], [test.test_id])
+
+        test.delete()
+        self.assertEqual(self.search("phrasal").data["results"], [])
+
+    def test_draft_content_is_admin_only(self):
+        draft = Course.objects.get(title="Draft")
+        chapter = Chapter.objects.create(course=draft, title="Subjunctive mood", order_index=1)
+        # Learner search hides it, even for an admin
+        self.assertEqual(self.search("subjunctive", client=self.admin_client).data["results"], [])
+        self.assertEqual(self.client.get("/api/admin/search/", {"q": "subjunctive"}).status_code, 403)
+        response = self.admin_client.get("/api/admin/search/", {"q": "subjunctive"})
+        self.assertEqual([(r["kind"], r["id"]) for r in response.data["results"]], [("chapter", chapter.chapter_id)])
+
+    def test_invalid_cursor_and_kind_are_rejected(self):
+        self.assertIn("cursor", self.search("hello", cursor="not-a-cursor").data)
+        self.assertEqual(self.search("hello", kind="lesson").status_code, 400)
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "Ranking requires PostgreSQL full-text search")
+    def test_title_matches_rank_above_body_matches(self):
+        body_match = Course.objects.create(
+            title="Listening", description="Practice idioms every day", status=Course.Status.ACTIVE
+        )
+        title_match = Course.objects.create(title="Idioms", status=Course.Status.ACTIVE)
+        results, _cursor = search_content("idioms", active_only=True)
+        self.assertEqual([r["id"] for r in results], [title_match.course_id, body_match.course_id])
+        self.assertGreater(results[0]["rank"], results[1]["rank"])
@@ -0,0 +1,70 @@
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from courses.models import Test, UserCourse
+from courses.serializers.client.test import ClientTestSerializer
+from courses.serializers.client.user_course import ClientUserCourseSerializer
+from courses.tests.utils import CourseContentTestCase
+
+ALL_TEST_FIELDS = {"test_id", "chapter_id", "passing_score", "order_index", "title", "chapter", "course"}
+
+
+def _request(**params):
+    return Request(APIRequestFactory().get("/", params))
+
+
+class SparseFieldsTests(CourseContentTestCase):
+    url = "/api/client/tests/"
+
+    def fields(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [set(row) for row in response.data]
+
+    def test_every_field_without_parameters(self):
+        rows = self.client.get(self.url).data
+        self.assertEqual([set(row) for row in rows], [ALL_TEST_FIELDS] * 2)
+        self.assertEqual(rows[0]["course"]["title"], "Course")
+
+    def test_fields_prunes_plain_fields_and_drops_expandable_ones(self):
+        self.assertEqual(self.fields(fields="test_id,title"), [{"test_id", "title"}] * 2)
+        # Unknown names are ignored; expandable fields need ?expand= once parameters are sent
+        self.assertEqual(self.fields(fields="title,nope,chapter"), [{"title"}] * 2)
+
+    def test_expand_adds_related_fields(self):
+        plain = ALL_TEST_FIELDS - {"chapter", "course"}
+        self.assertEqual(self.fields(expand="chapter"), [plain | {"chapter"}] * 2)
+        self.assertEqual(self.fields(fields="title", expand="course"), [{"title", "course"}] * 2)
+
+        # Nested serializers are not pruned by the outer request's parameters
+        row = self.client.get(self.url, {"fields": "title", "expand": "course"}).data[0]
+        self.assertEqual(set(row["course"]), {"course_id", "title", "description", "status"})
+
+        detail = self.client.get(f"/api/client/tests/{self.test1.test_id}", {"expand": "chapter"}).data
+        self.assertEqual(detail["chapter"]["chapter_id"], self.test1.chapter_id)
+        self.assertNotIn("course", detail)
+
+    def test_with_related_joins_only_what_is_selected(self):
+        def joins(serializer, queryset, **params):
+            return serializer.with_related(queryset, _request(**params)).query.select_related
+
+        tests = Test.objects.all()
+        self.assertEqual(joins(ClientTestSerializer, tests), {"chapter": {"course": {}}})
+        self.assertFalse(joins(ClientTestSerializer, tests, fields="test_id,title"))
+        self.assertEqual(joins(ClientTestSerializer, tests, expand="chapter"), {"chapter": {}})
+
+        enrollments = UserCourse.objects.all()
+        self.assertEqual(joins(ClientUserCourseSerializer, enrollments), {"course": {}})
+        self.assertFalse(joins(ClientUserCourseSerializer, enrollments, fields="user_course_id,course_id"))
+        self.assertEqual(joins(ClientUserCourseSerializer, enrollments, fields="course_title"), {"course": {}})
+
+    def test_pruned_list_reads_no_related_columns(self):
+        UserCourse.objects.create(user=self.user, course=self.course)
+        url = "/api/client/user-courses/"
+        with self.assertNumQueries(1):
+            row = self.client.get(url, {"fields": "user_course_id,course_id"}).data[0]
+        self.assertEqual(set(row), {"user_course_id", "course_id"})
+        # course_title reads the course through the join, still one query
+        with self.assertNumQueries(1):
+            row = self.client.get(url, {"fields": "course_id,course_title"}).data[0]
+        self.assertEqual(row, {"course_id": self.course.course_id, "course_title": "Course"})
@@ -0,0 +1,58 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from courses.services.user_test_submission import (
+    SubmissionAnswer,
+    SubmissionAttempt,
+    submit_user_test,
+    submit_user_test_batch,
+)
+from courses.tests.utils import CourseContentTestCase
+
+# Savepoints depend on how deeply the caller nests atomic(), not on the code under test
+_TRANSACTION_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class SubmissionQueryCountTests(CourseContentTestCase):
+    def answers(self, test, texts):
+        questions = test.questions.order_by("order_index")
+        return [SubmissionAnswer(question_id=q.question_id, answer_text=t) for q, t in zip(questions, texts)]
+
+    def count_queries(self, func, **kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            result = func(user=self.user, **kwargs)
+        statements = [q["sql"] for q in ctx.captured_queries if not q["sql"].upper().startswith(_TRANSACTION_PREFIXES)]
+        return result, len(statements)
+
+    def test_first_time_submit(self):
+        # Budget of 10 plus the cold answer key (1), the progress insert (1) and creating the
+        # question stats rows (3)
+        result, queries = self.count_queries(
+            submit_user_test, test_id=self.test1.test_id, duration=30, answers=self.answers(self.test1, ["A", "Hello"])
+        )
+        self.assertEqual(result.correct_count, 2)
+        self.assertEqual(queries, 15)
+
+    def test_repeat_submit(self):
+        submit_user_test(user=self.user, test_id=self.test1.test_id, duration=30, answers=self.answers(self.test1, ["A", "x"]))
+        result, queries = self.count_queries(
+            submit_user_test, test_id=self.test1.test_id, duration=30, answers=self.answers(self.test1, ["B", "Hello"])
+        )
+        self.assertEqual(result.correct_count, 1)
+        self.assertEqual(queries, 10)
+
+    def test_batch_submit_does_not_grow_with_attempts(self):
+        def batch(rounds):
+            attempts = [
+                SubmissionAttempt(test_id=test.test_id, duration=30, answers=self.answers(test, ["A", "Hello"]))
+                for _ in range(rounds)
+                for test in (self.test1, self.test2)
+            ]
+            result, queries = self.count_queries(submit_user_test_batch, attempts=attempts)
+            self.assertEqual([attempt.error for attempt in result.attempts], [None] * len(attempts))
+            return queries
+
+        # Cold answer keys, new progress rows and new question stats for two tests
+        self.assertEqual(batch(1), 18)
+        # Nine fixed statements plus one progress UPDATE per test, however many attempts
+        self.assertEqual(batch(5), 11)
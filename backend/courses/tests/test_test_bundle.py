@@ -0,0 +1,38 @@
+from django.core.cache import cache
+
+from courses.models import Chapter, Course
+from courses.services.content_version import get_content_version
+from courses.services.test_bundle import bundle_etag
+from courses.tests.utils import CourseContentTestCase, make_test
+
+
+class TestBundleConditionalGetTests(CourseContentTestCase):
+    def bundle_url(self, test_id):
+        return f"/api/client/tests/{test_id}/bundle/"
+
+    def test_unchanged_bundle_is_not_modified(self):
+        response = self.client.get(self.bundle_url(self.test1.test_id))
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        # Content version plus the cached bundle standing in for the existence check
+        with self.assertNumQueries(1):
+            response = self.client.get(self.bundle_url(self.test1.test_id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        cache.clear()
+        with self.assertNumQueries(2):
+            response = self.client.get(self.bundle_url(self.test1.test_id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_unavailable_tests_are_not_found_even_with_a_matching_etag(self):
+        draft = Course.objects.get(title="Draft")
+        draft_test = make_test(Chapter.objects.create(course=draft, title="Chapter", order_index=1), "Hidden", 1)
+        missing_id = draft_test.test_id + 100
+        version = get_content_version()
+
+        for test_id in (draft_test.test_id, missing_id):
+            for if_none_match in (bundle_etag(test_id, version), "*"):
+                with self.subTest(test_id=test_id, if_none_match=if_none_match):
+                    response = self.client.get(self.bundle_url(test_id), HTTP_IF_NONE_MATCH=if_none_match)
+                    self.assertEqual(response.status_code, 404)
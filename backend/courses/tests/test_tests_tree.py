@@ -0,0 +1,132 @@
+from courses.models import Chapter, Course
+from courses.services.tests_tree import get_admin_tests_tree, get_client_tests_tree
+from courses.tests.utils import CourseContentTestCase, make_test
+
+
+class TestsTreeQueryCountTests(CourseContentTestCase):
+    def test_client_tree_cold_and_warm(self):
+        # Content version, the three tree queries and the user's progress
+        with self.assertNumQueries(5):
+            items = get_client_tests_tree(self.user)
+        # Only the content version and the user's progress once the tree is cached
+        with self.assertNumQueries(2):
+            self.assertEqual(get_client_tests_tree(self.user), items)
+
+        self.assertEqual(
+            [
+                (item["course"]["title"], item["chapter"] and item["chapter"]["title"], item["test"] and item["test"]["title"], item["status"])
+                for item in items
+            ],
+            [
+                ("Course", "Chapter 1", "Test 1", "active"),
+                ("Course", "Chapter 1", "Test 2", "locked"),
+                ("Course", "Chapter 2", None, None),
+                ("Empty", None, None, None),
+            ],
+        )
+
+    def test_admin_tree_cold_and_warm(self):
+        with self.assertNumQueries(4):
+            items = get_admin_tests_tree()
+        with self.assertNumQueries(1):
+            self.assertEqual(get_admin_tests_tree(), items)
+        self.assertEqual(len(items), 5)
+
+    def test_query_count_does_not_grow_with_content(self):
+        for index in range(3):
+            course = Course.objects.create(title=f"More {index}", status=Course.Status.ACTIVE)
+            chapter = Chapter.objects.create(course=course, title="Chapter", order_index=1)
+            for order in range(3):
+                make_test(chapter, f"Test {order}", order)
+        with self.assertNumQueries(5):
+            items = get_client_tests_tree(self.user)
+        self.assertEqual(len(items), 4 + 9)
+        with self.assertNumQueries(4):
+            get_admin_tests_tree()
+
+
+
+def _drf_datetime(value):
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class TestsTreePayloadTests(CourseContentTestCase):
+    """Pins the payloads the trees used to get from the flat-item model serializers."""
+
+    def setUp(self):
+        super().setUp()
+        Course.objects.filter(pk=self.course.pk).update(created_by=self.admin, updated_by=self.admin)
+        self.course.refresh_from_db()
+        self.chapter1, self.chapter2 = self.course.chapters.order_by("order_index")
+
+    def expected_test(self, test):
+        return {"test_id": test.test_id, "passing_score": 50, "order_index": test.order_index, "title": test.title}
+
+    def test_client_tree_payload(self):
+        self.submit(self.test1, ["A", "Hello"])
+        course = {"course_id": self.course.course_id, "title": "Course", "description": None, "status": "active"}
+        empty = Course.objects.get(title="Empty")
+
+        def chapter(obj):
+            return {
+                "chapter_id": obj.chapter_id,
+                "course_id": self.course.course_id,
+                "title": obj.title,
+                "description": None,
+                "learning_resource_url": None,
+                "order_index": obj.order_index,
+            }
+
+        first = chapter(self.chapter1)
+        expected = [
+            {"course": course, "chapter": first, "test": self.expected_test(self.test1), "status": "passed"},
+            {"course": course, "chapter": first, "test": self.expected_test(self.test2), "status": "active"},
+            {"course": course, "chapter": chapter(self.chapter2), "test": None, "status": None},
+            {
+                "course": {"course_id": empty.course_id, "title": "Empty", "description": None, "status": "active"},
+                "chapter": None,
+                "test": None,
+                "status": None,
+            },
+        ]
+        self.assertEqual(get_client_tests_tree(self.user), expected)
+        # The cached copy renders the same
+        self.assertEqual(get_client_tests_tree(self.user), expected)
+
+    def test_admin_tree_payload(self):
+        def course(obj):
+            payload = {
+                "course_id": obj.course_id,
+                "title": obj.title,
+                "description": None,
+                "status": obj.status,
+                "created_at": _drf_datetime(obj.created_at),
+                "updated_at": _drf_datetime(obj.updated_at),
+                "created_by": obj.created_by_id,
+                "updated_by": obj.updated_by_id,
+            }
+            # Usernames are omitted, not null, when the user is unset
+            if obj.created_by_id:
+                payload["created_by_username"] = payload["updated_by_username"] = "admin"
+            return payload
+
+        def chapter(obj):
+            return {
+                "chapter_id": obj.chapter_id,
+                "course": self.course.course_id,
+                "title": obj.title,
+                "description": None,
+                "learning_resource_url": None,
+                "order_index": obj.order_index,
+            }
+
+        empty, draft = Course.objects.exclude(pk=self.course.pk).order_by("course_id")
+        expected = [
+            {"course": course(self.course), "chapter": chapter(self.chapter1), "test": self.expected_test(self.test1)},
+            {"course": course(self.course), "chapter": chapter(self.chapter1), "test": self.expected_test(self.test2)},
+            {"course": course(self.course), "chapter": chapter(self.chapter2), "test": None},
+            {"course": course(empty), "chapter": None, "test": None},
+            {"course": course(draft), "chapter": None, "test": None},
+        ]
+        self.assertEqual(get_admin_tests_tree(), expected)
+        self.assertEqual(get_admin_tests_tree(), expected)
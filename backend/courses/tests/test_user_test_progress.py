@@ -0,0 +1,95 @@
+import datetime
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from common.constants import ENERGY_COST_PER_PRACTICE
+from courses.models import UserTest, UserTestProgress
+from courses.services.tests_tree import get_client_tests_tree
+from courses.services.user_test_progress import _aggregate_history, backfill_user_test_progress
+from courses.tests.utils import CourseContentTestCase
+
+
+class UserTestProgressTests(CourseContentTestCase):
+    def assertProgressMatchesHistory(self):
+        history = {
+            (row["user_id"], row["test_id"]): (
+                row["best_score"],
+                row["attempt_count"],
+                row["first_passed_at"],
+                row["last_attempt_at"],
+            )
+            for row in _aggregate_history(UserTest.objects.all())
+        }
+        progress = {
+            (row.user_id, row.test_id): (row.best_score, row.attempt_count, row.first_passed_at, row.last_attempt_at)
+            for row in UserTestProgress.objects.all()
+        }
+        self.assertEqual(progress, history)
+
+    def statuses(self):
+        return {item["test"]["title"]: item["status"] for item in get_client_tests_tree(self.user) if item["test"]}
+
+    def test_submissions_keep_progress_in_step(self):
+        self.assertEqual(self.submit(self.test1, ["B", "nope"]).status_code, 201)
+        self.assertProgressMatchesHistory()
+        self.assertEqual(self.submit(self.test1, ["A", "Hello"]).status_code, 201)
+        self.assertEqual(self.submit(self.test1, ["A", "nope"]).status_code, 201)
+        self.assertProgressMatchesHistory()
+        progress = UserTestProgress.objects.get(user=self.user, test=self.test1)
+        self.assertEqual((progress.best_score, progress.attempt_count), (100, 3))
+        self.assertEqual(self.statuses(), {"Test 1": "passed", "Test 2": "active"})
+
+    def test_admin_edits_refresh_progress(self):
+        self.submit(self.test1, ["A", "Hello"])
+        attempt = UserTest.objects.get()
+
+        # Moving the attempt to another test refreshes both the old and the new pair
+        response = self.admin_client.patch(
+            f"/api/admin/user-tests/{attempt.user_test_id}", {"test": self.test2.test_id}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertProgressMatchesHistory()
+        self.assertFalse(UserTestProgress.objects.filter(test=self.test1).exists())
+
+        response = self.admin_client.post(
+            "/api/admin/user-tests/",
+            {"user": self.user.pk, "test": self.test2.test_id, "time_spent": 10},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertProgressMatchesHistory()
+        self.assertEqual(UserTestProgress.objects.get(test=self.test2).attempt_count, 2)
+
+        self.assertEqual(self.admin_client.delete(f"/api/admin/user-tests/{attempt.user_test_id}").status_code, 204)
+        self.assertProgressMatchesHistory()
+        progress = UserTestProgress.objects.get(test=self.test2)
+        self.assertEqual((progress.best_score, progress.attempt_count, progress.first_passed_at), (0, 1, None))
+
+        self.assertEqual(self.admin_client.delete(f"/api/admin/user-tests/{response.data['user_test_id']}").status_code, 204)
+        self.assertFalse(UserTestProgress.objects.exists())
+
+    def test_backfill_materializes_history_without_progress(self):
+        # History recorded before the progress table existed
+        passed_at = timezone.now() - datetime.timedelta(days=3)
+        UserTest.objects.create(user=self.user, test=self.test1, attempt_date=passed_at, time_spent=5, score_count=100)
+        UserTest.objects.create(user=self.user, test=self.test1, time_spent=5, score_count=0)
+        self.assertEqual(self.statuses(), {"Test 1": "active", "Test 2": "locked"})
+
+        self.assertEqual(backfill_user_test_progress(), 1)
+        self.assertProgressMatchesHistory()
+        self.assertEqual(UserTestProgress.objects.get().first_passed_at, passed_at)
+        self.assertEqual(self.statuses(), {"Test 1": "passed", "Test 2": "active"})
+
+        # Rows that already exist are left alone, so repeating it is a no-op
+        self.assertEqual(backfill_user_test_progress(), 0)
+
+        # The next submission is a practice round, not a second first attempt
+        response = self.submit(self.test1, ["A", "Hello"])
+        self.assertEqual(response.data["energy_spent"], ENERGY_COST_PER_PRACTICE)
+        self.assertProgressMatchesHistory()
+
+    def test_migrate_runs_the_backfill(self):
+        UserTest.objects.create(user=self.user, test=self.test2, time_spent=5, score_count=100)
+        call_command("migrate", verbosity=0)
+        self.assertProgressMatchesHistory()
@@ -0,0 +1,48 @@
+from django.test import override_settings
+
+from courses.models import Question, QuestionChoice
+from courses.tests.utils import CourseContentTestCase
+
+
+class ValuesListOutputTests(CourseContentTestCase):
+    """Lists built from values() rows must match the regular serializers byte for byte."""
+
+    def assert_same_output(self, url, params=None):
+        with override_settings(VALUES_SERIALIZERS_ENABLED=True):
+            fast = self.client.get(url, params)
+        with override_settings(VALUES_SERIALIZERS_ENABLED=False):
+            regular = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(regular.status_code, 200)
+        self.assertEqual(fast.content, regular.content)
+        return fast.json()
+
+    def test_questions(self):
+        # A choice added later but ordered first, so choice order comes from Meta ordering
+        mcq = self.test1.questions.get(type=Question.Type.MCQ)
+        QuestionChoice.objects.create(question=mcq, text="C", order_index=0)
+        for params in (
+            None,
+            {"test_id": self.test1.test_id},
+            {"fields": "question_id,text"},
+            {"fields": "question_id", "expand": "choices"},
+            {"expand": "choices"},
+        ):
+            with self.subTest(params=params):
+                self.assertTrue(self.assert_same_output("/api/client/questions/", params))
+        first = self.assert_same_output("/api/client/questions/", {"expand": "choices"})[0]
+        self.assertEqual([choice["text"] for choice in first["choices"]], ["C", "A", "B"])
+
+    def test_user_tests_paginated(self):
+        for answers in (["A", "Hello"], ["B", "Hello"], ["B", "x"]):
+            self.submit(self.test1, answers)
+        self.submit(self.test2, ["A", "x"], duration=0)
+
+        self.assert_same_output("/api/client/user-tests/")
+        self.assert_same_output("/api/client/user-tests/", {"fields": "user_test_id,attempt_date"})
+        page = self.assert_same_output("/api/client/user-tests/", {"page_size": 3})
+        self.assertEqual(len(page["results"]), 3)
+        last = self.assert_same_output(page["next"])
+        self.assertEqual(len(last["results"]), 1)
+        self.assertIsNone(last["next"])
+
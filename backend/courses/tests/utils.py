@@ -0,0 +1,56 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from courses.models import Chapter, Course, Question, QuestionChoice, Test
+from courses.services.answer_key import answer_key_cache
+
+
+def make_test(chapter: Chapter, title: str, order_index: int) -> Test:
+    """A test with an MCQ question (choices A/B, A correct) and a fill-in-blank question ("Hello")."""
+    test = Test.objects.create(chapter=chapter, title=title, order_index=order_index, passing_score=50)
+    mcq = Question.objects.create(
+        test=test, text="Pick A", type=Question.Type.MCQ, correct_answer_text="A", order_index=1
+    )
+    QuestionChoice.objects.create(question=mcq, text="A", order_index=1)
+    QuestionChoice.objects.create(question=mcq, text="B", order_index=2)
+    Question.objects.create(
+        test=test, text="Say hello", type=Question.Type.FILL_IN, correct_answer_text="Hello", order_index=2
+    )
+    return test
+
+
+class CourseContentTestCase(TestCase):
+    """One active course (two chapters, two tests in the first), an empty active course and a draft."""
+
+    def setUp(self):
+        cache.clear()
+        answer_key_cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="learner", email="learner@example.com", password="p")
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="p", role=User.ROLE_ADMIN
+        )
+        self.course = Course.objects.create(title="Course", status=Course.Status.ACTIVE)
+        Course.objects.create(title="Empty", status=Course.Status.ACTIVE)
+        Course.objects.create(title="Draft", status=Course.Status.DRAFT)
+        chapter = Chapter.objects.create(course=self.course, title="Chapter 1", order_index=1)
+        Chapter.objects.create(course=self.course, title="Chapter 2", order_index=2)
+        self.test1 = make_test(chapter, "Test 1", 1)
+        self.test2 = make_test(chapter, "Test 2", 2)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.admin)
+
+    def submit(self, test: Test, answers: list[str], client=None, duration: int = 30):
+        """POST a submission answering ``test``'s questions in order; side-effect jobs run on commit."""
+        questions = list(test.questions.order_by("order_index"))
+        payload = {
+            "test_id": test.test_id,
+            "duration": duration,
+            "answers": [{"question_id": q.question_id, "answer_text": a} for q, a in zip(questions, answers)],
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            return (client or self.client).post("/api/client/user-tests/submit/", payload, format="json")
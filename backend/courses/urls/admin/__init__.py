@@ -8,6 +8,9 @@ from .question_choices import urlpatterns as question_choice_urlpatterns
 from .user_courses import urlpatterns as user_course_urlpatterns
 from .user_tests import urlpatterns as user_test_urlpatterns
 from .user_test_answers import urlpatterns as user_test_answer_urlpatterns
+from .question_stats import urlpatterns as question_stats_urlpatterns
+from .reorder import urlpatterns as reorder_urlpatterns
+from .search import urlpatterns as search_urlpatterns
 
 urlpatterns = (
 	course_urlpatterns
@@ -19,6 +22,9 @@ urlpatterns = (
 	+ user_course_urlpatterns
 	+ user_test_urlpatterns
 	+ user_test_answer_urlpatterns
+	+ question_stats_urlpatterns
+	+ reorder_urlpatterns
+	+ search_urlpatterns
 )
 
 __all__ = ["urlpatterns"]
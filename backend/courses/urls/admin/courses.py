@@ -1,9 +1,12 @@
 from django.urls import path
 from courses.views.admin.course import AdminListCoursesView, AdminManageCourseView
+from courses.views.admin.course_transfer import AdminExportCourseView, AdminImportCourseView
 
 urlpatterns = [
     path("courses/", AdminListCoursesView.as_view(), name="admin_course_list"),
     path("courses/<int:course_id>", AdminManageCourseView.as_view(), name="admin_course_detail"),
+    path("courses/import/", AdminImportCourseView.as_view(), name="admin_course_import"),
+    path("courses/<int:course_id>/export/", AdminExportCourseView.as_view(), name="admin_course_export"),
 ]
 
 __all__ = ["urlpatterns"]
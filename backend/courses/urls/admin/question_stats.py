@@ -0,0 +1,8 @@
+from django.urls import path
+from courses.views.admin.question_stats import AdminTestQuestionStatsView
+
+urlpatterns = [
+    path("tests/<int:test_id>/question-stats/", AdminTestQuestionStatsView.as_view(), name="admin_test_question_stats"),
+]
+
+__all__ = ["urlpatterns"]
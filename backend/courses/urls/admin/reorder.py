@@ -0,0 +1,21 @@
+from django.urls import path
+from courses.views.admin.reorder import (
+    AdminReorderChaptersView,
+    AdminReorderQuestionChoicesView,
+    AdminReorderQuestionsView,
+    AdminReorderTestsView,
+)
+
+# /<parent>/<id>/reorder/ reorders the parent's direct children
+urlpatterns = [
+    path("courses/<int:parent_id>/reorder/", AdminReorderChaptersView.as_view(), name="admin_course_reorder_chapters"),
+    path("chapters/<int:parent_id>/reorder/", AdminReorderTestsView.as_view(), name="admin_chapter_reorder_tests"),
+    path("tests/<int:parent_id>/reorder/", AdminReorderQuestionsView.as_view(), name="admin_test_reorder_questions"),
+    path(
+        "questions/<int:parent_id>/reorder/",
+        AdminReorderQuestionChoicesView.as_view(),
+        name="admin_question_reorder_choices",
+    ),
+]
+
+__all__ = ["urlpatterns"]
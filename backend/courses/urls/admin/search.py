@@ -0,0 +1,8 @@
+from django.urls import path
+from courses.views.admin.search import AdminSearchView
+
+urlpatterns = [
+    path("search/", AdminSearchView.as_view(), name="admin_search"),
+]
+
+__all__ = ["urlpatterns"]
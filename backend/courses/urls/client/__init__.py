@@ -9,6 +9,8 @@ from .user_courses import urlpatterns as user_course_urlpatterns
 from .user_tests import urlpatterns as user_test_urlpatterns
 from .user_test_answers import urlpatterns as user_test_answer_urlpatterns
 from .user_test_submissions import urlpatterns as user_test_submission_urlpatterns
+from .search import urlpatterns as search_urlpatterns
+from .review import urlpatterns as review_urlpatterns
 
 urlpatterns = (
 	course_urlpatterns
@@ -21,6 +23,8 @@ urlpatterns = (
 	+ user_test_urlpatterns
 	+ user_test_answer_urlpatterns
 	+ user_test_submission_urlpatterns
+	+ search_urlpatterns
+	+ review_urlpatterns
 )
 
 __all__ = ["urlpatterns"]
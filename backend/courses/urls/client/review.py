@@ -0,0 +1,8 @@
+from django.urls import path
+from courses.views.client.review import ClientNextReviewsView
+
+urlpatterns = [
+    path("review/next/", ClientNextReviewsView.as_view(), name="client_review_next"),
+]
+
+__all__ = ["urlpatterns"]
@@ -0,0 +1,8 @@
+from django.urls import path
+from courses.views.client.search import ClientSearchView
+
+urlpatterns = [
+    path("search/", ClientSearchView.as_view(), name="client_search"),
+]
+
+__all__ = ["urlpatterns"]
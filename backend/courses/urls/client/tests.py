@@ -1,9 +1,10 @@
 from django.urls import path
-from courses.views.client.test import ClientListTestsView, ClientRetrieveTestView
+from courses.views.client.test import ClientListTestsView, ClientRetrieveTestView, ClientTestBundleView
 
 urlpatterns = [
     path("tests/", ClientListTestsView.as_view(), name="client_test_list"),
     path("tests/<int:test_id>", ClientRetrieveTestView.as_view(), name="client_test_detail"),
+    path("tests/<int:test_id>/bundle/", ClientTestBundleView.as_view(), name="client_test_bundle"),
 ]
 
 __all__ = ["urlpatterns"]
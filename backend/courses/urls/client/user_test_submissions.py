@@ -1,8 +1,9 @@
 from django.urls import path
-from courses.views.client.submit_user_test import ClientSubmitUserTestView
+from courses.views.client.submit_user_test import ClientSubmitUserTestView, ClientSubmitUserTestBatchView
 
 urlpatterns = [
     path("user-tests/submit/", ClientSubmitUserTestView.as_view(), name="client_user_test_submit"),
+    path("user-tests/submit/batch/", ClientSubmitUserTestBatchView.as_view(), name="client_user_test_submit_batch"),
 ]
 
 __all__ = ["urlpatterns"]
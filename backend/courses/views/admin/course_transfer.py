@@ -0,0 +1,62 @@
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import permissions, serializers, status
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from courses.models import Course
+from courses.serializers.admin.course import AdminCourseSerializer
+from courses.services.course_transfer import (
+    CSV_FORMAT,
+    JSON_FORMAT,
+    import_course,
+    load_course_document,
+    stream_course_csv,
+    stream_course_json,
+    validate_course_document,
+)
+from users.permissions import IsAdminRole
+
+_COURSE_FIELDS = ("title", "description", "status")
+
+
+class AdminImportCourseView(APIView):
+    """Create a whole course from one document.
+
+    Send the document as the JSON body, or upload it as ``file`` (multipart; .json or .csv).
+    For CSV uploads the course title/description/status come from form fields.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            document = validate_course_document(request.data)
+        else:
+            fmt = (request.data.get("format") or upload.name.rsplit(".", 1)[-1]).lower()
+            if fmt not in (JSON_FORMAT, CSV_FORMAT):
+                raise serializers.ValidationError({"format": "Upload a .json or .csv file"})
+            course_fields = {k: request.data[k] for k in _COURSE_FIELDS if request.data.get(k) not in (None, "")}
+            document = load_course_document(upload.read(), fmt, course_fields=course_fields)
+
+        course, counts = import_course(document, user=request.user)
+        payload = AdminCourseSerializer(course, context={"request": request}).data
+        return Response({**payload, "imported": counts}, status=status.HTTP_201_CREATED)
+
+
+class AdminExportCourseView(APIView):
+    """Stream a course in the import format; ``?file_format=csv`` for the flat CSV variant."""
+    permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+
+    def get(self, request, course_id: int):
+        course = get_object_or_404(Course, course_id=course_id)
+        if request.query_params.get("file_format", JSON_FORMAT).lower() == CSV_FORMAT:
+            response = StreamingHttpResponse(stream_course_csv(course), content_type="text/csv; charset=utf-8")
+            extension = CSV_FORMAT
+        else:
+            response = StreamingHttpResponse(stream_course_json(course), content_type="application/json")
+            extension = JSON_FORMAT
+        response["Content-Disposition"] = f'attachment; filename="course-{course.course_id}.{extension}"'
+        return response
@@ -0,0 +1,21 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from courses.models import Test
+from courses.services.question_stats import get_test_difficulty
+from users.permissions import IsAdminRole
+
+
+class AdminTestQuestionStatsView(APIView):
+    """Per-question attempts, correct rate and difficulty for one test."""
+    permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+
+    def get(self, request, test_id: int):
+        test = get_object_or_404(Test.objects.only("test_id", "title"), test_id=test_id)
+        return Response({
+            "test_id": test.test_id,
+            "title": test.title,
+            "questions": get_test_difficulty(test.test_id),
+        })
@@ -0,0 +1,58 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import permissions, serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from courses.models import Chapter, Course, Question, QuestionChoice, Test
+from courses.serializers.admin.reorder import AdminReorderSerializer
+from courses.services.reorder import ReorderError, reorder_children
+from users.permissions import IsAdminRole
+
+
+class _AdminReorderView(APIView):
+    """Reorder all children of one parent in a single request: ``{"ids": [...]}`` in the new order."""
+    permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    serializer_class = AdminReorderSerializer
+    parent_model = None
+    child_model = None
+    parent_field = None
+
+    def post(self, request, parent_id: int):
+        get_object_or_404(self.parent_model, pk=parent_id)
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            positions = reorder_children(
+                self.child_model,
+                parent_field=self.parent_field,
+                parent_id=parent_id,
+                ordered_ids=serializer.validated_data["ids"],
+            )
+        except ReorderError as exc:
+            raise serializers.ValidationError({"ids": str(exc)}) from exc
+        pk_name = self.child_model._meta.pk.name
+        return Response([{pk_name: pk, "order_index": index} for pk, index in positions])
+
+
+class AdminReorderChaptersView(_AdminReorderView):
+    parent_model = Course
+    child_model = Chapter
+    parent_field = "course_id"
+
+
+class AdminReorderTestsView(_AdminReorderView):
+    parent_model = Chapter
+    child_model = Test
+    parent_field = "chapter_id"
+
+
+class AdminReorderQuestionsView(_AdminReorderView):
+    parent_model = Test
+    child_model = Question
+    parent_field = "test_id"
+
+
+class AdminReorderQuestionChoicesView(_AdminReorderView):
+    parent_model = Question
+    child_model = QuestionChoice
+    parent_field = "question_id"
@@ -0,0 +1,10 @@
+from rest_framework import permissions
+
+from courses.views.client.search import ClientSearchView
+from users.permissions import IsAdminRole
+
+
+class AdminSearchView(ClientSearchView):
+    """Same search as learners get, including draft and archived courses."""
+    permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    active_only = False
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from courses.models import UserCourse
 from courses.serializers.admin.user_course import AdminUserCourseSerializer
 from users.permissions import IsAdminRole
@@ -7,6 +8,8 @@ from users.permissions import IsAdminRole
 class AdminListUserCoursesView(generics.ListCreateAPIView):
     serializer_class = AdminUserCourseSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_course_id"
 
     def get_queryset(self):
         qs = UserCourse.objects.all().select_related("user", "course")
@@ -1,12 +1,36 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from courses.models import UserTest
 from courses.serializers.admin.user_test import AdminUserTestSerializer
+from courses.services.user_test_progress import refresh_user_test_progress
 from users.permissions import IsAdminRole
 
 
-class AdminListUserTestsView(generics.ListCreateAPIView):
+class _RefreshProgressMixin:
+    """Keep UserTestProgress in step with admin edits to attempt history."""
+
+    def perform_create(self, serializer):
+        instance = serializer.save()
+        refresh_user_test_progress(user_id=instance.user_id, test_id=instance.test_id)
+
+    def perform_update(self, serializer):
+        previous = (serializer.instance.user_id, serializer.instance.test_id)
+        instance = serializer.save()
+        refresh_user_test_progress(user_id=instance.user_id, test_id=instance.test_id)
+        if previous != (instance.user_id, instance.test_id):
+            refresh_user_test_progress(user_id=previous[0], test_id=previous[1])
+
+    def perform_destroy(self, instance):
+        user_id, test_id = instance.user_id, instance.test_id
+        instance.delete()
+        refresh_user_test_progress(user_id=user_id, test_id=test_id)
+
+
+class AdminListUserTestsView(_RefreshProgressMixin, generics.ListCreateAPIView):
     serializer_class = AdminUserTestSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_test_id"
 
     def get_queryset(self):
         qs = UserTest.objects.all().select_related("user", "test", "test__chapter", "test__chapter__course")
@@ -19,7 +43,7 @@ class AdminListUserTestsView(generics.ListCreateAPIView):
         return qs.order_by("-user_test_id")
 
 
-class AdminManageUserTestView(generics.RetrieveUpdateDestroyAPIView):
+class AdminManageUserTestView(_RefreshProgressMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = UserTest.objects.select_related("user", "test", "test__chapter", "test__chapter__course").all()
     serializer_class = AdminUserTestSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
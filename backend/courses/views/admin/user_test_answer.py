@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from courses.models import UserTestAnswer
 from courses.serializers.admin.user_test_answer import AdminUserTestAnswerSerializer
 from users.permissions import IsAdminRole
@@ -7,6 +8,12 @@ from users.permissions import IsAdminRole
 class AdminListUserTestAnswersView(generics.ListCreateAPIView):
     serializer_class = AdminUserTestAnswerSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_test_answer_id"
+
+    def requires_pagination(self) -> bool:
+        # Per-attempt listings stay small; the unfiltered table is always served in pages
+        return "user_test_id" not in self.request.query_params
 
     def get_queryset(self):
         qs = UserTestAnswer.objects.all().select_related(
@@ -15,6 +22,7 @@ class AdminListUserTestAnswersView(generics.ListCreateAPIView):
             "user_test__test",
             "user_test__test__chapter",
             "user_test__test__chapter__course",
+            "choice",
         )
         user_test_id = self.request.query_params.get("user_test_id")
         if user_test_id:
@@ -29,6 +37,7 @@ class AdminManageUserTestAnswerView(generics.RetrieveUpdateDestroyAPIView):
         "user_test__test",
         "user_test__test__chapter",
         "user_test__test__chapter__course",
+        "choice",
     ).all()
     serializer_class = AdminUserTestAnswerSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
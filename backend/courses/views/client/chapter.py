@@ -1,21 +1,25 @@
 from rest_framework import generics, permissions
+from common.conditional import ConditionalGetMixin
 from courses.models import Chapter
 from courses.serializers.client.chapter import ClientChapterSerializer
+from courses.services.content_version import content_version_validators
 
-class ClientListChaptersView(generics.ListAPIView):
+class ClientListChaptersView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = ClientChapterSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
 
     def get_queryset(self):
-        qs = Chapter.objects.all().select_related("course")
+        qs = Chapter.objects.all()
         course_id = self.request.query_params.get("course_id")
         if course_id:
             qs = qs.filter(course_id=course_id)
         # Only show chapters belonging to active courses
         return qs.filter(course__status="active").order_by("course_id", "order_index")
 
-class ClientRetrieveChapterView(generics.RetrieveAPIView):
-    queryset = Chapter.objects.select_related("course").filter(course__status="active")
+class ClientRetrieveChapterView(ConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = Chapter.objects.filter(course__status="active")
     serializer_class = ClientChapterSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
     lookup_field = "chapter_id"
@@ -1,17 +1,21 @@
 from rest_framework import generics, permissions
+from common.conditional import ConditionalGetMixin
 from courses.models import Course
 from courses.serializers.client.course import ClientCourseSerializer
+from courses.services.content_version import content_version_validators
 
-class ClientListCoursesView(generics.ListAPIView):
+class ClientListCoursesView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = ClientCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
 
     def get_queryset(self):
         # Only expose active courses to clients
         return Course.objects.filter(status=Course.Status.ACTIVE).order_by("course_id")
 
-class ClientRetrieveCourseView(generics.RetrieveAPIView):
+class ClientRetrieveCourseView(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Course.objects.filter(status=Course.Status.ACTIVE)
     serializer_class = ClientCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
     lookup_field = "course_id"
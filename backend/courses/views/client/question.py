@@ -1,20 +1,55 @@
 from rest_framework import generics, permissions
-from courses.models import Question
+from common.conditional import ConditionalGetMixin
+from common.values_serializer import ValuesListMixin, ValuesSerializer
+from courses.models import Question, QuestionChoice
 from courses.serializers.client.question import ClientQuestionSerializer
+from courses.serializers.client.question_choice import ClientQuestionChoiceSerializer
+from courses.services.content_version import content_version_validators
 
-class ClientListQuestionsView(generics.ListAPIView):
+
+def _with_choices(queryset, request):
+    """Prefetch choices only when the response includes them (``?expand=`` may leave them out)."""
+    if "choices" in ClientQuestionSerializer.selected_field_names(request):
+        return queryset.prefetch_related("choices")
+    return queryset
+
+
+class ClientListQuestionsView(ConditionalGetMixin, ValuesListMixin, generics.ListAPIView):
     serializer_class = ClientQuestionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
+    values_serializer = ValuesSerializer(ClientQuestionSerializer, exclude=["choices"])
+    choice_values_serializer = ValuesSerializer(ClientQuestionChoiceSerializer)
+
+    @classmethod
+    def attach_choice_values(cls, rows, data, choice_rows) -> None:
+        by_question = {row["question_id"]: [] for row in rows}
+        for choice in cls.choice_values_serializer.serialize(choice_rows):
+            by_question[choice["question_id"]].append(choice)
+        for row, item in zip(rows, data):
+            item["choices"] = by_question[row["question_id"]]
+
+    def attach_values(self, rows, data):
+        if "choices" not in self.selected_value_fields():
+            return
+        # Default Meta ordering, same as the prefetch on the serializer path
+        choice_rows = QuestionChoice.objects.filter(question_id__in=[row["question_id"] for row in rows]).values(
+            *self.choice_values_serializer.columns
+        )
+        self.attach_choice_values(rows, data, choice_rows)
 
     def get_queryset(self):
-        qs = Question.objects.all().select_related("test", "test__chapter", "test__chapter__course")
+        qs = _with_choices(Question.objects.all(), self.request)
         test_id = self.request.query_params.get("test_id")
         if test_id:
             qs = qs.filter(test_id=test_id)
         return qs.filter(test__chapter__course__status="active").order_by("test_id", "order_index")
 
-class ClientRetrieveQuestionView(generics.RetrieveAPIView):
-    queryset = Question.objects.select_related("test", "test__chapter", "test__chapter__course").filter(test__chapter__course__status="active")
+class ClientRetrieveQuestionView(ConditionalGetMixin, generics.RetrieveAPIView):
     serializer_class = ClientQuestionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
     lookup_field = "question_id"
+
+    def get_queryset(self):
+        return _with_choices(Question.objects.all(), self.request).filter(test__chapter__course__status="active")
@@ -1,20 +1,24 @@
 from rest_framework import generics, permissions
+from common.conditional import ConditionalGetMixin
 from courses.models import QuestionChoice
 from courses.serializers.client.question_choice import ClientQuestionChoiceSerializer
+from courses.services.content_version import content_version_validators
 
-class ClientListQuestionChoicesView(generics.ListAPIView):
+class ClientListQuestionChoicesView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = ClientQuestionChoiceSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
 
     def get_queryset(self):
-        qs = QuestionChoice.objects.all().select_related("question", "question__test", "question__test__chapter", "question__test__chapter__course")
+        qs = QuestionChoice.objects.all()
         question_id = self.request.query_params.get("question_id")
         if question_id:
             qs = qs.filter(question_id=question_id)
         return qs.filter(question__test__chapter__course__status="active").order_by("question_id", "order_index")
 
-class ClientRetrieveQuestionChoiceView(generics.RetrieveAPIView):
-    queryset = QuestionChoice.objects.select_related("question", "question__test", "question__test__chapter", "question__test__chapter__course").filter(question__test__chapter__course__status="active")
+class ClientRetrieveQuestionChoiceView(ConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = QuestionChoice.objects.filter(question__test__chapter__course__status="active")
     serializer_class = ClientQuestionChoiceSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
     lookup_field = "choice_id"
@@ -0,0 +1,20 @@
+from rest_framework import generics, permissions, response, serializers
+
+from courses.serializers.client.review import ClientReviewItemSerializer
+from courses.services.review_queue import REVIEW_DEFAULT_LIMIT, REVIEW_MAX_LIMIT, get_due_reviews
+
+
+class ClientNextReviewsView(generics.GenericAPIView):
+    """Questions due for review (earliest first): ``?limit=`` up to REVIEW_MAX_LIMIT."""
+    serializer_class = ClientReviewItemSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = serializers.IntegerField(min_value=1, max_value=REVIEW_MAX_LIMIT).run_validation(
+                request.query_params.get("limit", REVIEW_DEFAULT_LIMIT)
+            )
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({"limit": exc.detail}) from exc
+        items = get_due_reviews(request.user, limit=limit)
+        return response.Response(self.get_serializer(items, many=True).data)
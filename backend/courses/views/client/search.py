@@ -0,0 +1,27 @@
+from rest_framework import generics, permissions, response, serializers
+
+from courses.serializers.client.search import SearchQuerySerializer
+from courses.services.search import InvalidSearchCursor, search_content
+
+
+class ClientSearchView(generics.GenericAPIView):
+    """Ranked full-text search over active course content: ``?q=...&kind=question&cursor=...``."""
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = SearchQuerySerializer
+    active_only = True
+
+    def get(self, request, *args, **kwargs):
+        params = self.get_serializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        try:
+            results, next_cursor = search_content(
+                data["q"],
+                active_only=self.active_only,
+                kinds=data.get("kind") or None,
+                cursor=data.get("cursor") or None,
+                limit=data["limit"],
+            )
+        except InvalidSearchCursor as exc:
+            raise serializers.ValidationError({"cursor": str(exc)}) from exc
+        return response.Response({"results": results, "next_cursor": next_cursor})
@@ -1,8 +1,13 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 
-from courses.serializers.client.submit_user_test import SubmitUserTestSerializer
-from courses.services.user_test_submission import submit_user_test, SubmissionAnswer
+from courses.serializers.client.submit_user_test import SubmitUserTestSerializer, SubmitUserTestBatchSerializer
+from courses.services.user_test_submission import (
+    submit_user_test,
+    submit_user_test_batch,
+    SubmissionAnswer,
+    SubmissionAttempt,
+)
 
 
 class ClientSubmitUserTestView(generics.CreateAPIView):
@@ -38,3 +43,52 @@ class ClientSubmitUserTestView(generics.CreateAPIView):
         }
         headers = self.get_success_headers(response_payload)
         return Response(response_payload, status=status.HTTP_201_CREATED, headers=headers)
+
+
+class ClientSubmitUserTestBatchView(generics.CreateAPIView):
+    """Replay several offline attempts in one request; returns one result per attempt, in input order."""
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = SubmitUserTestBatchSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        attempts = [
+            SubmissionAttempt(
+                test_id=a["test_id"],
+                duration=a["duration"],
+                answers=[
+                    SubmissionAnswer(question_id=ans.get("question_id"), answer_text=ans.get("answer_text") or "")
+                    for ans in a.get("answers", [])
+                ],
+                attempted_at=a.get("attempted_at"),
+            )
+            for a in serializer.validated_data["attempts"]
+        ]
+        result = submit_user_test_batch(user=request.user, attempts=attempts)
+
+        attempt_payloads = []
+        for r in result.attempts:
+            if r.error is not None:
+                attempt_payloads.append({"index": r.index, "status": "rejected", "detail": r.error})
+                continue
+            attempt_payloads.append({
+                "index": r.index,
+                "status": "created",
+                "user_test_id": r.user_test.user_test_id,
+                "attempt_date": r.user_test.attempt_date,
+                "time_spent": r.user_test.time_spent,
+                "total_questions": r.total_questions,
+                "answered_count": r.answered_count,
+                "correct_count": r.correct_count,
+                "xp_awarded": r.xp_awarded,
+                "energy_spent": r.energy_spent,
+            })
+
+        response_payload = {
+            "attempts": attempt_payloads,
+            "xp_awarded": result.xp_awarded,
+            "energy_spent": result.energy_spent,
+            "streak_dates_created": result.streak_dates_created,
+        }
+        return Response(response_payload, status=status.HTTP_201_CREATED)
@@ -1,20 +1,48 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, status
+from common.conditional import ConditionalGetMixin, etag_matches
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
 from courses.models import Test
 from courses.serializers.client.test import ClientTestSerializer
+from courses.services.content_version import content_version_validators, get_content_version
+from courses.services.test_bundle import bundle_etag, get_test_bundle, test_bundle_available
 
-class ClientListTestsView(generics.ListAPIView):
+class ClientListTestsView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = ClientTestSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
 
     def get_queryset(self):
-        qs = Test.objects.all().select_related("chapter", "chapter__course")
+        qs = ClientTestSerializer.with_related(Test.objects.all(), self.request)
         chapter_id = self.request.query_params.get("chapter_id")
         if chapter_id:
             qs = qs.filter(chapter_id=chapter_id)
         return qs.filter(chapter__course__status="active").order_by("chapter_id", "order_index")
 
-class ClientRetrieveTestView(generics.RetrieveAPIView):
-    queryset = Test.objects.select_related("chapter", "chapter__course").filter(chapter__course__status="active")
+class ClientRetrieveTestView(ConditionalGetMixin, generics.RetrieveAPIView):
     serializer_class = ClientTestSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_provider = content_version_validators
     lookup_field = "test_id"
+
+    def get_queryset(self):
+        qs = ClientTestSerializer.with_related(Test.objects.all(), self.request)
+        return qs.filter(chapter__course__status="active")
+
+class ClientTestBundleView(generics.GenericAPIView):
+    """Test + questions + choices in one response, revalidated with an ETag."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, test_id: int, *args, **kwargs):
+        version = get_content_version()
+        etag = bundle_etag(test_id, version)
+        # Unchanged content: answer without building the bundle, but only for a test a 200 would serve
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            if not test_bundle_available(test_id, version):
+                raise NotFound("Test not found")
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        bundle = get_test_bundle(test_id, version)
+        if bundle is None:
+            raise NotFound("Test not found")
+        return Response(bundle, headers={"ETag": etag})
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions, status
+from common.pagination import KeysetCursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from courses.models import UserCourse
@@ -9,9 +10,12 @@ from courses.models import Course
 class ClientListUserCoursesView(generics.ListCreateAPIView):
     serializer_class = ClientUserCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_course_id"
 
     def get_queryset(self):
-        qs = UserCourse.objects.filter(user=self.request.user, is_dropped=False).select_related("course")
+        qs = UserCourse.objects.filter(user=self.request.user, is_dropped=False)
+        qs = ClientUserCourseSerializer.with_related(qs, self.request)
         course_id = self.request.query_params.get("course_id")
         if course_id:
             qs = qs.filter(course_id=course_id)
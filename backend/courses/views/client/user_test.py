@@ -1,18 +1,19 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
+from common.values_serializer import ValuesListMixin, ValuesSerializer
 from courses.models import UserTest
 from courses.serializers.client.user_test import ClientUserTestSerializer
 
 
-class ClientListUserTestsView(generics.ListAPIView):
+class ClientListUserTestsView(ValuesListMixin, generics.ListAPIView):
     serializer_class = ClientUserTestSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_test_id"
+    values_serializer = ValuesSerializer(ClientUserTestSerializer)
 
     def get_queryset(self):
-        qs = UserTest.objects.filter(user=self.request.user).select_related(
-            "test",
-            "test__chapter",
-            "test__chapter__course",
-        )
+        qs = ClientUserTestSerializer.with_related(UserTest.objects.filter(user=self.request.user), self.request)
         test_id = self.request.query_params.get("test_id")
         if test_id:
             qs = qs.filter(test_id=test_id)
@@ -25,8 +26,4 @@ class ClientRetrieveUserTestView(generics.RetrieveAPIView):
     lookup_field = "user_test_id"
 
     def get_queryset(self):
-        return UserTest.objects.filter(user=self.request.user).select_related(
-            "test",
-            "test__chapter",
-            "test__chapter__course",
-        )
+        return ClientUserTestSerializer.with_related(UserTest.objects.filter(user=self.request.user), self.request)
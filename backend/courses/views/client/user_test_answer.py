@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from courses.models import UserTestAnswer
 from courses.serializers.client.user_test_answer import ClientUserTestAnswerSerializer
 
@@ -6,15 +7,13 @@ from courses.serializers.client.user_test_answer import ClientUserTestAnswerSeri
 class ClientListUserTestAnswersView(generics.ListAPIView):
     serializer_class = ClientUserTestAnswerSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-user_test_answer_id"
 
     def get_queryset(self):
-        qs = UserTestAnswer.objects.select_related(
-            "user_test",
-            "user_test__user",
-            "user_test__test",
-            "user_test__test__chapter",
-            "user_test__test__chapter__course",
-        ).filter(user_test__user=self.request.user)
+        qs = ClientUserTestAnswerSerializer.with_related(
+            UserTestAnswer.objects.filter(user_test__user=self.request.user), self.request
+        )
         user_test_id = self.request.query_params.get("user_test_id")
         if user_test_id:
             qs = qs.filter(user_test_id=user_test_id)
@@ -27,10 +26,6 @@ class ClientRetrieveUserTestAnswerView(generics.RetrieveAPIView):
     lookup_field = "user_test_answer_id"
 
     def get_queryset(self):
-        return UserTestAnswer.objects.select_related(
-            "user_test",
-            "user_test__user",
-            "user_test__test",
-            "user_test__test__chapter",
-            "user_test__test__chapter__course",
-        ).filter(user_test__user=self.request.user)
+        return ClientUserTestAnswerSerializer.with_related(
+            UserTestAnswer.objects.filter(user_test__user=self.request.user), self.request
+        )
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from feedback.models import Feedback
 from feedback.serializers.admin import AdminFeedbackSerializer
 from users.permissions import IsAdminRole
@@ -8,6 +9,8 @@ class AdminListFeedbackView(generics.ListCreateAPIView):
     queryset = Feedback.objects.select_related("created_by", "updated_by").all()
     serializer_class = AdminFeedbackSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-feedback_id"
 
 
 class AdminManageFeedbackView(generics.RetrieveUpdateDestroyAPIView):
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from feedback.models import Feedback
 from feedback.serializers.client import ClientFeedbackSerializer
 
@@ -6,6 +7,8 @@ from feedback.serializers.client import ClientFeedbackSerializer
 class ClientListFeedbackView(generics.ListAPIView):
     serializer_class = ClientFeedbackSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-feedback_id"
 
     def get_queryset(self):
         return Feedback.objects.filter(created_by=self.request.user).order_by("-feedback_id")
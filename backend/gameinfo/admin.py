@@ -1,8 +1,29 @@
 from django.contrib import admin
-from .models import UserGameInfos
+from .models import LeaderboardSnapshot, UserGameInfos, XpEvent
 
 @admin.register(UserGameInfos)
 class UserGameInfosAdmin(admin.ModelAdmin):
     list_display = ("gameinfo_id", "user", "xp_value", "energy_value", "energy_last_updated_date")
     search_fields = ("user__username", "user__email")
     list_filter = ("energy_last_updated_date",)
+
+    def save_model(self, request, obj, form, change):
+        # Record XP edits in the XpEvent ledger (see UserGameInfos.set_xp)
+        xp_value = obj.xp_value
+        obj.xp_value = form.initial.get("xp_value", 0) if change else 0
+        super().save_model(request, obj, form, change)
+        obj.set_xp(xp_value)
+
+
+@admin.register(XpEvent)
+class XpEventAdmin(admin.ModelAdmin):
+    list_display = ("xp_event_id", "user", "amount", "created_at")
+    search_fields = ("user__username", "user__email")
+    list_filter = ("created_at",)
+
+
+@admin.register(LeaderboardSnapshot)
+class LeaderboardSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("period", "rank", "user", "xp_value", "period_start", "refreshed_at")
+    search_fields = ("user__username", "user__email")
+    list_filter = ("period",)
@@ -5,3 +5,7 @@ class GameinfoConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "gameinfo"
     verbose_name = "Game Info"
+
+    def ready(self):
+        # Keep the in-process leaderboard index in step with game info writes
+        from gameinfo import signals  # noqa: F401
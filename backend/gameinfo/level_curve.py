@@ -0,0 +1,120 @@
+"""Level curves: map total XP to a level without walking the levels one by one.
+
+- LinearLevelCurve: the cost of leaving level L is ``step * L + base``; solved exactly in
+  integer arithmetic (isqrt), O(1) for any XP.
+- TableLevelCurve: any per-level cost function, precomputed into a cumulative-XP table up to
+  ``max_level`` and searched with bisect.
+
+The game uses DEFAULT_LEVEL_CURVE (base 50, step 50: 100 XP for L1->L2, 150 for L2->L3, ...).
+"""
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+
+@dataclass(frozen=True)
+class LevelProgress:
+    level: int
+    # XP earned since reaching ``level`` and the XP needed to leave it
+    xp_into_level: int
+    next_level_xp: int
+
+    @property
+    def progress_pct(self) -> int:
+        """Integer percent [0..100] of the way to the next level."""
+        if self.next_level_xp <= 0:
+            return 100
+        pct = int(round((self.xp_into_level / self.next_level_xp) * 100))
+        return max(0, min(100, pct))
+
+
+class LevelCurve:
+    def level_up_xp(self, level: int) -> int:
+        """XP required to advance from ``level`` to the next one."""
+        raise NotImplementedError
+
+    def xp_for_level(self, level: int) -> int:
+        """Total XP at which ``level`` is reached (0 for level 1)."""
+        raise NotImplementedError
+
+    def level_for_xp(self, total_xp: int) -> int:
+        raise NotImplementedError
+
+    def levels_for_xp(self, xp_values: Iterable[int]) -> list[int]:
+        """Batch form of level_for_xp, e.g. for a leaderboard page."""
+        level_for_xp = self.level_for_xp
+        return [level_for_xp(xp) for xp in xp_values]
+
+    def progress(self, total_xp: int) -> LevelProgress:
+        total_xp = max(0, int(total_xp or 0))
+        level = self.level_for_xp(total_xp)
+        return LevelProgress(
+            level=level,
+            xp_into_level=total_xp - self.xp_for_level(level),
+            next_level_xp=self.level_up_xp(level),
+        )
+
+
+class LinearLevelCurve(LevelCurve):
+    def __init__(self, *, base: int, step: int):
+        if step <= 0 or base < 0:
+            raise ValueError("LinearLevelCurve needs step > 0 and base >= 0")
+        self.base = base
+        self.step = step
+
+    def level_up_xp(self, level: int) -> int:
+        return self.step * max(level, 1) + self.base
+
+    def xp_for_level(self, level: int) -> int:
+        n = max(level, 1) - 1
+        return self.step * n * (n + 1) // 2 + self.base * n
+
+    def level_for_xp(self, total_xp: int) -> int:
+        """Largest n with xp_for_level(n) <= total_xp.
+
+        xp_for_level(n) = (a*n^2 + (2b - a)*n - 2b) / 2 for step a and base b; completing the
+        square gives n = floor((isqrt(8a*(xp + b) + (2b - a)^2) - (2b - a)) / 2a).
+        """
+        if total_xp is None or total_xp <= 0:
+            return 1
+        a, b = self.step, self.base
+        c = 2 * b - a
+        return max(1, (math.isqrt(8 * a * (int(total_xp) + b) + c * c) - c) // (2 * a))
+
+
+class TableLevelCurve(LevelCurve):
+    """Arbitrary per-level costs; XP beyond the table stays at ``max_level``."""
+
+    def __init__(self, level_up_xp: Callable[[int], int], *, max_level: int):
+        if max_level < 1:
+            raise ValueError("max_level must be at least 1")
+        self._level_up_xp = level_up_xp
+        self.max_level = max_level
+        # thresholds[i] is the total XP at which level i + 1 is reached
+        self.thresholds = [0]
+        for level in range(1, max_level):
+            cost = level_up_xp(level)
+            if cost <= 0:
+                raise ValueError(f"Level {level} must cost a positive amount of XP")
+            self.thresholds.append(self.thresholds[-1] + cost)
+
+    def level_up_xp(self, level: int) -> int:
+        if level >= self.max_level:
+            return 0
+        return self._level_up_xp(max(level, 1))
+
+    def xp_for_level(self, level: int) -> int:
+        return self.thresholds[min(max(level, 1), self.max_level) - 1]
+
+    def level_for_xp(self, total_xp: int) -> int:
+        if total_xp is None or total_xp <= 0:
+            return 1
+        return bisect.bisect_right(self.thresholds, int(total_xp))
+
+
+DEFAULT_LEVEL_CURVE: LevelCurve = LinearLevelCurve(base=50, step=50)
+
+__all__ = ["DEFAULT_LEVEL_CURVE", "LevelCurve", "LevelProgress", "LinearLevelCurve", "TableLevelCurve"]
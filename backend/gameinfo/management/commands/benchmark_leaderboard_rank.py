@@ -0,0 +1,106 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from gameinfo.models import UserGameInfos
+from gameinfo.services.leaderboard import LEADERBOARD_ORDERING, rank_of
+from gameinfo.services.leaderboard_index import DatabaseLeaderboardIndex, LocalLeaderboardIndex
+
+BATCH_SIZE = 5000
+AROUND_RADIUS = 10
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _legacy_rank(gameinfo: UserGameInfos) -> int:
+    """What MyLeaderboardRankView used to do: load every user_id in order and search the list."""
+    user_ids = list(UserGameInfos.objects.order_by(*LEADERBOARD_ORDERING).values_list("user_id", flat=True))
+    return user_ids.index(gameinfo.user_id) + 1
+
+
+def _seed(count: int) -> None:
+    User = get_user_model()
+    rng = random.Random(42)
+    for start in range(0, count, BATCH_SIZE):
+        users = User.objects.bulk_create(
+            [
+                User(username=f"bench_rank_{i}", email=f"bench_rank_{i}@example.invalid")
+                for i in range(start, min(start + BATCH_SIZE, count))
+            ]
+        )
+        UserGameInfos.objects.bulk_create(
+            [
+                # Coarse XP/energy values so ties on both columns are common
+                UserGameInfos(user=user, xp_value=rng.randrange(0, 200_000, 10), energy_value=rng.randrange(0, 101))
+                for user in users
+            ]
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Time leaderboard rank lookups (the COUNT over rows ranked ahead, the in-process index, loading the "
+        "full ordering) and the keyset around-me window. "
+        "--seed N adds N synthetic players inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--samples", type=int, default=5, help="Players to look up, spread over the ranking")
+        parser.add_argument("--skip-legacy", action="store_true", help="Only time the COUNT query")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if options["seed"] > 0:
+                    _seed(options["seed"])
+                self._run(max(1, options["samples"]), options["skip_legacy"])
+                if options["seed"] > 0:
+                    raise _Rollback
+        except _Rollback:
+            self.stdout.write("Seeded rows rolled back.")
+
+    def _run(self, samples: int, skip_legacy: bool) -> None:
+        total = UserGameInfos.objects.count()
+        if total == 0:
+            raise CommandError("No game info rows; pass --seed N")
+        ordered = UserGameInfos.objects.order_by(*LEADERBOARD_ORDERING)
+        positions = sorted({min(total - 1, i * total // samples) for i in range(samples)} | {total - 1})
+        index = LocalLeaderboardIndex()
+        start = time.perf_counter()
+        index.rebuild()
+        self.stdout.write(f"{total} players; in-process index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+        for position in positions:
+            gameinfo = ordered[position]
+            start = time.perf_counter()
+            rank = rank_of(gameinfo)
+            count_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            indexed = index.rank(gameinfo)
+            index_ms = (time.perf_counter() - start) * 1000
+            if indexed != rank:
+                raise CommandError(f"Rank mismatch at position {position + 1}: count {rank}, index {indexed}")
+            start = time.perf_counter()
+            first_rank, window = DatabaseLeaderboardIndex().around(gameinfo, AROUND_RADIUS)
+            around_ms = (time.perf_counter() - start) * 1000
+            if window[rank - first_rank].gameinfo_id != gameinfo.gameinfo_id:
+                raise CommandError(f"Around-me window at rank {rank} does not centre on the player")
+            line = (
+                f"rank {rank:>8}: count {count_ms:8.2f} ms, index {index_ms:6.3f} ms, "
+                f"around-me (SQL, radius {AROUND_RADIUS}) {around_ms:7.2f} ms"
+            )
+            if not skip_legacy:
+                start = time.perf_counter()
+                legacy = _legacy_rank(gameinfo)
+                legacy_ms = (time.perf_counter() - start) * 1000
+                if legacy != rank:
+                    raise CommandError(f"Rank mismatch at position {position + 1}: count {rank}, legacy {legacy}")
+                line += f", full list {legacy_ms:8.2f} ms ({legacy_ms / max(count_ms, 1e-6):.1f}x)"
+            if rank != position + 1:
+                raise CommandError(f"Expected rank {position + 1}, got {rank}")
+            self.stdout.write(line)
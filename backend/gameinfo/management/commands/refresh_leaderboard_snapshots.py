@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from gameinfo.models import LeaderboardSnapshot
+from gameinfo.services.leaderboard_snapshot import prune_xp_events, refresh_leaderboard_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-rank the all-time, weekly and monthly leaderboards into LeaderboardSnapshot (one INSERT ... SELECT each), "
+        "then delete XpEvent rows older than the open weekly/monthly windows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--period",
+            action="append",
+            choices=LeaderboardSnapshot.Period.values,
+            help="Period to refresh (repeatable); defaults to all of them",
+        )
+        parser.add_argument("--no-prune", action="store_true", help="Keep old XpEvent rows")
+
+    def handle(self, *args, **options):
+        for period in options["period"] or LeaderboardSnapshot.Period.values:
+            ranked = refresh_leaderboard_snapshot(period)
+            self.stdout.write(self.style.SUCCESS(f"{period}: ranked {ranked} players"))
+        if not options["no_prune"]:
+            pruned = prune_xp_events()
+            self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} XP events"))
@@ -1,3 +1,5 @@
 from .user_game_infos import UserGameInfos
+from .xp_event import XpEvent
+from .leaderboard_snapshot import LeaderboardSnapshot
 
-__all__ = ["UserGameInfos"]
+__all__ = ["UserGameInfos", "XpEvent", "LeaderboardSnapshot"]
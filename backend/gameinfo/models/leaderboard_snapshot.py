@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+
+
+class LeaderboardSnapshot(models.Model):
+    """One ranked row of a periodically refreshed leaderboard.
+
+    Each period holds the rows of its latest refresh only (see
+    gameinfo.services.leaderboard_snapshot), so reads are index range scans on (period, rank)
+    or (period, user) and never touch UserGameInfos.
+    """
+
+    class Period(models.TextChoices):
+        ALL_TIME = "all_time", "All time"
+        WEEKLY = "weekly", "Weekly"
+        MONTHLY = "monthly", "Monthly"
+
+    leaderboard_snapshot_id = models.BigAutoField(primary_key=True)
+    period = models.CharField(max_length=20, choices=Period.choices)
+    # Start of the window the XP was summed over (null for all time)
+    period_start = models.DateTimeField(null=True, blank=True)
+    rank = models.PositiveIntegerField()
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="leaderboard_snapshots")
+    xp_value = models.PositiveIntegerField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Leaderboard Snapshot"
+        verbose_name_plural = "Leaderboard Snapshots"
+        ordering = ["period", "rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["period", "rank"], name="uniq_leaderboard_snapshot_period_rank"),
+            models.UniqueConstraint(fields=["period", "user"], name="uniq_leaderboard_snapshot_period_user"),
+        ]
+
+    def __str__(self):
+        return f"LeaderboardSnapshot<{self.period} #{self.rank} user={self.user_id}>"
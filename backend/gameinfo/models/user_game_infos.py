@@ -2,6 +2,7 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
+from .xp_event import XpEvent
 from common import (
     ENERGY_MAX,
     get_regen_interval_for_user,
@@ -20,6 +21,10 @@ class UserGameInfos(models.Model):
         verbose_name = "User Game Info"
         verbose_name_plural = "User Game Infos"
         ordering = ["-xp_value", "-energy_value"]
+        indexes = [
+            # Leaderboard order (see gameinfo.services.leaderboard): top-N scans and rank counts
+            models.Index(fields=["-xp_value", "-energy_value", "gameinfo_id"], name="idx_gameinfo_leaderboard"),
+        ]
 
     def add_xp(self, amount: int):
         if amount < 0:
@@ -29,8 +34,23 @@ class UserGameInfos(models.Model):
         boosted = int(round(amount * multiplier))
         self.xp_value += boosted
         self.save(update_fields=["xp_value"])
+        if boosted > 0:
+            XpEvent.objects.create(user_id=self.user_id, amount=boosted)
         return boosted
 
+    def set_xp(self, value: int) -> int:
+        """Set XP to ``value`` (an admin correction); returns the change.
+
+        The change is recorded in the XpEvent ledger, negative when XP was taken away, so
+        weekly/monthly leaderboards follow the edit.
+        """
+        delta = value - self.xp_value
+        self.xp_value = value
+        self.save(update_fields=["xp_value"])
+        if delta:
+            XpEvent.objects.create(user_id=self.user_id, amount=delta)
+        return delta
+
     def decrement_energy(self, amount: int = 1):
         if amount < 0:
             return
@@ -65,36 +85,44 @@ class UserGameInfos(models.Model):
         - Updates energy_last_updated_date by the exact number of intervals applied,
           preserving any remainder time for future regen ticks.
         """
-        now = timezone.now()
         if not self.energy_last_updated_date:
-            self.energy_last_updated_date = now
+            self.energy_last_updated_date = timezone.now()
             self.save(update_fields=["energy_last_updated_date"])
             return
 
         interval: timedelta = get_regen_interval_for_user(self.user)
+        if self._regen_energy(interval):
+            self.save(update_fields=["energy_value", "energy_last_updated_date"])
+
+    def _regen_energy(self, interval: timedelta) -> bool:
+        """Apply passive regen in memory; returns True when fields changed."""
+        now = timezone.now()
+        if not self.energy_last_updated_date:
+            self.energy_last_updated_date = now
+            return True
         if interval <= timedelta(0):
-            return
+            return False
 
         elapsed = now - self.energy_last_updated_date
         if elapsed < interval:
-            return
+            return False
 
         # Calculate how many full intervals have passed
         increments = elapsed // interval
         if increments <= 0:
-            return
+            return False
 
         # If there is a cap, limit increments to the missing amount
         if ENERGY_MAX is not None:
             missing = max(0, ENERGY_MAX - self.energy_value)
             if missing <= 0:
-                return
+                return False
             used_increments = int(min(increments, missing))
         else:
             used_increments = int(increments)
 
         if used_increments <= 0:
-            return
+            return False
 
         self.energy_value += used_increments
         # Advance last_updated by the exact time consumed by applied increments
@@ -102,7 +130,23 @@ class UserGameInfos(models.Model):
         # Clamp to cap if needed
         if ENERGY_MAX is not None and self.energy_value > ENERGY_MAX:
             self.energy_value = ENERGY_MAX
-        self.save(update_fields=["energy_value", "energy_last_updated_date"])
+        return True
+
+    def settle_attempts(self, *, energy_cost: int, xp_amount: int, regen_interval: timedelta) -> None:
+        """Apply passive regen, spend energy and add (already boosted) XP with a single UPDATE.
+
+        Used by test submission so the locked row is written once per request; credited XP is
+        also recorded in the XpEvent ledger.
+        """
+        self._regen_energy(regen_interval)
+        if energy_cost > 0 and self.energy_value > 0:
+            self.energy_value = max(0, self.energy_value - energy_cost)
+            self.energy_last_updated_date = timezone.now()
+        if xp_amount > 0:
+            self.xp_value += xp_amount
+        self.save(update_fields=["xp_value", "energy_value", "energy_last_updated_date"])
+        if xp_amount > 0:
+            XpEvent.objects.create(user_id=self.user_id, amount=xp_amount)
 
     def __str__(self):
         return f"GameInfo<{self.user.username}>"
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class XpEvent(models.Model):
+    """Ledger of XP changes for a user; weekly and monthly leaderboards sum it over their window.
+
+    Amounts are positive for XP earned and negative for admin corrections (UserGameInfos.set_xp).
+    """
+
+    xp_event_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="xp_events")
+    amount = models.IntegerField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "XP Event"
+        verbose_name_plural = "XP Events"
+        ordering = ["-created_at", "-xp_event_id"]
+        indexes = [
+            # Period totals: range on created_at, grouped by user
+            models.Index(fields=["created_at", "user"], name="idx_xp_event_created_user"),
+        ]
+
+    def __str__(self):
+        return f"XpEvent<user={self.user_id} {self.amount:+d}>"
@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import serializers
 from ...models import UserGameInfos
 
@@ -15,3 +16,12 @@ class AdminUserGameInfosSerializer(serializers.ModelSerializer):
             "energy_last_updated_date",
         ]
         read_only_fields = ["gameinfo_id", "energy_last_updated_date"]
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        # XP goes through set_xp so the edit reaches the XpEvent ledger behind the period leaderboards
+        xp_value = validated_data.pop("xp_value", None)
+        instance = super().update(instance, validated_data)
+        if xp_value is not None:
+            instance.set_xp(xp_value)
+        return instance
@@ -13,7 +13,8 @@ class LeaderboardEntrySerializer(serializers.Serializer):
 
 
 class CurrentUserRankSerializer(serializers.Serializer):
-    rank = serializers.IntegerField()
+    # Null when the player is not on the board's latest snapshot (e.g. no XP earned in the period)
+    rank = serializers.IntegerField(allow_null=True)
     user_id = serializers.IntegerField()
     username = serializers.CharField()
     xp_value = serializers.IntegerField()
@@ -3,7 +3,7 @@ from django.utils import timezone
 import math
 from common import ENERGY_MAX, get_regen_interval_for_user
 from ...models import UserGameInfos
-from ...utils import compute_level_from_total_xp, get_level_up_xp
+from ...level_curve import DEFAULT_LEVEL_CURVE
 
 class ClientUserGameInfosSerializer(serializers.ModelSerializer):
     # Derived fields for client display
@@ -34,8 +34,16 @@ class ClientUserGameInfosSerializer(serializers.ModelSerializer):
             "time_to_max_energy_seconds",
         ]
 
+    def _progress(self, obj: UserGameInfos):
+        # The three level fields share one curve evaluation per object (keyed by XP in case it changed)
+        xp = getattr(obj, "xp_value", 0) or 0
+        cached = getattr(obj, "_level_progress", None)
+        if cached is None or cached[0] != xp:
+            cached = obj._level_progress = (xp, DEFAULT_LEVEL_CURVE.progress(xp))
+        return cached[1]
+
     def get_level(self, obj: UserGameInfos) -> int:
-        return compute_level_from_total_xp(getattr(obj, "xp_value", 0) or 0)
+        return self._progress(obj).level
 
     def get_next_level_xp(self, obj: UserGameInfos) -> int:
         """XP required to advance from the current level to the next.
@@ -43,39 +51,14 @@ class ClientUserGameInfosSerializer(serializers.ModelSerializer):
         This is the segment length for the user's current level, useful as the denominator
         when computing progress to the next level in the client.
         """
-        level = self.get_level(obj)
-        return get_level_up_xp(level)
+        return self._progress(obj).next_level_xp
 
     def get_next_level_progress_pct(self, obj: UserGameInfos) -> int:
         """Integer percent [0..100] of progress within the current level.
 
         Computes XP already earned within this level divided by the XP required to reach the next level.
         """
-        total_xp = int(getattr(obj, "xp_value", 0) or 0)
-        if total_xp <= 0:
-            return 0
-
-        # Derive current level and XP into this level by simulating the progression.
-        level = 1
-        xp_remaining = total_xp
-        while True:
-            req = get_level_up_xp(level)
-            if xp_remaining < req:
-                # xp_remaining is XP into current level
-                denom = req
-                break
-            xp_remaining -= req
-            level += 1
-
-        if denom <= 0:
-            return 0
-        # Clamp to [0, 100]
-        pct = int(round((xp_remaining / denom) * 100))
-        if pct < 0:
-            return 0
-        if pct > 100:
-            return 100
-        return pct
+        return self._progress(obj).progress_pct
 
     def get_time_to_max_energy_seconds(self, obj: UserGameInfos) -> int:
         """Seconds remaining until the user's energy reaches the cap (ENERGY_MAX).
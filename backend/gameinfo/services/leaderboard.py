@@ -0,0 +1,76 @@
+"""Leaderboard ordering and rank lookups over UserGameInfos.
+
+Players are ordered by XP, then energy (both descending), then gameinfo_id as the tie-breaker,
+so every player has a distinct position. idx_gameinfo_leaderboard matches that ordering.
+"""
+from __future__ import annotations
+
+from django.db.models import Q
+
+from gameinfo.models import UserGameInfos
+
+LEADERBOARD_ORDERING = ("-xp_value", "-energy_value", "gameinfo_id")
+LEADERBOARD_ORDERING_REVERSED = ("xp_value", "energy_value", "-gameinfo_id")
+ENTRY_FIELDS = ("gameinfo_id", "user_id", "xp_value", "energy_value")
+
+
+def ranked_ahead_of(xp_value: int, energy_value: int, gameinfo_id: int) -> Q:
+    """Rows that sort strictly before the given position in LEADERBOARD_ORDERING."""
+    return (
+        Q(xp_value__gt=xp_value)
+        | Q(xp_value=xp_value, energy_value__gt=energy_value)
+        | Q(xp_value=xp_value, energy_value=energy_value, gameinfo_id__lt=gameinfo_id)
+    )
+
+
+def ranked_behind(xp_value: int, energy_value: int, gameinfo_id: int) -> Q:
+    """Rows that sort strictly after the given position in LEADERBOARD_ORDERING."""
+    return (
+        Q(xp_value__lt=xp_value)
+        | Q(xp_value=xp_value, energy_value__lt=energy_value)
+        | Q(xp_value=xp_value, energy_value=energy_value, gameinfo_id__gt=gameinfo_id)
+    )
+
+
+def rank_of(gameinfo: UserGameInfos) -> int:
+    """1-based position of ``gameinfo``: one COUNT over the rows ranked ahead of it."""
+    ahead = UserGameInfos.objects.filter(
+        ranked_ahead_of(gameinfo.xp_value, gameinfo.energy_value, gameinfo.gameinfo_id)
+    ).count()
+    return ahead + 1
+
+
+def players_above(gameinfo: UserGameInfos, limit: int) -> list[tuple]:
+    """Up to ``limit`` ENTRY_FIELDS tuples ranked just ahead of ``gameinfo``, nearest first.
+
+    Keyset seek rather than OFFSET: the redundant bound on xp_value lets the scan start at the
+    player's XP in idx_gameinfo_leaderboard (walked backwards), so cost does not grow with rank.
+    """
+    xp, energy, gameinfo_id = gameinfo.xp_value, gameinfo.energy_value, gameinfo.gameinfo_id
+    return list(
+        UserGameInfos.objects.filter(ranked_ahead_of(xp, energy, gameinfo_id), xp_value__gte=xp)
+        .order_by(*LEADERBOARD_ORDERING_REVERSED)
+        .values_list(*ENTRY_FIELDS)[:limit]
+    )
+
+
+def players_below(gameinfo: UserGameInfos, limit: int) -> list[tuple]:
+    """Up to ``limit`` ENTRY_FIELDS tuples ranked just behind ``gameinfo``, nearest first."""
+    xp, energy, gameinfo_id = gameinfo.xp_value, gameinfo.energy_value, gameinfo.gameinfo_id
+    return list(
+        UserGameInfos.objects.filter(ranked_behind(xp, energy, gameinfo_id), xp_value__lte=xp)
+        .order_by(*LEADERBOARD_ORDERING)
+        .values_list(*ENTRY_FIELDS)[:limit]
+    )
+
+
+__all__ = [
+    "ENTRY_FIELDS",
+    "LEADERBOARD_ORDERING",
+    "LEADERBOARD_ORDERING_REVERSED",
+    "players_above",
+    "players_below",
+    "rank_of",
+    "ranked_ahead_of",
+    "ranked_behind",
+]
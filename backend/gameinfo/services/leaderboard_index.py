@@ -0,0 +1,274 @@
+"""Ranked leaderboard index: O(log n) rank and top-N lookups without sorting in the database.
+
+LEADERBOARD_INDEX_BACKEND picks the implementation (a dotted path):
+
+- LocalLeaderboardIndex keeps a sorted copy of every player's (xp, energy, gameinfo_id) in this
+  process. It is built from a database snapshot on first use and kept current by the
+  UserGameInfos save/delete signals (gameinfo.signals). Writes made by other processes only
+  arrive with the next snapshot, so the copy is rebuilt once it is older than
+  LEADERBOARD_INDEX_MAX_AGE. One thread rebuilds while the others keep reading the old copy;
+  changes signalled during the rebuild are replayed onto the new one. A player's own rank is
+  always computed from their current row.
+- DatabaseLeaderboardIndex answers every lookup with SQL (idx_gameinfo_leaderboard). It holds
+  no state, so it is always consistent across workers.
+"""
+from __future__ import annotations
+
+import bisect
+import time
+from threading import Lock
+from typing import Iterable, NamedTuple, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from gameinfo.models import UserGameInfos
+from gameinfo.services.leaderboard import (
+    ENTRY_FIELDS,
+    LEADERBOARD_ORDERING,
+    players_above,
+    players_below,
+    rank_of,
+)
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:  # pragma: no cover - plain bisect fallback (O(n) inserts)
+    SortedList = None
+
+SNAPSHOT_CHUNK_SIZE = 10000
+
+
+class RankedEntry(NamedTuple):
+    gameinfo_id: int
+    user_id: int
+    xp_value: int
+    energy_value: int
+
+    @classmethod
+    def from_gameinfo(cls, gameinfo: UserGameInfos) -> "RankedEntry":
+        return cls(gameinfo.gameinfo_id, gameinfo.user_id, gameinfo.xp_value, gameinfo.energy_value)
+
+    @property
+    def sort_key(self) -> tuple:
+        # Ascending order of this key is LEADERBOARD_ORDERING; gameinfo_id makes it unique
+        return (-self.xp_value, -self.energy_value, self.gameinfo_id, self.user_id)
+
+
+def leaderboard_snapshot() -> Iterable[RankedEntry]:
+    rows = UserGameInfos.objects.order_by().values_list(*ENTRY_FIELDS)
+    return (RankedEntry(*row) for row in rows.iterator(chunk_size=SNAPSHOT_CHUNK_SIZE))
+
+
+class _BisectList(list):
+    """The slice of SortedList's API used below, on a plain sorted list."""
+
+    def add(self, value):
+        bisect.insort(self, value)
+
+    def index(self, value):
+        position = bisect.bisect_left(self, value)
+        if position == len(self) or self[position] != value:
+            raise ValueError(value)
+        return position
+
+
+class LeaderboardIndex:
+    def rank(self, gameinfo: UserGameInfos) -> int:
+        """1-based position of ``gameinfo`` using its current field values."""
+        raise NotImplementedError
+
+    def top(self, limit: int) -> list[RankedEntry]:
+        raise NotImplementedError
+
+    def around(self, gameinfo: UserGameInfos, radius: int) -> tuple[int, list[RankedEntry]]:
+        """Up to ``radius`` players either side of ``gameinfo`` and the player, in rank order.
+
+        Returns the rank of the first entry along with the entries.
+        """
+        raise NotImplementedError
+
+    def update(self, entry: RankedEntry) -> None:
+        """A player's XP or energy changed (or a player was created)."""
+
+    def remove(self, gameinfo_id: int) -> None:
+        """A player's game info was deleted."""
+
+    def rebuild(self, entries: Optional[Iterable[RankedEntry]] = None) -> None:
+        """Reload from ``entries`` (default: a fresh database snapshot)."""
+
+
+class DatabaseLeaderboardIndex(LeaderboardIndex):
+    def rank(self, gameinfo):
+        return rank_of(gameinfo)
+
+    def top(self, limit):
+        rows = UserGameInfos.objects.order_by(*LEADERBOARD_ORDERING).values_list(*ENTRY_FIELDS)[:limit]
+        return [RankedEntry(*row) for row in rows]
+
+    def around(self, gameinfo, radius):
+        above = [RankedEntry(*row) for row in reversed(players_above(gameinfo, radius))]
+        below = [RankedEntry(*row) for row in players_below(gameinfo, radius)]
+        return rank_of(gameinfo) - len(above), [*above, RankedEntry.from_gameinfo(gameinfo), *below]
+
+
+class LocalLeaderboardIndex(LeaderboardIndex):
+    """Thread-safe order-statistics list of every player in this process."""
+
+    def __init__(self, max_age: Optional[float] = None):
+        self.max_age = max_age
+        self._lock = Lock()
+        # Held for a whole rebuild, so concurrent lookups on a stale copy trigger only one
+        self._rebuild_lock = Lock()
+        # gameinfo_id -> latest entry (None once deleted) signalled while a snapshot is read
+        self._changes: Optional[dict[int, Optional[RankedEntry]]] = None
+        self._sorted = None
+        self._keys: dict[int, tuple] = {}
+        self._loaded_at: Optional[float] = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._sorted is not None
+
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self.max_age is not None and time.monotonic() - self._loaded_at > self.max_age
+
+    def rebuild(self, entries=None):
+        with self._rebuild_lock:
+            self._rebuild(entries)
+
+    def _rebuild(self, entries) -> None:
+        # Caller holds the rebuild lock
+        with self._lock:
+            self._changes = {}
+        try:
+            keys = {entry.gameinfo_id: entry.sort_key for entry in (leaderboard_snapshot() if entries is None else entries)}
+            ordered = SortedList(keys.values()) if SortedList is not None else _BisectList(sorted(keys.values()))
+            with self._lock:
+                for gameinfo_id, entry in self._changes.items():
+                    old = keys.pop(gameinfo_id, None)
+                    if old is not None:
+                        ordered.remove(old)
+                    if entry is not None:
+                        keys[gameinfo_id] = entry.sort_key
+                        ordered.add(entry.sort_key)
+                self._sorted, self._keys, self._loaded_at = ordered, keys, time.monotonic()
+        finally:
+            with self._lock:
+                self._changes = None
+
+    def _ensure_fresh(self) -> None:
+        if not self.is_stale():
+            return
+        if self.is_loaded:
+            # Another thread is already rebuilding: keep answering from the current copy
+            if not self._rebuild_lock.acquire(blocking=False):
+                return
+        else:
+            self._rebuild_lock.acquire()
+        try:
+            # Re-checked under the lock: the thread we waited for may have just rebuilt
+            if self.is_stale():
+                self._rebuild(None)
+        finally:
+            self._rebuild_lock.release()
+
+    def _put(self, entry: RankedEntry) -> tuple:
+        # Caller holds the lock
+        key = entry.sort_key
+        old = self._keys.get(entry.gameinfo_id)
+        if old != key:
+            if old is not None:
+                self._sorted.remove(old)
+            self._sorted.add(key)
+            self._keys[entry.gameinfo_id] = key
+        return key
+
+    def update(self, entry):
+        with self._lock:
+            if self._changes is not None:
+                self._changes[entry.gameinfo_id] = entry
+            # Before the first snapshot there is nothing to keep current
+            if self._sorted is not None:
+                self._put(entry)
+
+    def remove(self, gameinfo_id):
+        with self._lock:
+            if self._changes is not None:
+                self._changes[gameinfo_id] = None
+            if self._sorted is None:
+                return
+            old = self._keys.pop(gameinfo_id, None)
+            if old is not None:
+                self._sorted.remove(old)
+
+    def rank(self, gameinfo):
+        self._ensure_fresh()
+        with self._lock:
+            return self._sorted.index(self._put(RankedEntry.from_gameinfo(gameinfo))) + 1
+
+    @staticmethod
+    def _entries(keys) -> list[RankedEntry]:
+        return [RankedEntry(gameinfo_id, user_id, -neg_xp, -neg_energy) for neg_xp, neg_energy, gameinfo_id, user_id in keys]
+
+    def top(self, limit):
+        self._ensure_fresh()
+        with self._lock:
+            keys = list(self._sorted[:limit])
+        return self._entries(keys)
+
+    def around(self, gameinfo, radius):
+        self._ensure_fresh()
+        with self._lock:
+            position = self._sorted.index(self._put(RankedEntry.from_gameinfo(gameinfo)))
+            start = max(0, position - radius)
+            keys = list(self._sorted[start:position + radius + 1])
+        return start + 1, self._entries(keys)
+
+
+_index: Optional[LeaderboardIndex] = None
+_index_lock = Lock()
+
+
+def get_leaderboard_index() -> LeaderboardIndex:
+    """This process's index, created from LEADERBOARD_INDEX_BACKEND on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                backend = import_string(
+                    getattr(
+                        settings,
+                        "LEADERBOARD_INDEX_BACKEND",
+                        "gameinfo.services.leaderboard_index.DatabaseLeaderboardIndex",
+                    )
+                )
+                if issubclass(backend, LocalLeaderboardIndex):
+                    max_age = getattr(settings, "LEADERBOARD_INDEX_MAX_AGE", None)
+                    _index = backend(max_age=max_age.total_seconds() if max_age is not None else None)
+                else:
+                    _index = backend()
+    return _index
+
+
+def reset_leaderboard_index() -> None:
+    """Drop this process's index; the next lookup recreates it (e.g. after changing settings in tests)."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+__all__ = [
+    "DatabaseLeaderboardIndex",
+    "LeaderboardIndex",
+    "LocalLeaderboardIndex",
+    "RankedEntry",
+    "get_leaderboard_index",
+    "leaderboard_snapshot",
+    "reset_leaderboard_index",
+]
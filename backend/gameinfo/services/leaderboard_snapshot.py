@@ -0,0 +1,137 @@
+"""Periodic leaderboard snapshots, the only source the client leaderboard views rank from.
+
+refresh_leaderboard_snapshot() replaces one period's LeaderboardSnapshot rows with a single
+INSERT ... SELECT ranked by ROW_NUMBER():
+
+- all time: UserGameInfos in LEADERBOARD_ORDERING;
+- weekly / monthly: net XP recorded in the XpEvent ledger since the start of the current week
+  (Monday) or month, ties broken by user id; players whose net XP is not positive are left out.
+
+``manage.py refresh_leaderboard_snapshots`` refreshes every period and then prunes ledger
+events older than any open window (prune_xp_events); run it from cron.
+
+get_leaderboard_board() reads the latest snapshot only and never falls back to live rows:
+between refreshes it serves the last refresh (``refreshed_at`` says when that was), and a
+weekly/monthly board whose window has ended is empty until the next refresh.
+"""
+from __future__ import annotations
+
+import datetime
+from typing import NamedTuple, Optional
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from gameinfo.models import LeaderboardSnapshot, UserGameInfos, XpEvent
+
+Period = LeaderboardSnapshot.Period
+
+
+class RankedRow(NamedTuple):
+    rank: int
+    user_id: int
+    xp_value: int
+
+
+def period_start(period: str, now: Optional[datetime.datetime] = None) -> Optional[datetime.datetime]:
+    """Start of the current window for ``period`` in the active time zone (None for all time)."""
+    if period == Period.ALL_TIME:
+        return None
+    today = timezone.localtime(now or timezone.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == Period.WEEKLY:
+        return today - datetime.timedelta(days=today.weekday())
+    if period == Period.MONTHLY:
+        return today.replace(day=1)
+    raise ValueError(f"Unknown leaderboard period: {period!r}")
+
+
+def refresh_leaderboard_snapshot(period: str, now: Optional[datetime.datetime] = None) -> int:
+    """Rebuild ``period``'s snapshot in one transaction; returns the number of ranked rows."""
+    now = now or timezone.now()
+    start = period_start(period, now)
+    qn = connection.ops.quote_name
+    snapshot_table = qn(LeaderboardSnapshot._meta.db_table)
+    refreshed_at = connection.ops.adapt_datetimefield_value(now)
+    if start is None:
+        select = (
+            "SELECT %s, NULL, ROW_NUMBER() OVER (ORDER BY xp_value DESC, energy_value DESC, gameinfo_id), "
+            f"user_id, xp_value, %s FROM {qn(UserGameInfos._meta.db_table)}"
+        )
+        params = [period, refreshed_at]
+    else:
+        adapted_start = connection.ops.adapt_datetimefield_value(start)
+        # Admin corrections are negative events; a net loss over the window is not a ranking
+        select = (
+            "SELECT %s, %s, ROW_NUMBER() OVER (ORDER BY SUM(amount) DESC, user_id), user_id, SUM(amount), %s "
+            f"FROM {qn(XpEvent._meta.db_table)} WHERE created_at >= %s AND created_at <= %s "
+            "GROUP BY user_id HAVING SUM(amount) > 0"
+        )
+        params = [period, adapted_start, refreshed_at, adapted_start, refreshed_at]
+    with transaction.atomic():
+        LeaderboardSnapshot.objects.filter(period=period).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {snapshot_table} (period, period_start, rank, user_id, xp_value, refreshed_at) {select}",
+                params,
+            )
+            return cursor.rowcount
+
+
+def prune_xp_events(now: Optional[datetime.datetime] = None) -> int:
+    """Delete ledger events older than every open weekly/monthly window; returns how many."""
+    now = now or timezone.now()
+    keep_from = min(period_start(Period.WEEKLY, now), period_start(Period.MONTHLY, now))
+    deleted, _ = XpEvent.objects.filter(created_at__lt=keep_from).delete()
+    return deleted
+
+
+class SnapshotBoard:
+    """Ranked rows of one period's latest snapshot, read by (period, rank) and (period, user).
+
+    ``refreshed_at`` is when the rows were ranked (None before the first refresh). Players who
+    are not in the snapshot (e.g. joined after the refresh) have no rank until the next one.
+    """
+
+    def __init__(self, period: str, now: Optional[datetime.datetime] = None):
+        self.period = period
+        self.rows = LeaderboardSnapshot.objects.filter(period=period)
+        latest = self.rows.values_list("period_start", "refreshed_at").first()
+        self.period_start, self.refreshed_at = latest or (None, None)
+        if latest is not None and self.period_start != period_start(period, now):
+            # Ranked over a window that has since ended
+            self.rows = self.rows.none()
+
+    def top(self, limit: int) -> list[RankedRow]:
+        rows = self.rows.filter(rank__lte=limit).order_by("rank").values_list("rank", "user_id", "xp_value")
+        return [RankedRow(*row) for row in rows]
+
+    def rank(self, user_id: int) -> Optional[RankedRow]:
+        """The player's row, or None when they are not on this board."""
+        row = self.rows.filter(user_id=user_id).values_list("rank", "user_id", "xp_value").first()
+        return RankedRow(*row) if row is not None else None
+
+    def around(self, user_id: int, radius: int) -> list[RankedRow]:
+        """The player's row and up to ``radius`` rows either side ([] when they are not on the board)."""
+        own = self.rows.filter(user_id=user_id).values_list("rank", flat=True).first()
+        if own is None:
+            return []
+        rows = (
+            self.rows.filter(rank__gte=own - radius, rank__lte=own + radius)
+            .order_by("rank")
+            .values_list("rank", "user_id", "xp_value")
+        )
+        return [RankedRow(*row) for row in rows]
+
+
+def get_leaderboard_board(period: str, now: Optional[datetime.datetime] = None) -> SnapshotBoard:
+    return SnapshotBoard(period, now)
+
+
+__all__ = [
+    "RankedRow",
+    "SnapshotBoard",
+    "get_leaderboard_board",
+    "period_start",
+    "prune_xp_events",
+    "refresh_leaderboard_snapshot",
+]
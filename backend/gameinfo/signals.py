@@ -0,0 +1,21 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from gameinfo.models import UserGameInfos
+from gameinfo.services.leaderboard_index import RankedEntry, get_leaderboard_index
+
+
+@receiver(post_save, sender=UserGameInfos)
+def update_leaderboard_index(sender, instance, raw=False, **kwargs):
+    # Covers add_xp, settle_attempts and energy changes; applied only once the write is committed
+    if raw:
+        return
+    entry = RankedEntry.from_gameinfo(instance)
+    transaction.on_commit(lambda: get_leaderboard_index().update(entry))
+
+
+@receiver(post_delete, sender=UserGameInfos)
+def remove_from_leaderboard_index(sender, instance, **kwargs):
+    gameinfo_id = instance.gameinfo_id
+    transaction.on_commit(lambda: get_leaderboard_index().remove(gameinfo_id))
@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from gameinfo.models import UserGameInfos, XpEvent
+from gameinfo.services.leaderboard_snapshot import refresh_leaderboard_snapshot
+from gameinfo.utils import compute_level_from_total_xp
+
+
+class LeaderboardEntriesOutputTests(TestCase):
+    """Entries built as plain rows must match LeaderboardEntrySerializer byte for byte."""
+
+    def setUp(self):
+        User = get_user_model()
+        users = []
+        for index, xp in enumerate([0, 99, 100, 250, 250, 5000, 1_000_000]):
+            user = User.objects.create_user(
+                username=f"player{index}",
+                email=f"player{index}@example.com",
+                password="p",
+                profile_icon=None if index % 2 else f"icons/{index}.png",
+            )
+            UserGameInfos.objects.create(user=user, xp_value=xp, energy_value=50 + index % 3)
+            if xp:
+                XpEvent.objects.create(user=user, amount=xp // 2 + 1)
+            users.append(user)
+        for period in ("all_time", "weekly", "monthly"):
+            refresh_leaderboard_snapshot(period)
+        self.client = APIClient()
+        self.client.force_authenticate(users[3])
+
+    def assert_same_output(self, url, params=None):
+        with override_settings(VALUES_SERIALIZERS_ENABLED=True):
+            fast = self.client.get(url, params)
+        with override_settings(VALUES_SERIALIZERS_ENABLED=False):
+            regular = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(regular.status_code, 200)
+        self.assertEqual(fast.content, regular.content)
+        return fast.json()
+
+    def test_top50(self):
+        for period in ("all_time", "weekly", "monthly"):
+            with self.subTest(period=period):
+                entries = self.assert_same_output("/api/client/leaderboard/top50/", {"period": period})
+                self.assertEqual([entry["rank"] for entry in entries], list(range(1, len(entries) + 1)))
+        entries = self.assert_same_output("/api/client/leaderboard/top50/")
+        self.assertEqual(
+            [(entry["xp_value"], entry["level"]) for entry in entries[:2]],
+            [(xp, compute_level_from_total_xp(xp)) for xp in (1_000_000, 5000)],
+        )
+
+    def test_around_me(self):
+        for params in ({"radius": 2}, {"radius": 0}, {"radius": 2, "period": "weekly"}):
+            with self.subTest(params=params):
+                entries = self.assert_same_output("/api/client/leaderboard/around-me/", params)
+                self.assertIn("player3", [entry["username"] for entry in entries])
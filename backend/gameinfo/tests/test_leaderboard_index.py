@@ -0,0 +1,88 @@
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from gameinfo.services import leaderboard_index
+from gameinfo.services.leaderboard_index import LocalLeaderboardIndex, RankedEntry
+
+
+def entries(*xp_values):
+    return [RankedEntry(gameinfo_id, gameinfo_id, xp, 0) for gameinfo_id, xp in enumerate(xp_values, start=1)]
+
+
+class BlockingSnapshot:
+    """Stands in for the database snapshot; holds every rebuild until ``release`` is set."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return iter(self.rows)
+
+
+class LocalLeaderboardIndexRebuildTests(SimpleTestCase):
+    def run_threads(self, target, count=8):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def test_stale_copy_is_rebuilt_once_and_served_meanwhile(self):
+        index = LocalLeaderboardIndex(max_age=60)
+        index.rebuild(entries(10, 20))
+        index._loaded_at -= 120
+        snapshot = BlockingSnapshot(entries(10, 20, 30))
+        served = []
+
+        with mock.patch.object(leaderboard_index, "leaderboard_snapshot", snapshot):
+            rebuilder = self.run_threads(lambda: index.top(10), count=1)[0]
+            self.assertTrue(snapshot.started.wait(5))
+            # Lookups during the rebuild answer from the old copy without waiting for it
+            readers = self.run_threads(lambda: served.append([entry.xp_value for entry in index.top(10)]))
+            for thread in readers:
+                thread.join(5)
+            self.assertEqual(served, [[20, 10]] * 8)
+            snapshot.release.set()
+            rebuilder.join(5)
+
+        self.assertEqual(snapshot.calls, 1)
+        self.assertEqual([entry.xp_value for entry in index.top(10)], [30, 20, 10])
+
+    def test_cold_index_is_loaded_once(self):
+        index = LocalLeaderboardIndex(max_age=60)
+        snapshot = BlockingSnapshot(entries(10, 20))
+        served = []
+
+        with mock.patch.object(leaderboard_index, "leaderboard_snapshot", snapshot):
+            threads = self.run_threads(lambda: served.append(len(index.top(10))))
+            self.assertTrue(snapshot.started.wait(5))
+            snapshot.release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(snapshot.calls, 1)
+        self.assertEqual(served, [2] * 8)
+
+    def test_changes_during_a_rebuild_are_kept(self):
+        index = LocalLeaderboardIndex()
+        index.rebuild(entries(10, 20, 30))
+        snapshot = BlockingSnapshot(entries(10, 20, 30))
+
+        with mock.patch.object(leaderboard_index, "leaderboard_snapshot", snapshot):
+            rebuilder = self.run_threads(index.rebuild, count=1)[0]
+            self.assertTrue(snapshot.started.wait(5))
+            # Signalled after the snapshot was read: gameinfo 1 overtakes, gameinfo 3 is deleted
+            index.update(RankedEntry(1, 1, 50, 0))
+            index.remove(3)
+            snapshot.release.set()
+            rebuilder.join(5)
+
+        self.assertEqual([(entry.gameinfo_id, entry.xp_value) for entry in index.top(10)], [(1, 50), (2, 20)])
+        self.assertEqual(len(index), 2)
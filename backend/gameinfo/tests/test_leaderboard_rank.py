@@ -0,0 +1,74 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from gameinfo.models import UserGameInfos
+from gameinfo.services.leaderboard import (
+    LEADERBOARD_ORDERING,
+    players_above,
+    players_below,
+    rank_of,
+    ranked_ahead_of,
+)
+from gameinfo.services.leaderboard_snapshot import get_leaderboard_board, refresh_leaderboard_snapshot
+
+
+class LeaderboardRankTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        # Ties on XP, on XP and energy, and a player with nothing yet
+        scores = [(500, 10), (300, 40), (300, 40), (300, 20), (300, 40), (100, 0), (0, 100), (0, 100), (0, 0)]
+        for index, (xp, energy) in enumerate(scores):
+            user = User.objects.create_user(username=f"player{index}", email=f"player{index}@example.com", password="p")
+            UserGameInfos.objects.create(user=user, xp_value=xp, energy_value=energy)
+
+    def list_index_ranks(self):
+        """The previous implementation: position in the fully loaded, ordered list of user ids."""
+        ordered = list(UserGameInfos.objects.order_by(*LEADERBOARD_ORDERING).values_list("user_id", flat=True))
+        return {user_id: ordered.index(user_id) + 1 for user_id in ordered}
+
+    def test_count_rank_matches_list_index_rank(self):
+        expected = self.list_index_ranks()
+        for gameinfo in UserGameInfos.objects.all():
+            with self.subTest(user_id=gameinfo.user_id):
+                with self.assertNumQueries(1):
+                    self.assertEqual(rank_of(gameinfo), expected[gameinfo.user_id])
+        # Every position is distinct even though scores tie
+        self.assertEqual(sorted(expected.values()), list(range(1, UserGameInfos.objects.count() + 1)))
+
+    def test_neighbours_follow_the_same_order(self):
+        ordered = list(UserGameInfos.objects.order_by(*LEADERBOARD_ORDERING))
+        for position, gameinfo in enumerate(ordered):
+            ahead = UserGameInfos.objects.filter(
+                ranked_ahead_of(gameinfo.xp_value, gameinfo.energy_value, gameinfo.gameinfo_id)
+            )
+            self.assertEqual(set(ahead.values_list("pk", flat=True)), {g.pk for g in ordered[:position]})
+            above = [row[0] for row in players_above(gameinfo, 2)]
+            below = [row[0] for row in players_below(gameinfo, 2)]
+            self.assertEqual(above, [g.pk for g in reversed(ordered[max(0, position - 2):position])])
+            self.assertEqual(below, [g.pk for g in ordered[position + 1:position + 3]])
+
+    def test_snapshot_ranks_match(self):
+        refresh_leaderboard_snapshot("all_time")
+        board = get_leaderboard_board("all_time")
+        for user_id, rank in self.list_index_ranks().items():
+            self.assertEqual(board.rank(user_id).rank, rank)
+
+    def test_player_without_a_row_gets_a_response(self):
+        refresh_leaderboard_snapshot("all_time")
+        newcomer = get_user_model().objects.create_user(username="new", email="new@example.com", password="p")
+        client = APIClient()
+        client.force_authenticate(newcomer)
+
+        response = client.get("/api/client/leaderboard/me/")
+        self.assertEqual(response.status_code, 200)
+        # Not on the board until the next refresh; the row is created on the way
+        self.assertEqual((response.data["rank"], response.data["xp_value"]), (None, 0))
+        self.assertTrue(UserGameInfos.objects.filter(user=newcomer).exists())
+
+        around = client.get("/api/client/leaderboard/around-me/")
+        self.assertEqual((around.status_code, around.data), (200, []))
+
+        refresh_leaderboard_snapshot("all_time")
+        rank = client.get("/api/client/leaderboard/me/").data["rank"]
+        self.assertEqual(rank, self.list_index_ranks()[newcomer.pk])
@@ -0,0 +1,209 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gameinfo.models import LeaderboardSnapshot, UserGameInfos, XpEvent
+from gameinfo.services.leaderboard_snapshot import (
+    RankedRow,
+    get_leaderboard_board,
+    period_start,
+    prune_xp_events,
+    refresh_leaderboard_snapshot,
+)
+
+Period = LeaderboardSnapshot.Period
+
+# A Wednesday: the week started on Monday the 12th, the month on the 1st
+NOW = datetime.datetime(2026, 10, 14, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def at(day, hour=12):
+    return datetime.datetime(2026, 10, day, hour, 0, tzinfo=datetime.timezone.utc)
+
+
+class LeaderboardSnapshotTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.users = [
+            User.objects.create_user(username=f"player{index}", email=f"player{index}@example.com", password="p")
+            for index in range(5)
+        ]
+        # (xp, energy): players 1 and 2 tie on XP and are split by energy, 3 and 4 tie on both
+        for user, (xp, energy) in zip(self.users, [(500, 10), (300, 20), (300, 10), (100, 5), (100, 5)]):
+            UserGameInfos.objects.create(user=user, xp_value=xp, energy_value=energy)
+
+    def event(self, index, amount, created_at):
+        XpEvent.objects.create(user=self.users[index], amount=amount, created_at=created_at)
+
+    def ids(self, *indexes):
+        return [self.users[index].pk for index in indexes]
+
+
+class RefreshLeaderboardSnapshotTests(LeaderboardSnapshotTestCase):
+    def ranked(self, period):
+        rows = LeaderboardSnapshot.objects.filter(period=period).order_by("rank")
+        return [(row.rank, row.user_id, row.xp_value) for row in rows]
+
+    def test_all_time_ranks_by_xp_then_energy_then_row(self):
+        self.assertEqual(refresh_leaderboard_snapshot(Period.ALL_TIME, NOW), 5)
+        expected = zip(range(1, 6), self.ids(0, 1, 2, 3, 4), [500, 300, 300, 100, 100])
+        self.assertEqual(self.ranked(Period.ALL_TIME), list(expected))
+        row = LeaderboardSnapshot.objects.filter(period=Period.ALL_TIME).first()
+        self.assertIsNone(row.period_start)
+        self.assertEqual(row.refreshed_at, NOW)
+
+    def test_period_boards_sum_the_ledger_over_their_window(self):
+        self.event(0, 50, at(1, 0))   # first instant of the month
+        self.event(1, 70, at(12, 0))  # first instant of the week
+        self.event(1, 10, at(13))
+        self.event(2, 80, at(11))     # this month, last week
+        self.event(3, 40, at(13))
+        self.event(3, -40, at(14, 11))  # corrected back to nothing
+        self.event(4, 20, at(13))
+        self.event(4, 5, at(30))      # after the refresh time
+        self.event(0, 999, at(1, 0) - datetime.timedelta(seconds=1))  # last month
+
+        self.assertEqual(refresh_leaderboard_snapshot(Period.WEEKLY, NOW), 2)
+        self.assertEqual(self.ranked(Period.WEEKLY), [(1, self.users[1].pk, 80), (2, self.users[4].pk, 20)])
+        self.assertEqual(LeaderboardSnapshot.objects.filter(period=Period.WEEKLY).first().period_start, at(12, 0))
+
+        refresh_leaderboard_snapshot(Period.MONTHLY, NOW)
+        self.assertEqual(
+            self.ranked(Period.MONTHLY),
+            [(1, self.users[1].pk, 80), (2, self.users[2].pk, 80), (3, self.users[0].pk, 50), (4, self.users[4].pk, 20)],
+        )
+
+    def test_refresh_replaces_only_its_period(self):
+        self.event(0, 10, at(13))
+        refresh_leaderboard_snapshot(Period.ALL_TIME, NOW)
+        refresh_leaderboard_snapshot(Period.WEEKLY, NOW)
+        UserGameInfos.objects.filter(user=self.users[4]).update(xp_value=1000)
+        refresh_leaderboard_snapshot(Period.ALL_TIME, NOW)
+        self.assertEqual(self.ranked(Period.ALL_TIME)[0], (1, self.users[4].pk, 1000))
+        self.assertEqual(len(self.ranked(Period.ALL_TIME)), 5)
+        self.assertEqual(self.ranked(Period.WEEKLY), [(1, self.users[0].pk, 10)])
+
+    def test_prune_keeps_every_open_window(self):
+        self.event(0, 10, at(1, 0) - datetime.timedelta(seconds=1))
+        self.event(0, 10, at(1, 0))
+        self.assertEqual(prune_xp_events(NOW), 1)
+
+        # Sunday 1 November: the month has just started but the week began on Monday 26 October
+        self.event(1, 10, at(25))
+        self.event(1, 10, at(26, 0))
+        self.assertEqual(prune_xp_events(datetime.datetime(2026, 11, 1, 12, tzinfo=datetime.timezone.utc)), 2)
+        self.assertEqual(list(XpEvent.objects.values_list("created_at", flat=True)), [at(26, 0)])
+
+    def test_command_refreshes_and_prunes(self):
+        self.event(0, 10, timezone.now())
+        self.event(0, 10, timezone.now() - datetime.timedelta(days=70))
+        out = StringIO()
+        call_command("refresh_leaderboard_snapshots", stdout=out)
+        self.assertEqual(set(LeaderboardSnapshot.objects.values_list("period", flat=True)), set(Period.values))
+        self.assertIn("Pruned 1 XP events", out.getvalue())
+        self.assertEqual(XpEvent.objects.count(), 1)
+
+
+class SnapshotBoardTests(LeaderboardSnapshotTestCase):
+    def setUp(self):
+        super().setUp()
+        refresh_leaderboard_snapshot(Period.ALL_TIME, NOW)
+
+    def test_board_reads_the_snapshot_not_live_rows(self):
+        UserGameInfos.objects.filter(user=self.users[4]).update(xp_value=10_000)
+        UserGameInfos.objects.create(
+            user=get_user_model().objects.create_user(username="late", email="late@example.com", password="p"),
+            xp_value=20_000,
+        )
+        with self.assertNumQueries(2):
+            board = get_leaderboard_board(Period.ALL_TIME, NOW)
+            top = board.top(3)
+        self.assertEqual(board.refreshed_at, NOW)
+        self.assertEqual(
+            top,
+            [RankedRow(1, self.users[0].pk, 500), RankedRow(2, self.users[1].pk, 300), RankedRow(3, self.users[2].pk, 300)],
+        )
+        self.assertEqual(board.rank(self.users[4].pk), RankedRow(5, self.users[4].pk, 100))
+        self.assertIsNone(board.rank(get_user_model().objects.get(username="late").pk))
+
+    def test_around(self):
+        board = get_leaderboard_board(Period.ALL_TIME, NOW)
+        self.assertEqual([row.rank for row in board.around(self.users[2].pk, 1)], [2, 3, 4])
+        self.assertEqual([row.rank for row in board.around(self.users[0].pk, 2)], [1, 2, 3])
+        self.assertEqual([row.rank for row in board.around(self.users[4].pk, 0)], [5])
+        self.assertEqual(board.around(0, 3), [])
+
+    def test_missing_snapshot_is_empty(self):
+        board = get_leaderboard_board(Period.WEEKLY, NOW)
+        self.assertIsNone(board.refreshed_at)
+        self.assertEqual((board.top(50), board.rank(self.users[0].pk), board.around(self.users[0].pk, 5)), ([], None, []))
+
+    def test_ended_window_is_empty(self):
+        self.event(0, 10, at(13))
+        refresh_leaderboard_snapshot(Period.WEEKLY, NOW)
+        self.assertEqual(len(get_leaderboard_board(Period.WEEKLY, NOW).top(50)), 1)
+        next_week = get_leaderboard_board(Period.WEEKLY, at(19))
+        self.assertEqual(next_week.refreshed_at, NOW)
+        self.assertEqual((next_week.top(50), next_week.rank(self.users[0].pk)), ([], None))
+        # All time never ends
+        self.assertEqual(len(get_leaderboard_board(Period.ALL_TIME, at(19)).top(50)), 5)
+
+
+class LeaderboardViewTests(LeaderboardSnapshotTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(self.users[3])
+
+    def test_views_serve_the_snapshot_with_its_refresh_time(self):
+        for url in ("/api/client/leaderboard/top50/", "/api/client/leaderboard/around-me/", "/api/client/leaderboard/me/"):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertFalse(response.has_header("Last-Modified"))
+        self.assertEqual(self.client.get("/api/client/leaderboard/top50/").json(), [])
+        self.assertIsNone(self.client.get("/api/client/leaderboard/me/").json()["rank"])
+
+        refresh_leaderboard_snapshot(Period.ALL_TIME)
+        response = self.client.get("/api/client/leaderboard/top50/")
+        self.assertTrue(response.has_header("Last-Modified"))
+        self.assertEqual([entry["rank"] for entry in response.json()], [1, 2, 3, 4, 5])
+        self.assertEqual(
+            [entry["rank"] for entry in self.client.get("/api/client/leaderboard/around-me/", {"radius": 1}).json()],
+            [3, 4, 5],
+        )
+        me = self.client.get("/api/client/leaderboard/me/").json()
+        self.assertEqual((me["rank"], me["xp_value"]), (4, 100))
+
+    def test_my_rank_on_a_period_board_without_xp(self):
+        self.event(0, 10, timezone.now())
+        refresh_leaderboard_snapshot(Period.WEEKLY)
+        me = self.client.get("/api/client/leaderboard/me/", {"period": "weekly"}).json()
+        self.assertEqual((me["rank"], me["xp_value"]), (None, 0))
+
+
+class XpCorrectionTests(LeaderboardSnapshotTestCase):
+    def test_admin_edits_are_recorded_in_the_ledger(self):
+        admin = get_user_model().objects.create_user(
+            username="admin", email="admin@example.com", password="p", role=get_user_model().ROLE_ADMIN
+        )
+        client = APIClient()
+        client.force_authenticate(admin)
+        gameinfo = UserGameInfos.objects.get(user=self.users[0])
+        url = f"/api/admin/gameinfos/{gameinfo.gameinfo_id}"
+
+        self.assertEqual(client.patch(url, {"xp_value": 800}, format="json").status_code, 200)
+        self.assertEqual(client.patch(url, {"xp_value": 650}, format="json").status_code, 200)
+        self.assertEqual(client.patch(url, {"energy_value": 3}, format="json").status_code, 200)
+        amounts = XpEvent.objects.filter(user=self.users[0]).order_by("xp_event_id").values_list("amount", flat=True)
+        self.assertEqual(list(amounts), [300, -150])
+        gameinfo.refresh_from_db()
+        self.assertEqual((gameinfo.xp_value, gameinfo.energy_value), (650, 3))
+
+        refresh_leaderboard_snapshot(Period.WEEKLY)
+        self.assertEqual(get_leaderboard_board(Period.WEEKLY).rank(self.users[0].pk).xp_value, 150)
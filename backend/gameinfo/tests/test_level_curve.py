@@ -0,0 +1,67 @@
+import random
+
+from django.test import SimpleTestCase
+
+from gameinfo.level_curve import DEFAULT_LEVEL_CURVE, LinearLevelCurve, TableLevelCurve
+from gameinfo.utils import compute_level_from_total_xp, get_level_up_xp
+
+
+def loop_progress(total_xp: int) -> tuple[int, int, int]:
+    """The level walk the closed form replaced: ``(level, xp_into_level, progress_pct)``."""
+    level, remaining = 1, max(0, total_xp)
+    while remaining >= level * 50 + 50:
+        remaining -= level * 50 + 50
+        level += 1
+    pct = 0 if total_xp <= 0 else max(0, min(100, int(round(remaining / (level * 50 + 50) * 100))))
+    return level, remaining, pct
+
+
+class DefaultCurveTests(SimpleTestCase):
+    def assert_matches_loop(self, xp, expected):
+        progress = DEFAULT_LEVEL_CURVE.progress(xp)
+        self.assertEqual((progress.level, progress.xp_into_level, progress.progress_pct), expected, xp)
+        self.assertEqual(compute_level_from_total_xp(xp), expected[0], xp)
+        self.assertEqual(progress.next_level_xp, get_level_up_xp(expected[0]), xp)
+
+    def test_matches_loop_for_every_xp_value(self):
+        for xp in range(-5, 50_001):
+            self.assert_matches_loop(xp, loop_progress(xp))
+
+    def test_matches_loop_around_every_level_threshold(self):
+        # Thresholds up to level 200,000 (about 10^12 XP), one XP either side of each
+        threshold = 0
+        for level in range(1, 200_001):
+            for xp in (threshold - 1, threshold, threshold + 1):
+                if xp > 0:
+                    self.assertEqual(DEFAULT_LEVEL_CURVE.level_for_xp(xp), level if xp >= threshold else level - 1, xp)
+            self.assertEqual(DEFAULT_LEVEL_CURVE.xp_for_level(level), threshold)
+            threshold += get_level_up_xp(level)
+
+    def test_matches_loop_for_large_xp(self):
+        rng = random.Random(2021)
+        for xp in [rng.randrange(10**5, 10**8) for _ in range(50)] + [10**8 - 1]:
+            self.assert_matches_loop(xp, loop_progress(xp))
+
+    def test_batch_matches_single(self):
+        values = [0, 1, 99, 100, 249, 250, 10**9]
+        self.assertEqual(DEFAULT_LEVEL_CURVE.levels_for_xp(values), [DEFAULT_LEVEL_CURVE.level_for_xp(xp) for xp in values])
+
+
+class TableCurveTests(SimpleTestCase):
+    def test_table_agrees_with_linear(self):
+        for base, step in ((50, 50), (0, 1), (100, 25), (7, 13), (1000, 1)):
+            linear = LinearLevelCurve(base=base, step=step)
+            table = TableLevelCurve(lambda level: step * level + base, max_level=400)
+            top = table.xp_for_level(400)
+            for xp in list(range(0, min(top, 20_000))) + [table.xp_for_level(n) + d for n in range(1, 400) for d in (-1, 0, 1)]:
+                self.assertEqual(table.progress(xp), linear.progress(xp), (base, step, xp))
+
+    def test_table_stops_at_max_level(self):
+        table = TableLevelCurve(lambda level: 100, max_level=3)
+        self.assertEqual(table.level_for_xp(10**9), 3)
+        self.assertEqual(table.level_up_xp(3), 0)
+        self.assertEqual(table.progress(10**9).progress_pct, 100)
+
+    def test_rejects_non_positive_costs(self):
+        with self.assertRaises(ValueError):
+            TableLevelCurve(lambda level: 0, max_level=5)
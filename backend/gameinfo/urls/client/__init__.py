@@ -1,10 +1,11 @@
 from django.urls import path
 from gameinfo.views.client import MyGameInfoView
-from gameinfo.views.client.leaderboard import Top50LeaderboardView, MyLeaderboardRankView
+from gameinfo.views.client.leaderboard import Top50LeaderboardView, AroundMeLeaderboardView, MyLeaderboardRankView
 
 urlpatterns = [
     path("gameinfo/me/", MyGameInfoView.as_view(), name="client_my_gameinfo"),
     path("leaderboard/top50/", Top50LeaderboardView.as_view(), name="client_leaderboard_top50"),
+    path("leaderboard/around-me/", AroundMeLeaderboardView.as_view(), name="client_leaderboard_around_me"),
     path("leaderboard/me/", MyLeaderboardRankView.as_view(), name="client_leaderboard_me"),
 ]
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from gameinfo.level_curve import DEFAULT_LEVEL_CURVE
+
 
 def get_level_up_xp(level: int) -> int:
     """XP required to advance from the given level to the next.
@@ -7,9 +9,7 @@ def get_level_up_xp(level: int) -> int:
     Mirrors the simple linear progression used in the older stats module:
     required_xp = level * 50 + 50 (i.e., 100 for L1->L2, 150 for L2->L3, ...)
     """
-    if level < 1:
-        level = 1
-    return level * 50 + 50
+    return DEFAULT_LEVEL_CURVE.level_up_xp(level)
 
 
 def compute_level_from_total_xp(total_xp: int) -> int:
@@ -18,16 +18,6 @@ def compute_level_from_total_xp(total_xp: int) -> int:
     - Starts at level 1.
     - Each subsequent level requires an increasing amount of XP defined by get_level_up_xp.
     - This derives a level without needing a separate "xp toward next level" field.
+    - Solved in closed form by the level curve, so the cost does not grow with XP.
     """
-    if total_xp is None or total_xp <= 0:
-        return 1
-
-    level = 1
-    xp_remaining = int(total_xp)
-    while True:
-        req = get_level_up_xp(level)
-        if xp_remaining < req:
-            break
-        xp_remaining -= req
-        level += 1
-    return level
+    return DEFAULT_LEVEL_CURVE.level_for_xp(total_xp)
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from gameinfo.models import UserGameInfos
 from gameinfo.serializers.admin.user_game_infos import AdminUserGameInfosSerializer
 from users.permissions import IsAdminRole
@@ -7,6 +8,8 @@ class AdminListGameInfosView(generics.ListAPIView):
     queryset = UserGameInfos.objects.select_related("user").all()
     serializer_class = AdminUserGameInfosSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-gameinfo_id"
 
 class AdminManageGameInfoView(generics.RetrieveUpdateAPIView):
     queryset = UserGameInfos.objects.select_related("user").all()
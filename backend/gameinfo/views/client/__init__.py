@@ -1,4 +1,4 @@
 from .user_game_infos import MyGameInfoView
-from .leaderboard import Top50LeaderboardView, MyLeaderboardRankView
+from .leaderboard import Top50LeaderboardView, AroundMeLeaderboardView, MyLeaderboardRankView
 
-__all__ = ["MyGameInfoView", "Top50LeaderboardView", "MyLeaderboardRankView"]
+__all__ = ["MyGameInfoView", "Top50LeaderboardView", "AroundMeLeaderboardView", "MyLeaderboardRankView"]
@@ -1,58 +1,145 @@
 from typing import List
-from rest_framework import generics, permissions, response
-from gameinfo.models import UserGameInfos
+from django.contrib.auth import get_user_model
+from django.utils.http import http_date
+from rest_framework import generics, permissions, response, serializers
+from gameinfo.models import LeaderboardSnapshot, UserGameInfos
 from gameinfo.serializers.client.leaderboard import (
     LeaderboardEntrySerializer,
     CurrentUserRankSerializer,
 )
-from gameinfo.utils import compute_level_from_total_xp
-from django.db.models import Q
+from gameinfo.level_curve import DEFAULT_LEVEL_CURVE
+from gameinfo.services.leaderboard_snapshot import RankedRow, SnapshotBoard, get_leaderboard_board
+from common.values_serializer import ValuesSerializer, values_serializers_enabled
 
 
-class Top50LeaderboardView(generics.GenericAPIView):
-    permission_classes = [permissions.IsAuthenticated]
+TOP_LIMIT = 50
 
-    def get(self, request, *args, **kwargs):
-        # Order by xp desc then energy desc (as per model Meta.ordering)
-        qs = (
-            UserGameInfos.objects.select_related("user")
-            .order_by("-xp_value", "-energy_value", "gameinfo_id")[:50]
+
+AROUND_ME_DEFAULT_RADIUS = 10
+AROUND_ME_MAX_RADIUS = 50
+
+
+def _query_param(request, name: str, field: serializers.Field, default):
+    try:
+        return field.run_validation(request.query_params.get(name, default))
+    except serializers.ValidationError as exc:
+        raise serializers.ValidationError({name: exc.detail}) from exc
+
+
+class LeaderboardPeriodMixin:
+    """``?period=all_time|weekly|monthly`` (default all_time) picks the board to read.
+
+    Boards are snapshots refreshed by ``manage.py refresh_leaderboard_snapshots``; responses
+    carry the refresh time as Last-Modified (absent before the first refresh).
+    """
+
+    def get_board(self, request) -> SnapshotBoard:
+        period = _query_param(
+            request,
+            "period",
+            serializers.ChoiceField(choices=LeaderboardSnapshot.Period.choices),
+            LeaderboardSnapshot.Period.ALL_TIME,
         )
+        return get_leaderboard_board(period)
+
+    def board_response(self, board: SnapshotBoard, data):
+        headers = {}
+        if board.refreshed_at is not None:
+            headers["Last-Modified"] = http_date(board.refreshed_at.timestamp())
+        return response.Response(data, headers=headers)
+
+
+class LeaderboardEntriesView(LeaderboardPeriodMixin, generics.GenericAPIView):
+    """Base for views answering with a run of consecutive leaderboard entries."""
+    permission_classes = [permissions.IsAuthenticated]
+    values_serializer = ValuesSerializer(
+        LeaderboardEntrySerializer,
+        sources={"username": "user__username", "profile_icon": "user__profile_icon"},
+        computed=["rank", "level"],
+    )
 
-        data: List[dict] = []
-        for idx, gi in enumerate(qs, start=1):
-            data.append(
+    def entries_response(self, board: SnapshotBoard, ranked: List[RankedRow]):
+        # One primary-key lookup fills in usernames, icons and levels (from all-time XP, whatever the period)
+        users = {
+            user["id"]: user
+            for user in get_user_model().objects.filter(pk__in=[entry.user_id for entry in ranked])
+            .values("id", "username", "profile_icon", "gameinfo__xp_value")
+        }
+        rows: List[dict] = []
+        for entry in ranked:
+            user = users.get(entry.user_id)
+            if user is None:
+                # Deleted since the board was built
+                continue
+            rows.append(
                 {
-                    "rank": idx,
-                    "user_id": gi.user_id,
-                    "username": getattr(gi.user, "username", ""),
-                    "xp_value": gi.xp_value,
-                    "level": compute_level_from_total_xp(gi.xp_value),
-                    "profile_icon": getattr(gi.user, "profile_icon", None),
+                    "rank": entry.rank,
+                    "user_id": entry.user_id,
+                    "user__username": user["username"],
+                    "xp_value": entry.xp_value,
+                    "user__profile_icon": user["profile_icon"],
                 }
             )
+        levels = DEFAULT_LEVEL_CURVE.levels_for_xp(
+            users[row["user_id"]]["gameinfo__xp_value"] or row["xp_value"] for row in rows
+        )
+        for row, level in zip(rows, levels):
+            row["level"] = level
+
+        if values_serializers_enabled():
+            return self.board_response(board, self.values_serializer.serialize(rows))
 
+        data = [
+            {
+                "rank": row["rank"],
+                "user_id": row["user_id"],
+                "username": row["user__username"] or "",
+                "xp_value": row["xp_value"],
+                "level": row["level"],
+                "profile_icon": row["user__profile_icon"],
+            }
+            for row in rows
+        ]
         ser = LeaderboardEntrySerializer(data=data, many=True)
         ser.is_valid(raise_exception=True)
-        return response.Response(ser.data)
+        return self.board_response(board, ser.data)
+
+
+class Top50LeaderboardView(LeaderboardEntriesView):
+    def get(self, request, *args, **kwargs):
+        board = self.get_board(request)
+        return self.entries_response(board, board.top(TOP_LIMIT))
+
 
+class AroundMeLeaderboardView(LeaderboardEntriesView):
+    """The caller and up to ``?radius=`` players ranked directly above and below them."""
 
-class MyLeaderboardRankView(generics.GenericAPIView):
+    def get(self, request, *args, **kwargs):
+        radius = _query_param(
+            request,
+            "radius",
+            serializers.IntegerField(min_value=0, max_value=AROUND_ME_MAX_RADIUS),
+            AROUND_ME_DEFAULT_RADIUS,
+        )
+        board = self.get_board(request)
+        return self.entries_response(board, board.around(request.user.pk, radius))
+
+
+class MyLeaderboardRankView(LeaderboardPeriodMixin, generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
+        board = self.get_board(request)
         gi, _ = UserGameInfos.objects.select_related("user").get_or_create(user=request.user)
 
-        # Try to find the user's position within the Top 50 ranking
-        top50_user_ids = list(
-            UserGameInfos.objects.order_by("-xp_value", "-energy_value", "gameinfo_id")
-            .values_list("user_id", flat=True)
-        )
-
-        rank = top50_user_ids.index(request.user.id) + 1        
+        own = board.rank(gi.user_id)
 
-        payload = CurrentUserRankSerializer.from_gameinfo_with_rank(gi, rank)
-        # print(payload)
+        payload = CurrentUserRankSerializer.from_gameinfo_with_rank(gi, own.rank if own is not None else None)
+        # XP as ranked on the board; period boards rank XP earned in the period, so without a row there is none
+        if own is not None:
+            payload["xp_value"] = own.xp_value
+        elif board.period != LeaderboardSnapshot.Period.ALL_TIME:
+            payload["xp_value"] = 0
         ser = CurrentUserRankSerializer(data=payload)
         ser.is_valid(raise_exception=True)
-        return response.Response(ser.data)
+        return self.board_response(board, ser.data)
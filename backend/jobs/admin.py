@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("job_id", "name", "status", "attempts", "run_after", "created_at", "updated_at")
+    list_filter = ("status", "name")
+    search_fields = ("job_id", "name", "last_error")
+    ordering = ("-job_id",)
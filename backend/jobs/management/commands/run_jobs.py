@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.queue import purge_finished_jobs, run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs (post-submission side effects, etc.)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Jobs claimed per poll")
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the due jobs once and exit")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total_ok = total_failed = 0
+        try:
+            while True:
+                ok, failed = run_pending_jobs(limit=batch_size)
+                total_ok += ok
+                total_failed += failed
+                if ok or failed:
+                    self.stdout.write(f"Processed {ok + failed} jobs ({failed} failed)")
+                    continue
+                if options["once"]:
+                    break
+                purge_finished_jobs(settings.JOBS_RETENTION)
+                time.sleep(options["sleep"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Done: {total_ok} succeeded, {total_failed} failed"))
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import traceback
+from typing import Callable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+_handlers: dict[str, Callable[[dict], None]] = {}
+
+
+def job(name: str):
+    """Register the decorated function as the handler for jobs called ``name``.
+
+    Handlers take the job payload (a JSON-serializable dict) and run inside their own
+    transaction; raising marks the job for retry.
+    """
+
+    def decorator(func: Callable[[dict], None]) -> Callable[[dict], None]:
+        if name in _handlers and _handlers[name] is not func:
+            raise ValueError(f"Job handler already registered: {name}")
+        _handlers[name] = func
+        return func
+
+    return decorator
+
+
+def get_handler(name: str) -> Callable[[dict], None]:
+    try:
+        return _handlers[name]
+    except KeyError:
+        raise LookupError(f"No job handler registered for {name!r}") from None
+
+
+def enqueue(name: str, payload: dict | None = None, *, run_after: datetime.datetime | None = None) -> Job:
+    """Queue a job; call inside the transaction whose writes the job depends on.
+
+    The row commits (or rolls back) together with the caller's writes, so workers never see a
+    job for data that does not exist. With JOBS_RUN_INLINE the job also runs in this process
+    right after commit, which keeps development setups working without a worker.
+    """
+    get_handler(name)
+    job_row = Job.objects.create(name=name, payload=payload or {}, run_after=run_after or timezone.now())
+    if settings.JOBS_RUN_INLINE and run_after is None:
+        transaction.on_commit(lambda: run_claimed_job(_claim_one(job_row.job_id)))
+    return job_row
+
+
+def _retry_delay(attempts: int) -> datetime.timedelta:
+    # Exponential backoff: base, 2x base, 4x base, ...
+    return settings.JOBS_RETRY_BASE_DELAY * (2 ** max(0, attempts - 1))
+
+
+def _claimable(now: datetime.datetime):
+    stale_before = now - settings.JOBS_STALE_AFTER
+    return Job.objects.filter(
+        Q(status=Job.Status.PENDING, run_after__lte=now)
+        # Jobs left running by a worker that died are picked up again
+        | Q(status=Job.Status.RUNNING, locked_at__lt=stale_before)
+    )
+
+
+@transaction.atomic
+def _claim_one(job_id: int) -> Job | None:
+    now = timezone.now()
+    claimed = _claimable(now).filter(job_id=job_id).update(
+        status=Job.Status.RUNNING, locked_at=now, attempts=F("attempts") + 1
+    )
+    return Job.objects.get(job_id=job_id) if claimed else None
+
+
+@transaction.atomic
+def claim_jobs(limit: int) -> list[Job]:
+    """Mark up to ``limit`` due jobs as running and return them.
+
+    On PostgreSQL rows locked by another worker are skipped, so several workers can poll
+    the same table without handing out a job twice.
+    """
+    now = timezone.now()
+    candidates = _claimable(now).order_by("run_after", "job_id")
+    if connection.features.has_select_for_update_skip_locked:
+        candidates = candidates.select_for_update(skip_locked=True)
+    job_ids = list(candidates.values_list("job_id", flat=True)[:limit])
+    if not job_ids:
+        return []
+    Job.objects.filter(job_id__in=job_ids).update(
+        status=Job.Status.RUNNING, locked_at=now, attempts=F("attempts") + 1
+    )
+    return list(Job.objects.filter(job_id__in=job_ids).order_by("run_after", "job_id"))
+
+
+def _owned(job_row: Job):
+    """The job's row while it is still this claim's: a stale re-claim bumps attempts and locked_at."""
+    return Job.objects.filter(
+        job_id=job_row.job_id,
+        status=Job.Status.RUNNING,
+        locked_at=job_row.locked_at,
+        attempts=job_row.attempts,
+    )
+
+
+def run_claimed_job(job_row: Job | None) -> bool:
+    """Run a job returned by claim_jobs(); returns True when it succeeded.
+
+    Returns False without running the handler when another worker re-claimed the job in the
+    meantime (this claim went stale).
+    """
+    if job_row is None:
+        return False
+    try:
+        handler = get_handler(job_row.name)
+        # Marking DONE first locks the row until the handler's writes commit with it, so a
+        # concurrent re-claim waits and then finds the job done; a claim that already lost the
+        # job matches no row and runs nothing.
+        with transaction.atomic():
+            owned = _owned(job_row).update(
+                status=Job.Status.DONE, locked_at=None, last_error=None, updated_at=timezone.now()
+            )
+            if not owned:
+                logger.warning("Job %s (%s) was re-claimed by another worker; skipping", job_row.job_id, job_row.name)
+                return False
+            handler(job_row.payload)
+    except Exception:
+        error = traceback.format_exc()
+        logger.exception("Job %s (%s) failed on attempt %s", job_row.job_id, job_row.name, job_row.attempts)
+        if job_row.attempts >= job_row.max_attempts:
+            _owned(job_row).update(
+                status=Job.Status.FAILED, locked_at=None, last_error=error, updated_at=timezone.now()
+            )
+        else:
+            _owned(job_row).update(
+                status=Job.Status.PENDING,
+                locked_at=None,
+                last_error=error,
+                run_after=timezone.now() + _retry_delay(job_row.attempts),
+                updated_at=timezone.now(),
+            )
+        return False
+    return True
+
+
+def run_pending_jobs(limit: int = 100) -> tuple[int, int]:
+    """Claim and run one batch of due jobs. Returns ``(succeeded, failed)``."""
+    succeeded = failed = 0
+    for job_row in claim_jobs(limit):
+        if run_claimed_job(job_row):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
+
+
+def purge_finished_jobs(older_than: datetime.timedelta) -> int:
+    """Delete completed jobs last updated before ``now - older_than``."""
+    deleted, _ = Job.objects.filter(status=Job.Status.DONE, updated_at__lt=timezone.now() - older_than).delete()
+    return deleted
+
+
+__all__ = [
+    "job",
+    "get_handler",
+    "enqueue",
+    "claim_jobs",
+    "run_claimed_job",
+    "run_pending_jobs",
+    "purge_finished_jobs",
+]
@@ -0,0 +1,59 @@
+import datetime
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import claim_jobs, enqueue, job, run_claimed_job
+
+calls: list[dict] = []
+
+
+@job("jobs.tests.record")
+def record(payload):
+    calls.append(payload)
+
+
+@override_settings(JOBS_RUN_INLINE=False)
+class RunClaimedJobTests(TestCase):
+    def setUp(self):
+        calls.clear()
+        self.job = enqueue("jobs.tests.record", {"n": 1})
+
+    def test_runs_once_and_marks_done(self):
+        [claimed] = claim_jobs(10)
+        self.assertTrue(run_claimed_job(claimed))
+        self.assertEqual(calls, [{"n": 1}])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.Status.DONE)
+        self.assertIsNone(self.job.locked_at)
+        self.assertEqual(claim_jobs(10), [])
+
+    def test_stale_claim_does_not_run_after_reclaim(self):
+        [stale] = claim_jobs(10)
+        # The first worker stalls past JOBS_STALE_AFTER and another one takes the job over
+        Job.objects.filter(job_id=stale.job_id).update(locked_at=timezone.now() - datetime.timedelta(days=1))
+        [fresh] = claim_jobs(10)
+        self.assertEqual(fresh.attempts, 2)
+
+        with self.assertLogs("jobs.queue", "WARNING"):
+            self.assertFalse(run_claimed_job(stale))
+        self.assertEqual(calls, [])
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.status, self.job.attempts), (Job.Status.RUNNING, 2))
+
+        self.assertTrue(run_claimed_job(fresh))
+        self.assertEqual(calls, [{"n": 1}])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.Status.DONE)
+
+    def test_stale_failure_does_not_reset_the_new_claim(self):
+        [stale] = claim_jobs(10)
+        Job.objects.filter(job_id=stale.job_id).update(locked_at=timezone.now() - datetime.timedelta(days=1))
+        [fresh] = claim_jobs(10)
+        stale.name = "jobs.tests.unregistered"
+
+        with self.assertLogs("jobs.queue", "ERROR"):
+            self.assertFalse(run_claimed_job(stale))
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.status, self.job.locked_at), (Job.Status.RUNNING, fresh.locked_at))
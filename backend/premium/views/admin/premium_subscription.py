@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from premium.models import PremiumSubscription
 from premium.serializers.admin import AdminPremiumSubscriptionSerializer
 from users.permissions import IsAdminRole
@@ -8,6 +9,8 @@ class AdminListPremiumSubscriptionView(generics.ListCreateAPIView):
     queryset = PremiumSubscription.objects.select_related("user").all()
     serializer_class = AdminPremiumSubscriptionSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-subscription_id"
 
 
 class AdminManagePremiumSubscriptionView(generics.RetrieveUpdateDestroyAPIView):
@@ -40,6 +40,10 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 } #configuration for JWT tokens to work properly
 
 SIMPLE_JWT = {
@@ -67,12 +71,15 @@ INSTALLED_APPS = [
     'courses',
     'feedback',
     'premium',
+    'jobs',
     
     'drf_spectacular',
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Outermost after security so it compresses the final response body
+    "common.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -118,6 +125,59 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "prolingo",
+    }
+}
+
+# Serialized tests tree and test bundle entries are keyed by content version, so the timeout only bounds memory use
+TESTS_TREE_CACHE_TIMEOUT = 60 * 60 * 24
+TEST_BUNDLE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Number of per-test answer keys kept in each worker process for grading
+ANSWER_KEY_CACHE_SIZE = 512
+
+# Text search configuration for course content; "simple" avoids English stemming on multilingual material
+SEARCH_TEXT_CONFIG = "simple"
+
+# List endpoints using common.pagination.KeysetCursorPagination return plain lists unless the request
+# sends ?cursor= or ?page_size=; turn off once every client reads the {"next", "previous", "results"} envelope
+PAGINATION_LEGACY_UNPAGINATED = True
+
+# JSON encoding backend for common.renderers.FastJSONRenderer: "orjson" (stdlib fallback when not installed) or "stdlib"
+JSON_RENDERER_BACKEND = "orjson"
+
+# Response compression (common.middleware.CompressionMiddleware); "br" needs the brotli package
+RESPONSE_COMPRESSION_ENCODINGS = ("br", "gzip")
+RESPONSE_COMPRESSION_MIN_SIZE = 1024
+RESPONSE_COMPRESSION_BROTLI_QUALITY = 5
+
+# Hot list endpoints opting into common.values_serializer build responses from values() rows; False restores the DRF serializers
+VALUES_SERIALIZERS_ENABLED = True
+
+# Leaderboard rank/top-N lookups (gameinfo.services.leaderboard_index): DatabaseLeaderboardIndex queries every time and
+# is consistent across workers. LocalLeaderboardIndex keeps a sorted copy per process, rebuilt from the database once
+# older than LEADERBOARD_INDEX_MAX_AGE, so other workers' writes show up late; keep it off until a shared backend exists
+LEADERBOARD_INDEX_BACKEND = "gameinfo.services.leaderboard_index.DatabaseLeaderboardIndex"
+LEADERBOARD_INDEX_MAX_AGE = timedelta(seconds=60)
+# Client leaderboards only read LeaderboardSnapshot rows: run `python manage.py refresh_leaderboard_snapshots` from cron
+# (e.g. every 5 minutes) to re-rank them and prune old XpEvent rows
+
+
+# Background jobs (processed by `python manage.py run_jobs`)
+# Inline mode runs each job in the web process right after its transaction commits, so no worker is needed in development
+JOBS_RUN_INLINE = DEBUG
+JOBS_RETRY_BASE_DELAY = timedelta(seconds=30)
+# Running jobs not finished within this window are assumed orphaned by a dead worker and retried
+JOBS_STALE_AFTER = timedelta(minutes=10)
+JOBS_RETENTION = timedelta(days=7)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from streaks.models import DailyStreak
 from streaks.serializers.admin.daily_streaks import AdminDailyStreakSerializer
 from users.permissions import IsAdminRole
@@ -7,6 +8,8 @@ class AdminListDailyStreaksView(generics.ListCreateAPIView):
     queryset = DailyStreak.objects.select_related("user").all()
     serializer_class = AdminDailyStreakSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-daily_streak_id"
 
 class AdminManageDailyStreakView(generics.RetrieveDestroyAPIView):
     queryset = DailyStreak.objects.select_related("user").all()
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions, status
+from common.pagination import KeysetCursorPagination
 from rest_framework.response import Response
 from streaks.models import DailyStreak
 from streaks.serializers.client.daily_streaks import ClientDailyStreakSerializer
@@ -11,6 +12,8 @@ from streaks.utils import compute_current_streak
 class ClientMyDailyStreaksView(generics.ListAPIView):
     serializer_class = ClientDailyStreakSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-daily_streak_date"
 
     def get_queryset(self):
         return (
@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions
+from common.pagination import KeysetCursorPagination
 from users.models import User
 from users.serializers import UserSerializer
 from users.permissions import IsAdminRole
@@ -8,6 +9,8 @@ class AdminListUsersView(generics.ListCreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminRole]
+    pagination_class = KeysetCursorPagination
+    cursor_ordering = "-id"
 
 
 class AdminManageUserView(generics.RetrieveUpdateDestroyAPIView):